@@ -7,9 +7,10 @@ Professional launcher with port management and enhanced monitoring
 Includes frontend status validation and automatic port cleanup
 
 Version: 2.1 - Enhanced & Port-Managed
-Features: Backend-first startup, Frontend status monitoring, Port cleanup
+Features: Parallel startup (service graph), Frontend status monitoring, Port cleanup
 """
 
+import argparse
 import subprocess
 import os
 import sys
@@ -22,6 +23,13 @@ from pathlib import Path
 from datetime import datetime
 from threading import Thread, Event
 
+# Hilfsmodule aus scripts/: Port-Inspektion über /proc (ohne lsof), Readiness-Erkennung
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+from port_inspect import PORT_INSPECT_AVAILABLE, PortInspector
+from readiness import ReadinessWatcher, format_result
+from service_graph import Service, ServiceGraph, format_timeline
+from backend_supervisor import BackendSupervisor
+
 
 class PortManager:
     """Windows-kompatibles Port-Management"""
@@ -29,6 +37,7 @@ class PortManager:
     def __init__(self):
         self.is_windows = platform.system() == 'Windows'
         self.common_ports = [3000, 3001, 5000, 8000]
+        self.inspector = PortInspector() if PORT_INSPECT_AVAILABLE and not self.is_windows else None
     
     def clear_port(self, port):
         """Räume spezifischen Port auf"""
@@ -77,6 +86,8 @@ class PortManager:
     
     def _clear_port_unix(self, port):
         """Unix/Linux/Mac Port Cleanup"""
+        if self.inspector:
+            return self._clear_port_proc(port)
         try:
             result = subprocess.run(
                 ['lsof', '-ti', f':{port}'],
@@ -99,11 +110,49 @@ class PortManager:
             print(f"  Error clearing port {port}: {e}")
             return False
     
+    def _clear_port_proc(self, port, owners=None):
+        """Linux Port Cleanup über /proc/net/tcp (kein lsof)"""
+        try:
+            if owners is None:
+                # complete: auch über fork geerbte Sockets (npm → node) finden
+                owners = self.inspector.owners([port], complete=True)[port]
+            pids = {owner.pid: owner.name for owner in owners if owner.pid}
+            if os.getpid() in pids:
+                print(f"  Port {port} is held by this launcher - not killing ourselves")
+                del pids[os.getpid()]
+                if not pids:
+                    return False
+            if not pids:
+                if owners:
+                    print(f"  Port {port} is held by a process we cannot see (other user?)")
+                    return False
+                print(f"  Port {port} is already free")
+                return True
+            for pid, name in sorted(pids.items()):
+                print(f"  Found process PID {pid} ({name}) on port {port}")
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                    print(f"  Process {pid} terminated")
+                except ProcessLookupError:
+                    pass
+            return True
+        except Exception as e:
+            print(f"  Error clearing port {port}: {e}")
+            return False
+    
     def clear_development_ports(self):
         """Räume alle Development-Ports auf"""
         print("🧹 CLEARING DEVELOPMENT PORTS")
         print("-" * 40)
         
+        if self.inspector:
+            # Alle Ports in einem Durchgang nachschlagen
+            for port, owners in self.inspector.owners(self.common_ports, complete=True).items():
+                print(f"🔧 Clearing port {port}...")
+                self._clear_port_proc(port, owners)
+            print("Port cleanup completed")
+            return
+        
         for port in self.common_ports:
             self.clear_port(port)
         
@@ -186,7 +235,7 @@ class FrontendStatusMonitor:
 class RetroRetroLauncher:
     """Enhanced launcher with port management and status monitoring"""
     
-    def __init__(self):
+    def __init__(self, supervise=False, standby=True):
         self.project_root = Path(__file__).parent
         self.backend_port = 3001
         self.frontend_port = 3000
@@ -195,6 +244,15 @@ class RetroRetroLauncher:
         self.backend_process = None
         self.frontend_process = None
         self.running = False
+        # Shell nur unter Windows (npm.cmd); unter POSIX würde shell=True mit Liste nur 'node' starten
+        self.use_shell = platform.system() == 'Windows'
+        # Service-Name → ReadinessResult (time-to-ready)
+        self.readiness = {}
+        self.startup_timeline = None
+        # Supervisor-Modus: automatischer Neustart (optional mit Warm-Standby)
+        self.supervise = supervise
+        self.standby = standby
+        self.supervisor = None
         
         # Neue Komponenten
         self.port_manager = PortManager()
@@ -217,7 +275,7 @@ class RetroRetroLauncher:
         print(f"📁 Project Root: {self.project_root}")
         print(f"🎯 Backend Port: {self.backend_port}")
         print(f"🎯 Frontend Port: {self.frontend_port}")
-        print("🔧 Features: Port cleanup, Backend-first startup, Frontend monitoring")
+        print("🔧 Features: Port cleanup, Parallel startup, Frontend monitoring")
         print("-" * 80)
     
     def check_prerequisites(self):
@@ -258,6 +316,44 @@ class RetroRetroLauncher:
         
         print("Pre-start port cleanup completed")
     
+    def _backend_env_port(self, key, default):
+        """Port aus backend/.env (dort konfiguriert das Backend Redis/Postgres)"""
+        if key in os.environ:
+            return int(os.environ[key])
+        env_file = self.project_root / "backend" / ".env"
+        try:
+            for line in env_file.read_text(encoding='utf-8').splitlines():
+                if line.startswith(f"{key}="):
+                    return int(line.split('=', 1)[1].strip())
+        except (OSError, ValueError):
+            pass
+        return default
+    
+    def wait_for_external(self, name, port, timeout=1.0):
+        """Externe Dienste (Redis/Postgres) werden nicht gestartet, nur auf Erreichbarkeit geprüft"""
+        result = ReadinessWatcher(name, port).wait(timeout=timeout)
+        self.readiness[name.lower()] = result
+        if not result.ready:
+            print(f"⚠️ {name} not reachable on port {port} - backend falls back to basic mode")
+        return result.ready
+    
+    def build_service_graph(self):
+        """Start-DAG: nur harte Abhängigkeiten (requires) blockieren
+        
+        Backend und Frontend starten gleichzeitig - react-scripts kompiliert ohne Backend.
+        Redis/Postgres sind für das Backend optional (Basic-Mode), daher nur 'wants'.
+        """
+        graph = ServiceGraph()
+        redis_port = self._backend_env_port('REDIS_PORT', 6379)
+        postgres_port = self._backend_env_port('DB_PORT', 5432)
+        graph.add(Service("redis", lambda: self.wait_for_external("Redis", redis_port), optional=True))
+        graph.add(Service("postgres", lambda: self.wait_for_external("Postgres", postgres_port), optional=True))
+        start_backend = self.start_supervised_backend if self.supervise else self.start_backend
+        graph.add(Service("backend", start_backend, wants=["redis", "postgres"]))
+        graph.add(Service("frontend", self.start_frontend, wants=["backend"], optional=True))
+        graph.add(Service("health_checks", self.run_health_checks, requires=["backend"], optional=True))
+        return graph
+    
     def start_backend(self):
         """Start backend with visible console output"""
         print(f"🚀 Starting Backend on Port {self.backend_port}...")
@@ -273,36 +369,41 @@ class RetroRetroLauncher:
                 # Fallback: server.js im Root
                 backend_path = self.project_root
             
-            # Starte Backend mit sichtbarer Konsole
+            # Starte Backend - Ausgabe läuft über die Readiness-Pipe weiter in die Konsole
+            started_at = time.monotonic()
             self.backend_process = subprocess.Popen(
                 ['node', 'server.js'],
                 cwd=backend_path,
                 env=env,
-                # Backend-Ausgabe bleibt sichtbar (kein capture_output)
-                shell=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                shell=self.use_shell
             )
             
             print(f"Backend process started (PID: {self.backend_process.pid})")
             print("Backend console output is visible in this window")
             
-            # Warte auf Backend-Startup
+            # Warte auf Backend-Startup: "running on port"-Zeile, LISTEN-Socket, /health
             print("⏳ Waiting for backend to be ready...")
-            for i in range(30):
-                try:
-                    response = requests.get(f"{self.backend_url}/health", timeout=3)
-                    if response.status_code == 200:
-                        print(f"Backend is ready on port {self.backend_port}!")
-                        return True
-                except requests.exceptions.ConnectionError:
-                    pass
-                except Exception as e:
-                    if i > 25:
-                        print(f"Backend check issue: {e}")
-                
-                if i % 5 == 0:
-                    print(f"   Still starting... ({i}/30s)")
-                    
-                time.sleep(1)
+            watcher = ReadinessWatcher(
+                "Backend", self.backend_port,
+                url=f"{self.backend_url}/health",
+                process=self.backend_process,
+                ready_pattern=r"running on port",
+                started_at=started_at
+            )
+            watcher.watch_stream(self.backend_process.stdout, echo=print)
+            result = watcher.wait(timeout=30)
+            self.readiness["backend"] = result
+            
+            if result.ready:
+                print(f"Backend is ready on port {self.backend_port}! ({format_result(result)})")
+                return True
+            if self.backend_process.poll() is not None:
+                print(f"Backend process exited: {result.error}")
+                return False
                 
             print("Backend startup timeout - but continuing...")
             return True  # Continue even if health check fails
@@ -311,6 +412,23 @@ class RetroRetroLauncher:
             print(f"Backend startup error: {e}")
             return False
     
+    def start_supervised_backend(self):
+        """Backend unter dem Supervisor starten (Neustart mit Backoff, Crash-Loop-Erkennung)"""
+        print(f"🚀 Starting supervised Backend on Port {self.backend_port}...")
+        backend_path = self.project_root / "backend"
+        if not backend_path.exists():
+            backend_path = self.project_root
+        
+        self.supervisor = BackendSupervisor(backend_path, port=self.backend_port, standby=self.standby)
+        ready = self.supervisor.start()
+        self.readiness["backend"] = self.supervisor.readiness
+        if not ready:
+            return False
+        
+        print(f"Backend is ready on port {self.backend_port}! ({format_result(self.supervisor.readiness)})")
+        self.supervisor.start_monitoring()
+        return True
+    
     def start_frontend(self):
         """Start frontend in separate process"""
         print("🚀 Starting Frontend...")
@@ -323,32 +441,36 @@ class RetroRetroLauncher:
             env['BROWSER'] = 'none'
             
             # Starte Frontend in separatem Prozess
+            started_at = time.monotonic()
             self.frontend_process = subprocess.Popen(
                 ['npm', 'start'],
                 cwd=frontend_path,
                 env=env,
-                shell=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                shell=self.use_shell
             )
             
             print(f"Frontend process started (PID: {self.frontend_process.pid})")
             
-            # Warte auf Frontend-Compilation
+            # Warte auf Frontend-Compilation (react-scripts meldet "Compiled ..." / "You can now view")
             print("⏳ Waiting for frontend compilation...")
-            for i in range(60):  # 1 minute for initial compilation
-                try:
-                    response = requests.get(self.frontend_url, timeout=3)
-                    if response.status_code == 200:
-                        print("Frontend compilation completed!")
-                        return True
-                except requests.exceptions.ConnectionError:
-                    pass
-                except Exception:
-                    pass
-                
-                if i % 10 == 0 and i > 0:
-                    print(f"   Still compiling... ({i}/60s)")
-                    
-                time.sleep(1)
+            watcher = ReadinessWatcher(
+                "Frontend", self.frontend_port,
+                url=self.frontend_url,
+                process=self.frontend_process,
+                ready_pattern=r"Compiled|compiled|You can now view",
+                started_at=started_at
+            )
+            watcher.watch_stream(self.frontend_process.stdout, echo=lambda line: print(f"[frontend] {line}"))
+            result = watcher.wait(timeout=60)  # 1 minute for initial compilation
+            self.readiness["frontend"] = result
+            
+            if result.ready:
+                print(f"Frontend compilation completed! ({format_result(result)})")
+                return True
             
             # Continue anyway - React dev server can be slow
             print("Frontend taking longer to compile, but continuing...")
@@ -447,7 +569,10 @@ class RetroRetroLauncher:
             # Alert bei kritischen Problemen
             if consecutive_failures >= max_failures:
                 print(f"\n🚨 [{datetime.now().strftime('%H:%M:%S')}] CRITICAL: Multiple health check failures!")
-                print("💡 Consider manual restart if issues persist")
+                if self.supervisor:
+                    print(f"🛡️ Supervisor is handling restarts ({self.supervisor.summary()})")
+                else:
+                    print("💡 Consider manual restart if issues persist (or run with --supervise)")
                 consecutive_failures = 0
     
     def cleanup_with_ports(self):
@@ -460,6 +585,11 @@ class RetroRetroLauncher:
             self.frontend_monitor.stop_monitoring()
         
         # Stoppe Prozesse
+        if self.supervisor:
+            print("Stopping supervised backend...")
+            self.supervisor.stop()
+            print(f"Backend stopped - supervisor: {self.supervisor.summary()}")
+        
         if self.backend_process:
             try:
                 print("Stopping backend server...")
@@ -517,25 +647,22 @@ class RetroRetroLauncher:
             print("Prerequisites failed - cannot start")
             return False
         
-        # Step 2: Start Backend FIRST (with visible output)
-        if not self.start_backend():
+        # Step 2-4: Redis/Postgres-Check, Backend, Frontend und Health Checks parallel
+        # entlang des Abhängigkeitsgraphen
+        graph = self.build_service_graph()
+        timings = graph.run()
+        self.startup_timeline = format_timeline(timings)
+        print("\n⏱️  STARTUP TIMELINE")
+        print(self.startup_timeline)
+        
+        if not timings["backend"].ok:
             print("Backend startup failed - cannot continue")
+            self.cleanup_with_ports()
             return False
-        
-        # Step 3: Start Frontend (only after backend is ready)
-        print("\n" + "-" * 60)
-        print("🎯 Backend is running - now starting frontend...")
-        print("-" * 60)
-        
-        if not self.start_frontend():
+        if not timings["frontend"].ok:
             print("Frontend startup issues, but continuing...")
         
-        # Step 4: Health Checks
-        time.sleep(3)
-        system_healthy = self.run_health_checks()
-        
         # Step 5: Open Browser and Start Monitoring
-        time.sleep(2)
         self.open_browser_and_check_status()
         
         # Step 6: Show Status Dashboard
@@ -561,12 +688,20 @@ class RetroRetroLauncher:
         print(f"📊 Backend Status: {self.backend_url}/api/status")
         print(f"🎮 Games API: {self.backend_url}/api/games")
         print(f"🗄️  Database Health: {self.backend_url}/health-db")
+        if self.readiness:
+            print("-" * 80)
+            print("⏱️  TIME TO READY:")
+            for result in self.readiness.values():
+                print(f"  • {format_result(result)}")
         print("-" * 80)
         print("🎯 MONITORING ACTIVE:")
         print("  • Backend console output visible below")
         print("  • Frontend online status monitoring every 10s")
         print("  • System health checks every 30s")
         print("  • Automatic port cleanup on shutdown")
+        if self.supervisor:
+            mode = "warm standby" if self.standby else "cold restart"
+            print(f"  • Backend supervisor: auto-restart with backoff ({mode})")
         print("-" * 80)
         print("💡 Ready for TAG 4: Frontend-Backend Integration testing!")
         print("💡 Check if frontend shows GREEN online status indicator")
@@ -576,7 +711,14 @@ class RetroRetroLauncher:
 
 def main():
     """Enhanced entry point"""
-    launcher = RetroRetroLauncher()
+    parser = argparse.ArgumentParser(description='RetroRetro unified launcher')
+    parser.add_argument('--supervise', action='store_true',
+                       help='Restart the backend automatically (backoff, crash-loop detection, history)')
+    parser.add_argument('--no-standby', action='store_true',
+                       help='With --supervise: cold restarts only, no warm standby behind a proxy')
+    args = parser.parse_args()
+    
+    launcher = RetroRetroLauncher(supervise=args.supervise, standby=not args.no_standby)
     
     try:
         success = launcher.run()
@@ -12,10 +12,14 @@ import os
 import sys
 import time
 import signal
+import platform
 import requests
 from pathlib import Path
 from datetime import datetime
 
+from log_pump import LogPump
+from process_sampler import ProcessSampler, format_tree
+
 
 class BackendOnlyTester:
     """Testet nur das Backend isoliert"""
@@ -27,6 +31,12 @@ class BackendOnlyTester:
         self.backend_url = f"http://localhost:{self.backend_port}"
         self.backend_process = None
         self.running = False
+        # Ressourcen des Backend-Baums (Shell + node) aus /proc
+        self.process_sampler = ProcessSampler()
+        # Backend-Ausgabe: Ring-Puffer + rotierende Datei, Fehler sofort melden
+        self.log_pump = LogPump("backend", log_path=self.scripts_root / "logs" / "backend_only.log")
+        self.log_pump.on_event("error", lambda line, match: print(f"   ❌ [backend] {line.text}"))
+        self.log_pump.on_event("socketio_warning", lambda line, match: print(f"   ⚠️ [backend] {line.text}"))
         
     def print_banner(self):
         """Banner"""
@@ -53,9 +63,11 @@ class BackendOnlyTester:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                shell=True,
+                shell=platform.system() == 'Windows',
                 env=env
             )
+            self.process_sampler.watch("backend", self.backend_process.pid)
+            self.log_pump.attach_process(self.backend_process)
             
             # Auf Start warten
             print("⏳ Warte auf Backend-Start...")
@@ -124,6 +136,9 @@ class BackendOnlyTester:
                     print(f"✅ Check #{check_count} OK ({current_time.strftime('%H:%M:%S')}) - Laufzeit: {runtime}")
                 else:
                     print(f"⚠️ Check #{check_count} HTTP {response.status_code} - Laufzeit: {runtime}")
+                # RSS/FD-Wachstum zwischen den Checks zeigt Leaks vor dem Absturz
+                for tree in self.process_sampler.sample().values():
+                    print(f"   📊 {format_tree(tree)}")
                     
                 # Zusätzliche Tests alle 5 Checks
                 if check_count % 5 == 0:
@@ -133,6 +148,9 @@ class BackendOnlyTester:
                 print(f"❌ Check #{check_count} CONNECTION REFUSED - Backend ist tot!")
                 print(f"💀 Backend starb nach {runtime} Laufzeit")
                 print("🚨 BACKEND-TOD ERKANNT!")
+                print("📋 Letzte Backend-Ausgabe:")
+                for text in self.log_pump.tail(15):
+                    print(f"   | {text}")
                 break
             except requests.exceptions.Timeout:
                 print(f"⚠️ Check #{check_count} TIMEOUT - Backend hängt?")
@@ -150,11 +168,14 @@ class BackendOnlyTester:
             else:
                 exit_code = self.backend_process.poll()
                 print(f"❌ Backend-Prozess tot (Exit-Code: {exit_code})")
-                try:
-                    stdout, _ = self.backend_process.communicate(timeout=2)
-                    print(f"📋 Prozess-Output: {stdout[-500:]}")
-                except:
-                    pass
+                # Ausgabe liegt schon im Ring-Puffer - kein communicate() nötig
+                self.log_pump.close()
+                print(f"📋 Prozess-Output: {self.log_pump.text()[-500:]}")
+                errors = self.log_pump.matching("error", 5)
+                if errors:
+                    print(f"📋 Letzte Fehler ({self.log_pump.counts['error']} gesamt):")
+                    for text in errors:
+                        print(f"   | {text}")
                 return False
         return False
     
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Backend Supervisor
+==================
+Hält 'node server.js' am Leben: automatischer Neustart mit exponentiellem
+Backoff, Crash-Loop-Erkennung und strukturierter Restart-Historie.
+
+Warm-Restart: Der öffentliche Port (3001) gehört einem kleinen TCP-Proxy. Dahinter
+laufen zwei Backends auf alternativen Ports - ein aktives und ein vorgestartetes
+Standby. Stirbt das aktive (Exit oder wiederholt fehlgeschlagene Health-Checks),
+schaltet der Proxy sofort auf das Standby um; ein neues Standby wird nach dem
+Backoff im Hintergrund gestartet. Ohne Standby (--no-standby) läuft das Backend
+direkt auf dem Port und wird nach dem Backoff kalt neu gestartet.
+
+Jeder Tod landet als JSON-Zeile in der Historie: Exit-Code, Grund, Uptime,
+Backoff, Umschaltzeit und die letzten N Zeilen der Ausgabe.
+
+Usage:
+    python backend_supervisor.py
+    python backend_supervisor.py --port 3001 --no-standby --history restarts.jsonl
+"""
+
+import argparse
+import json
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, List, Optional
+
+from readiness import ReadinessWatcher, format_result, http_probe
+
+DEFAULT_HISTORY = Path(__file__).parent.parent / "docs" / "testing" / "backend_restarts.jsonl"
+
+
+@dataclass
+class RestartRecord:
+    """Ein Eintrag der Restart-Historie"""
+    timestamp: str
+    pid: int
+    port: int
+    reason: str                         # exit | unhealthy | standby-exit
+    exit_code: Optional[int]
+    uptime_seconds: float
+    crash_loop: bool
+    backoff_seconds: float
+    recovery: str                       # standby | cold | none
+    downtime_ms: Optional[float] = None
+    tail: List[str] = field(default_factory=list)
+
+
+class ManagedBackend:
+    """Ein gestarteter node-Prozess samt Ausgabe-Puffer"""
+
+    def __init__(self, process: subprocess.Popen, port: int, tail_lines: int):
+        self.process = process
+        self.port = port
+        self.started_at = time.monotonic()
+        self.tail: Deque[str] = deque(maxlen=tail_lines)
+        self.ready = False
+        self.exited = threading.Event()
+        self.watcher: Optional[ReadinessWatcher] = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def uptime(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class PortProxy:
+    """Minimaler TCP-Proxy; target_port lässt sich zur Laufzeit umschalten"""
+
+    def __init__(self, listen_port: int, target_port: int):
+        self.listen_port = listen_port
+        self.target_port = target_port
+        self._server: Optional[socket.socket] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("", self.listen_port))
+        server.listen(128)
+        self._server = server
+        self._stop.clear()
+        threading.Thread(target=self._accept_loop, name="proxy-accept", daemon=True).start()
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client: socket.socket):
+        # Während einer Umschaltung ist das alte Ziel schon weg - kurz auf das neue warten
+        upstream = None
+        for _ in range(50):
+            try:
+                upstream = socket.create_connection(("127.0.0.1", self.target_port), timeout=5)
+                break
+            except OSError:
+                if self._stop.wait(0.02):
+                    break
+        if upstream is None:
+            client.close()
+            return
+        upstream.settimeout(None)
+        for sock in (client, upstream):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def pipe(src: socket.socket, dst: socket.socket):
+            try:
+                while True:
+                    data = src.recv(65536)
+                    if not data:
+                        break
+                    dst.sendall(data)
+            except OSError:
+                pass
+            finally:
+                # Halb-Schließen weiterreichen, damit die Gegenrichtung sauber endet
+                try:
+                    dst.shutdown(socket.SHUT_WR)
+                except OSError:
+                    pass
+
+        back = threading.Thread(target=pipe, args=(upstream, client), daemon=True)
+        back.start()
+        pipe(client, upstream)
+        back.join()
+        client.close()
+        upstream.close()
+
+    def stop(self):
+        self._stop.set()
+        if self._server:
+            # shutdown() weckt das blockierende accept(), erst dann wird der Port frei
+            try:
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server.close()
+            self._server = None
+
+
+class BackendSupervisor:
+    """Startet das Backend, überwacht es und startet es bei Bedarf neu"""
+
+    def __init__(self, backend_dir: Path, port: int = 3001, standby: bool = True,
+                 history_path: Path = DEFAULT_HISTORY, tail_lines: int = 50,
+                 backoff_initial: float = 1.0, backoff_max: float = 60.0,
+                 stable_after: float = 30.0, crash_window: float = 120.0, crash_limit: int = 5,
+                 health_interval: float = 2.0, failure_threshold: int = 3,
+                 ready_timeout: float = 30.0, echo: Optional[Callable[[str], None]] = print):
+        self.backend_dir = Path(backend_dir)
+        self.port = port
+        self.standby_enabled = standby
+        # Mit Standby gehört der öffentliche Port dem Proxy, die Backends laufen auf +100/+101
+        self.backend_ports = [port + 100, port + 101] if standby else [port]
+        self.history_path = Path(history_path) if history_path else None
+        self.tail_lines = tail_lines
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.crash_window = crash_window
+        self.crash_limit = crash_limit
+        self.health_interval = health_interval
+        self.failure_threshold = failure_threshold
+        self.ready_timeout = ready_timeout
+        self.echo = echo
+        self.use_shell = platform.system() == 'Windows'
+
+        self.active: Optional[ManagedBackend] = None
+        self.standby: Optional[ManagedBackend] = None
+        self.proxy: Optional[PortProxy] = None
+        self.history: List[RestartRecord] = []
+        self.readiness = None                   # ReadinessResult des ersten Starts
+        self._deaths: Deque[float] = deque()
+        self._early_deaths = 0
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._standby_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    # --- Prozesse ---
+
+    def spawn(self, port: int) -> ManagedBackend:
+        """node server.js auf port starten; Ausgabe wird gepuffert und weitergegeben"""
+        env = os.environ.copy()
+        env['PORT'] = str(port)
+        process = subprocess.Popen(
+            ['node', 'server.js'],
+            cwd=self.backend_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            shell=self.use_shell
+        )
+        backend = ManagedBackend(process, port, self.tail_lines)
+
+        def on_exit():
+            process.wait()
+            backend.exited.set()
+            self._wake.set()
+
+        threading.Thread(target=on_exit, name=f"backend-{port}-exit", daemon=True).start()
+        return backend
+
+    def _wait_ready(self, backend: ManagedBackend, label: str):
+        """Auf Bereitschaft warten; Ausgabe mit Port-Präfix durchreichen"""
+        watcher = ReadinessWatcher(f"Backend:{backend.port}", backend.port,
+                                   url=f"http://127.0.0.1:{backend.port}/health",
+                                   process=backend.process, ready_pattern=r"running on port",
+                                   started_at=backend.started_at)
+
+        def output(line: str):
+            backend.tail.append(line)
+            if self.echo:
+                self.echo(f"[{label}:{backend.port}] {line}")
+
+        watcher.watch_stream(backend.process.stdout, echo=output)
+        backend.watcher = watcher
+        result = watcher.wait(self.ready_timeout)
+        backend.ready = result.ready
+        return result
+
+    @staticmethod
+    def _terminate(backend: Optional[ManagedBackend], timeout: float = 5.0):
+        if backend is None or backend.process.poll() is not None:
+            return
+        backend.process.terminate()
+        try:
+            backend.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            backend.process.kill()
+
+    def _free_port(self) -> int:
+        used = {b.port for b in (self.active, self.standby) if b is not None}
+        return next(port for port in self.backend_ports if port not in used)
+
+    # --- Backoff / Crash-Loop ---
+
+    def _register_death(self, backend: ManagedBackend) -> bool:
+        """Tod vermerken; True wenn ein Crash-Loop vorliegt"""
+        now = time.monotonic()
+        self._deaths.append(now)
+        while self._deaths and now - self._deaths[0] > self.crash_window:
+            self._deaths.popleft()
+        if backend.uptime() >= self.stable_after:
+            self._early_deaths = 0
+        else:
+            self._early_deaths += 1
+        return len(self._deaths) >= self.crash_limit
+
+    def backoff(self, crash_loop: bool) -> float:
+        """Wartezeit vor dem nächsten Start: initial * 2^(frühe Tode - 1), im Crash-Loop das Maximum"""
+        if crash_loop:
+            return self.backoff_max
+        if self._early_deaths == 0:
+            return 0.0
+        return min(self.backoff_initial * 2 ** (self._early_deaths - 1), self.backoff_max)
+
+    def _record(self, record: RestartRecord):
+        self.history.append(record)
+        if self.history_path:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+
+    # --- Start / Standby ---
+
+    def start(self) -> bool:
+        """Aktives Backend (und ggf. Proxy + Standby) starten; True sobald es bereit ist"""
+        self.active = self.spawn(self.backend_ports[0])
+        self.readiness = self._wait_ready(self.active, "backend")
+        if not self.readiness.ready:
+            print(f"❌ Supervisor: backend not ready ({self.readiness.error})")
+            return False
+        if self.standby_enabled:
+            self.proxy = PortProxy(self.port, self.active.port)
+            self.proxy.start()
+            print(f"🔀 Supervisor: port {self.port} → backend on {self.active.port}")
+            self._schedule_standby(0.0)
+        return True
+
+    def _schedule_standby(self, delay: float):
+        if not self.standby_enabled or self._stop_event.is_set():
+            return
+        self._standby_timer = threading.Timer(delay, self._spawn_standby)
+        self._standby_timer.daemon = True
+        self._standby_timer.start()
+
+    def _spawn_standby(self):
+        with self._lock:
+            if self.standby is not None or self._stop_event.is_set():
+                return
+            standby = self.spawn(self._free_port())
+            self.standby = standby
+        result = self._wait_ready(standby, "standby")
+        if result.ready:
+            print(f"🟦 Supervisor: standby ready on port {standby.port} ({format_result(result)})")
+
+    # --- Überwachung ---
+
+    def _handle_death(self, backend: ManagedBackend, reason: str):
+        uptime = backend.uptime()
+        detected_at = time.monotonic()
+        if backend.watcher:
+            backend.watcher.wait_eof()
+        crash_loop = self._register_death(backend)
+        delay = self.backoff(crash_loop)
+        exit_code = backend.process.poll()
+        print(f"💀 Supervisor: backend PID {backend.pid} on port {backend.port} died "
+              f"({reason}, exit code {exit_code}) after {uptime:.1f}s")
+        if crash_loop:
+            print(f"🚨 Supervisor: CRASH LOOP - {len(self._deaths)} deaths in {self.crash_window:.0f}s, "
+                  f"backing off {delay:.0f}s")
+
+        record = RestartRecord(
+            timestamp=datetime.now().isoformat(),
+            pid=backend.pid,
+            port=backend.port,
+            reason=reason,
+            exit_code=exit_code,
+            uptime_seconds=round(uptime, 2),
+            crash_loop=crash_loop,
+            backoff_seconds=delay,
+            recovery="none",
+            tail=list(backend.tail),
+        )
+
+        with self._lock:
+            standby, self.standby = self.standby, None
+            if standby is not None and standby.ready and standby.process.poll() is None:
+                # Warm: Proxy sofort auf das vorgestartete Standby umschalten
+                self.proxy.target_port = standby.port
+                self.active = standby
+                record.recovery = "standby"
+                record.downtime_ms = round((time.monotonic() - detected_at) * 1000, 2)
+            else:
+                # Standby noch nicht bereit - verwerfen, kalt neu starten
+                self.active = None
+        if record.recovery == "standby":
+            print(f"🔀 Supervisor: switched port {self.port} → standby on {self.active.port} "
+                  f"in {record.downtime_ms:.1f}ms")
+            self._record(record)
+            self._schedule_standby(delay)
+            return
+        self._terminate(standby)
+
+        # Kalt: nach dem Backoff neu starten
+        if delay:
+            print(f"⏳ Supervisor: restarting in {delay:.1f}s")
+        if self._stop_event.wait(delay):
+            self._record(record)
+            return
+        with self._lock:
+            self.active = self.spawn(self._free_port())
+        result = self._wait_ready(self.active, "backend")
+        if result.ready:
+            record.recovery = "cold"
+            record.downtime_ms = round((time.monotonic() - detected_at) * 1000, 2)
+            if self.proxy:
+                self.proxy.target_port = self.active.port
+            print(f"🔁 Supervisor: backend restarted on port {self.active.port} ({format_result(result)})")
+            self._schedule_standby(0.0)
+        self._record(record)
+
+    def _monitor_loop(self):
+        failures = 0
+        while not self._stop_event.is_set():
+            self._wake.wait(self.health_interval)
+            self._wake.clear()
+            if self._stop_event.is_set():
+                break
+
+            standby = self.standby
+            if standby is not None and standby.exited.is_set():
+                with self._lock:
+                    self.standby = None
+                if standby.watcher:
+                    standby.watcher.wait_eof()
+                crash_loop = self._register_death(standby)
+                delay = self.backoff(crash_loop)
+                self._record(RestartRecord(
+                    timestamp=datetime.now().isoformat(), pid=standby.pid, port=standby.port,
+                    reason="standby-exit", exit_code=standby.process.poll(),
+                    uptime_seconds=round(standby.uptime(), 2), crash_loop=crash_loop,
+                    backoff_seconds=delay, recovery="none", tail=list(standby.tail)))
+                print(f"⚠️ Supervisor: standby on port {standby.port} exited, respawn in {delay:.1f}s")
+                self._schedule_standby(delay)
+
+            active = self.active
+            if active is None:
+                continue
+            if active.exited.is_set():
+                failures = 0
+                self._handle_death(active, "exit")
+                continue
+            if http_probe(f"http://127.0.0.1:{active.port}/health", timeout=2.0):
+                failures = 0
+                continue
+            failures += 1
+            if failures >= self.failure_threshold:
+                print(f"🟥 Supervisor: {failures} failed health checks - killing PID {active.pid}")
+                failures = 0
+                active.process.kill()
+                active.process.wait()
+                self._handle_death(active, "unhealthy")
+
+    def start_monitoring(self):
+        """Überwachung in einem Hintergrund-Thread starten"""
+        if self._thread:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._monitor_loop, name="backend-supervisor", daemon=True)
+        self._thread.start()
+        print("🛡️ Backend supervisor active "
+              f"({'warm standby' if self.standby_enabled else 'cold restart'}, history: {self.history_path})")
+
+    def stop(self):
+        """Überwachung beenden und alle Backends stoppen"""
+        self._stop_event.set()
+        self._wake.set()
+        if self._standby_timer:
+            self._standby_timer.cancel()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        if self.proxy:
+            self.proxy.stop()
+            self.proxy = None
+        for backend in (self.standby, self.active):
+            self._terminate(backend)
+        self.active = self.standby = None
+
+    def summary(self) -> str:
+        restarts = [r for r in self.history if r.reason != "standby-exit"]
+        if not restarts:
+            return "no restarts"
+        warm = sum(1 for r in restarts if r.recovery == "standby")
+        downtimes = [r.downtime_ms for r in restarts if r.downtime_ms is not None]
+        worst = f", worst downtime {max(downtimes):.0f}ms" if downtimes else ""
+        return f"{len(restarts)} restart(s), {warm} warm{worst}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep the Node backend running with warm restarts')
+    parser.add_argument('--port', type=int, default=3001, help='Public backend port (default: 3001)')
+    parser.add_argument('--backend-dir', default=str(Path(__file__).parent.parent / 'backend'),
+                       help='Directory containing server.js')
+    parser.add_argument('--no-standby', action='store_true', help='Cold restarts only, no proxy/standby')
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY), help='Restart history (JSON lines)')
+    parser.add_argument('--tail', type=int, default=50, help='Output lines kept per death (default: 50)')
+    parser.add_argument('--health-interval', type=float, default=2.0, help='Seconds between health checks')
+    args = parser.parse_args()
+
+    supervisor = BackendSupervisor(Path(args.backend_dir), port=args.port, standby=not args.no_standby,
+                                   history_path=Path(args.history), tail_lines=args.tail,
+                                   health_interval=args.health_interval)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    if not supervisor.start():
+        supervisor.stop()
+        return 1
+    supervisor.start_monitoring()
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
+        print(f"📋 Supervisor: {supervisor.summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
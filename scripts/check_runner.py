@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Check Runner
+============
+Asyncio-Ausführungs-Engine für die Checks der Test-Platform.
+
+- Unabhängige Checks laufen nebenläufig, begrenzt durch einen Semaphore
+- Abhängigkeiten (z.B. Login vor Protected Route) bilden einen DAG; eine
+  Abhängigkeit muss vorher registriert sein, Zyklen sind damit ausgeschlossen.
+  Scheitert eine Abhängigkeit, wird der abhängige Check übersprungen.
+- Jeder Check schreibt seine Ausgabe in einen eigenen Puffer. Ausgegeben wird
+  streng in Registrierungsreihenfolge, sobald alle vorherigen Checks fertig
+  sind - die Ausgabe ist damit deterministisch, egal wer zuerst fertig wird.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Check-Funktion: bekommt den Ausgabepuffer, liefert ein Ergebnis-Dict mit "status"
+CheckFunc = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class Check:
+    """Ein registrierter Check inkl. Ergebnis"""
+    name: str
+    func: CheckFunc
+    depends_on: Sequence[str] = ()
+    header: Optional[str] = None
+    timeout: float = 15.0
+    result: Optional[Dict[str, Any]] = None
+    lines: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    done: Optional[asyncio.Event] = field(default=None, repr=False)
+
+
+class CheckRunner:
+    """Führt Checks nebenläufig entlang ihrer Abhängigkeiten aus"""
+
+    def __init__(self, max_concurrency: int = 8, emit: Callable[[str], None] = print):
+        self.max_concurrency = max_concurrency
+        self.emit = emit
+        self.checks: Dict[str, Check] = {}
+        self._order: List[Check] = []
+        self._printed = 0
+        self._last_header: Optional[str] = None
+
+    def add(self, name: str, func: CheckFunc, depends_on: Sequence[str] = (),
+            header: Optional[str] = None, timeout: float = 15.0) -> Check:
+        """Check registrieren; header wird vor dem ersten Check einer Gruppe ausgegeben"""
+        if name in self.checks:
+            raise ValueError(f"Duplicate check: {name}")
+        missing = [dep for dep in depends_on if dep not in self.checks]
+        if missing:
+            raise ValueError(f"{name}: unknown dependencies {', '.join(missing)} (register them first)")
+        check = Check(name=name, func=func, depends_on=tuple(depends_on), header=header, timeout=timeout)
+        self.checks[name] = check
+        self._order.append(check)
+        return check
+
+    def _flush(self):
+        """Alle fertigen Checks am Anfang der Reihenfolge ausgeben"""
+        while self._printed < len(self._order) and self._order[self._printed].result is not None:
+            check = self._order[self._printed]
+            if check.header and check.header != self._last_header:
+                self.emit(check.header)
+                self._last_header = check.header
+            for line in check.lines:
+                self.emit(line)
+            self._printed += 1
+
+    async def _execute(self, check: Check, semaphore: asyncio.Semaphore):
+        try:
+            for dep in check.depends_on:
+                await self.checks[dep].done.wait()
+            failed = [dep for dep in check.depends_on
+                      if (self.checks[dep].result or {}).get("status") != "PASS"]
+            if failed:
+                check.result = {"status": "SKIPPED", "reason": f"{', '.join(failed)} failed"}
+                check.lines.append(f"  ⏭️ {check.name}: SKIPPED ({', '.join(failed)} failed)")
+                return
+
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    check.result = await asyncio.wait_for(check.func(check.lines), check.timeout)
+                except asyncio.TimeoutError:
+                    check.result = {"status": "FAIL", "error": f"timeout after {check.timeout:g}s"}
+                    check.lines.append(f"  ❌ {check.name}: FAIL - timeout after {check.timeout:g}s")
+                except Exception as e:
+                    check.result = {"status": "FAIL", "error": str(e)}
+                    check.lines.append(f"  ❌ {check.name}: FAIL - {e}")
+                check.duration = time.perf_counter() - started
+                if not isinstance(check.result, dict):
+                    check.result = {"status": "PASS" if check.result else "FAIL"}
+        finally:
+            if check.result is None:
+                check.result = {"status": "FAIL", "error": "cancelled"}
+            check.done.set()
+            self._flush()
+
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+        """Alle Checks ausführen; Ergebnis je Check-Name"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        for check in self._order:
+            check.done = asyncio.Event()
+        await asyncio.gather(*(self._execute(check, semaphore) for check in self._order))
+        self._flush()
+        return {check.name: check.result for check in self._order}
+
+    def durations(self) -> Dict[str, float]:
+        """Laufzeit je Check in Sekunden"""
+        return {check.name: round(check.duration, 3) for check in self._order}
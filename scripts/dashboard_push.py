@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Dashboard Push
+==============
+Server-Push für das Web-Dashboard des Gaming Platform Monitors.
+
+Statt dass jeder Browser alle 5 Sekunden den kompletten Status abfragt, sammelt
+der DashboardPublisher pro Frame nur die geänderten Felder (neue Log-Einträge,
+geänderte Session-Zahlen, neue Metrik-Samples, ...). Das Delta wird einmal
+serialisiert und an alle verbundenen Clients gebroadcastet. Einen vollständigen
+Snapshot bekommt ein Client nur beim Verbinden.
+"""
+
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple
+
+SNAPSHOT_METRICS = 10
+SNAPSHOT_LOGS = 20
+
+
+class DashboardPublisher:
+    """Berechnet Snapshots und Deltas des Monitor-Zustands"""
+
+    def __init__(self, monitor, frame_budget: float = 0.25, latency_interval: float = 1.0):
+        self.monitor = monitor
+        self.frame_budget = frame_budget
+        self.latency_interval = latency_interval
+
+        # Zuletzt gesendeter Stand
+        self._server_health = None
+        self._database_status = None
+        self._sessions: Dict[str, Tuple[int, bool]] = {}
+        self._log_seq = 0
+        self._metrics_seq = 0
+        self._latency: Optional[Dict[str, Any]] = None
+        self._latency_sent_at = 0.0
+        self._is_connected: Optional[bool] = None
+        self._process_stats = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Vollständiger Zustand (für neue Clients und /api/status)"""
+        monitor = self.monitor
+        return {
+            'server_health': asdict(monitor.server_health) if monitor.server_health else None,
+            'database_status': asdict(monitor.database_status) if monitor.database_status else None,
+            'performance_metrics': [asdict(m) for m in list(monitor.performance_metrics)[-SNAPSHOT_METRICS:]],
+            'game_sessions': {k: asdict(v) for k, v in monitor.game_sessions.items()},
+            'activity_log': [asdict(entry) for entry in list(monitor.activity_log)[-SNAPSHOT_LOGS:]],
+            'activity_log_seq': monitor.log_seq,
+            'latency': monitor.latency_summary(),
+            'processes': self._processes(),
+            'is_connected': monitor.is_connected
+        }
+
+    def _processes(self) -> Dict[str, Any]:
+        """Prozess-Samples ohne die Einzelprozesse (die bleiben im Monitor)"""
+        return {name: {k: v for k, v in asdict(tree).items() if k != 'members'}
+                for name, tree in self.monitor.process_stats.items()}
+
+    @staticmethod
+    def _tail(items, count: int):
+        """Die letzten count Elemente einer deque (count durch maxlen begrenzt)"""
+        count = min(count, len(items))
+        return list(items)[-count:] if count else []
+
+    def collect_delta(self, now: float) -> Dict[str, Any]:
+        """Alle Änderungen seit dem letzten Aufruf; leeres Dict = nichts zu senden"""
+        monitor = self.monitor
+        delta: Dict[str, Any] = {}
+
+        # Health/DB-Objekte werden bei jedem Fetch ersetzt - Identität reicht
+        if monitor.server_health is not self._server_health:
+            self._server_health = monitor.server_health
+            delta['server_health'] = asdict(monitor.server_health) if monitor.server_health else None
+        if monitor.database_status is not self._database_status:
+            self._database_status = monitor.database_status
+            delta['database_status'] = asdict(monitor.database_status) if monitor.database_status else None
+
+        sessions = {}
+        for game_id, session in monitor.game_sessions.items():
+            state = (session.player_count, session.active)
+            if self._sessions.get(game_id) != state:
+                self._sessions[game_id] = state
+                sessions[game_id] = asdict(session)
+        for game_id in set(self._sessions) - set(monitor.game_sessions):
+            del self._sessions[game_id]
+            sessions[game_id] = None
+        if sessions:
+            delta['game_sessions'] = sessions
+
+        new_logs = monitor.log_seq - self._log_seq
+        if new_logs:
+            self._log_seq = monitor.log_seq
+            delta['activity_log'] = [asdict(entry) for entry in self._tail(monitor.activity_log, new_logs)]
+            # Sequenz des letzten Eintrags - Clients verwerfen Einträge aus ihrem Snapshot
+            delta['activity_log_seq'] = monitor.log_seq
+
+        new_metrics = monitor.metrics_seq - self._metrics_seq
+        if new_metrics:
+            self._metrics_seq = monitor.metrics_seq
+            delta['performance_metrics'] = [
+                asdict(m) for m in self._tail(monitor.performance_metrics, min(new_metrics, SNAPSHOT_METRICS))
+            ]
+
+        if now - self._latency_sent_at >= self.latency_interval:
+            latency = monitor.latency_summary()
+            if latency != self._latency:
+                self._latency = latency
+                self._latency_sent_at = now
+                delta['latency'] = latency
+
+        # Pro Sample wird ein neues Dict gesetzt - Identität reicht
+        if monitor.process_stats is not self._process_stats:
+            self._process_stats = monitor.process_stats
+            delta['processes'] = self._processes()
+
+        if monitor.is_connected != self._is_connected:
+            self._is_connected = monitor.is_connected
+            delta['is_connected'] = monitor.is_connected
+
+        return delta
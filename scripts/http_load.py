@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+HTTP Load
+=========
+Open-Loop-Lastgenerator (konstante Ankunftsrate) für die Backend-API.
+
+Im Gegensatz zu einem Thread-Pool, der erst nach einer Antwort die nächste
+Anfrage schickt (closed loop), stehen hier die Sendezeitpunkte vorab fest:
+bei R Requests/s ist Anfrage i für start + i/R geplant. Die Latenz wird ab
+diesem geplanten Zeitpunkt gemessen - staut sich der Server, gehen die
+Wartezeiten in die Messung ein, statt sie zu verschweigen (Coordinated
+Omission).
+
+Die Last wird in Stufen (z.B. 50 → 5000 RPS) gefahren; pro Stufe gibt es
+Durchsatz, Fehlerquote und Perzentile, daraus wird der Knick der
+Latenzkurve abgeschätzt.
+
+Usage:
+    python http_load.py --rps 50,100,250,500,1000 --step-duration 10
+"""
+
+import argparse
+import asyncio
+import collections
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from latency_histogram import LatencyHistogram
+
+# Pfad → Gewicht; :gameId wird pro Request durch einen Spiel-Slug ersetzt
+DEFAULT_MIX = {
+    "/api/games": 4,
+    "/api/leaderboard/:gameId": 2,
+    "/api/sessions": 2,
+    "/health": 1,
+}
+DEFAULT_STEPS = (50, 100, 250, 500, 1000, 2500, 5000)
+GAME_IDS = ("snake", "memory", "pong", "tetris")
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'/api/games=4,/health=1' → {'/api/games': 4.0, '/health': 1.0}"""
+    mix = {}
+    for item in text.split(","):
+        path, _, weight = item.strip().partition("=")
+        mix[path] = float(weight or 1)
+    return mix
+
+
+def parse_steps(text: str) -> List[float]:
+    return [float(value) for value in text.split(",") if value.strip()]
+
+
+@dataclass
+class StepResult:
+    """Messwerte einer Laststufe"""
+    target_rps: float
+    duration: float = 0.0
+    sent: int = 0
+    completed: int = 0
+    errors: collections.Counter = field(default_factory=collections.Counter)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)   # ab geplantem Sendezeitpunkt
+    service: LatencyHistogram = field(default_factory=LatencyHistogram)   # ab tatsächlichem Senden
+    per_path: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: collections.defaultdict(LatencyHistogram))
+    max_dispatch_lag_ms: float = 0.0
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "target_rps": self.target_rps,
+            "achieved_rps": round(self.completed / self.duration, 1) if self.duration else 0.0,
+            "sent": self.sent,
+            "completed": self.completed,
+            "error_rate": round(self.error_count / self.sent * 100, 2) if self.sent else 0.0,
+            "errors": dict(self.errors.most_common(5)),
+            "latency_ms": self.latency.summary(),
+            "service_time_ms": self.service.summary(),
+            "per_path_p99_ms": {path: round(h.value_at_percentile(99.0), 2)
+                                for path, h in sorted(self.per_path.items())},
+            "max_dispatch_lag_ms": round(self.max_dispatch_lag_ms, 2),
+        }
+
+
+class OpenLoopLoad:
+    """Stufenweise Open-Loop-Last mit gewichtetem Endpunkt-Mix"""
+
+    def __init__(self, base_url: str, mix: Optional[Dict[str, float]] = None,
+                 timeout: float = 10.0, max_connections: int = 1000,
+                 max_in_flight: int = 20000, seed: int = 42):
+        self.base_url = base_url.rstrip("/")
+        self.mix = mix or dict(DEFAULT_MIX)
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.random = random.Random(seed)
+        self.in_flight = 0
+
+    def _pick(self) -> Tuple[str, str]:
+        """(Mix-Eintrag, konkrete URL)"""
+        template = self.random.choices(list(self.mix), weights=list(self.mix.values()))[0]
+        path = template.replace(":gameId", self.random.choice(GAME_IDS))
+        return template, f"{self.base_url}{path}"
+
+    async def _request(self, session: aiohttp.ClientSession, result: StepResult,
+                       template: str, url: str, intended: float):
+        self.in_flight += 1
+        sent = time.perf_counter()
+        try:
+            async with session.get(url) as response:
+                await response.read()
+                # 4xx zählt ebenfalls als Fehler (falscher Pfad, 401, 429 Rate-Limit) - deren
+                # schnelle Antworten würden sonst die Perzentile nach unten ziehen
+                if response.status >= 400:
+                    result.errors[f"HTTP {response.status}"] += 1
+                    return
+        except asyncio.TimeoutError:
+            result.errors["timeout"] += 1
+            return
+        except aiohttp.ClientError as e:
+            result.errors[type(e).__name__] += 1
+            return
+        finally:
+            self.in_flight -= 1
+        done = time.perf_counter()
+        result.completed += 1
+        latency_ms = (done - intended) * 1000
+        result.latency.record(latency_ms)
+        result.service.record((done - sent) * 1000)
+        result.per_path[template].record(latency_ms)
+
+    async def run_step(self, session: aiohttp.ClientSession, rps: float, duration: float) -> StepResult:
+        """Eine Stufe: rps Requests/s für duration Sekunden, dann auf Antworten warten"""
+        result = StepResult(target_rps=rps)
+        tasks = set()
+        total = int(rps * duration)
+        start = time.perf_counter()
+        index = 0
+        while index < total:
+            now = time.perf_counter()
+            # Alle fälligen Requests dieses Wakeups absenden (Timer-Auflösung ~1ms)
+            while index < total and start + index / rps <= now:
+                intended = start + index / rps
+                result.max_dispatch_lag_ms = max(result.max_dispatch_lag_ms, (now - intended) * 1000)
+                result.sent += 1
+                index += 1
+                if self.in_flight >= self.max_in_flight:
+                    # Generator selbst am Limit - zählt als Fehler, nicht als stille Lücke
+                    result.errors["client saturated"] += 1
+                    continue
+                template, url = self._pick()
+                task = asyncio.create_task(self._request(session, result, template, url, intended))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if index < total:
+                await asyncio.sleep(max(0.0, start + index / rps - time.perf_counter()))
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.timeout)
+            if pending:
+                # Nicht in das Zeitfenster der nächsten Stufe hineinlaufen lassen
+                result.errors["unfinished at step end"] += len(pending)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        result.duration = time.perf_counter() - start
+        return result
+
+    async def run(self, steps: Sequence[float], step_duration: float = 10.0,
+                  stop_error_rate: float = 50.0, progress=None) -> List[StepResult]:
+        """Alle Stufen nacheinander; Abbruch, wenn die Fehlerquote stop_error_rate übersteigt"""
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        results = []
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            for rps in steps:
+                result = await self.run_step(session, rps, step_duration)
+                results.append(result)
+                if progress:
+                    progress(result)
+                if result.sent and result.error_count / result.sent * 100 > stop_error_rate:
+                    break
+        return results
+
+
+def find_knee(results: Sequence[StepResult], latency_factor: float = 2.0,
+              throughput_ratio: float = 0.9) -> Optional[float]:
+    """Erste Stufe, ab der p99 stark steigt oder der Durchsatz nicht mehr mithält"""
+    if not results:
+        return None
+    baseline = max(results[0].latency.value_at_percentile(99.0), 1.0)
+    for result in results:
+        achieved = result.completed / result.duration if result.duration else 0.0
+        if (result.latency.value_at_percentile(99.0) > baseline * latency_factor
+                or achieved < result.target_rps * throughput_ratio):
+            return result.target_rps
+    return None
+
+
+def curve_summary(results: Sequence[StepResult]) -> Dict[str, Any]:
+    return {
+        "steps": [result.summary() for result in results],
+        "knee_rps": find_knee(results),
+    }
+
+
+def print_step(result: StepResult):
+    summary = result.summary()
+    latency = summary["latency_ms"]
+    print(f"  {summary['target_rps']:>7.0f} {summary['achieved_rps']:>9.1f} {summary['error_rate']:>6.2f}% "
+          f"{latency['p50']:>8.1f} {latency['p90']:>8.1f} {latency['p99']:>8.1f} {latency['p99.9']:>8.1f} "
+          f"{latency['max']:>9.1f}")
+
+
+def print_header():
+    print(f"  {'Target':>7} {'Achieved':>9} {'Errors':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'p99.9':>8} {'max':>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Open-loop HTTP load against the backend API')
+    parser.add_argument('--backend', default='http://localhost:3001', help='Backend URL')
+    parser.add_argument('--rps', default=','.join(str(s) for s in DEFAULT_STEPS),
+                        help='Comma-separated target RPS steps')
+    parser.add_argument('--step-duration', type=float, default=10.0, help='Seconds per step (default: 10)')
+    parser.add_argument('--mix', help='Endpoint mix as path=weight,... (default: games/leaderboard/sessions/health)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Request timeout in seconds (default: 10)')
+    parser.add_argument('--max-connections', type=int, default=1000, help='Connection pool size (default: 1000)')
+    args = parser.parse_args()
+
+    load = OpenLoopLoad(args.backend, parse_mix(args.mix) if args.mix else None,
+                        timeout=args.timeout, max_connections=args.max_connections)
+    print(f"📊 Open-loop load against {args.backend} ({args.step_duration:g}s per step)")
+    print_header()
+    try:
+        results = asyncio.run(load.run(parse_steps(args.rps), args.step_duration, progress=print_step))
+    except KeyboardInterrupt:
+        print("\n🛑 Load aborted")
+        return 1
+    knee = find_knee(results)
+    print(f"\n📈 Latency knee: {f'~{knee:g} RPS' if knee else 'not reached'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Latency Histogram
+=================
+HDR-artige, log-bucketed Latenz-Histogramme mit fester Speichergröße.
+
+- LatencyHistogram: Werte in Millisekunden, Auflösung 0.01ms, relative
+  Genauigkeit ~1.6% (64 lineare Sub-Buckets pro Zweierpotenz), max. 10 Minuten.
+  Histogramme sind mergebar (gleiche Bucket-Grenzen), z.B. über Zeitfenster
+  oder über mehrere Worker-Prozesse hinweg.
+- LatencyTracker: Sliding Windows (1m / 5m / 1h) aus Ringpuffern von
+  Slot-Histogrammen, damit alte Samples ohne Neuberechnung herausfallen.
+"""
+
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+UNITS_PER_MS = 100          # Auflösung 0.01ms
+SUB_BUCKET_BITS = 7         # 128 Sub-Buckets, obere Hälfte je Zweierpotenz genutzt
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+MAX_TRACKABLE_MS = 600_000  # 10 Minuten - alles darüber wird geklemmt
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _bucket_index(units: int) -> int:
+    """Wert (in Units) → Bucket-Index"""
+    if units < SUB_BUCKET_COUNT:
+        return units
+    shift = units.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (units >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """Bucket-Index → obere Grenze des Buckets (in Units)"""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    sub = index - shift * SUB_BUCKET_HALF
+    return ((sub + 1) << shift) - 1
+
+
+BUCKET_COUNT = _bucket_index(MAX_TRACKABLE_MS * UNITS_PER_MS) + 1
+
+
+class LatencyHistogram:
+    """Mergebares Latenz-Histogramm mit fester Bucket-Anzahl"""
+
+    __slots__ = ("counts", "total_count", "min_ms", "max_ms", "sum_ms")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.total_count = 0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.sum_ms = 0.0
+
+    def record(self, value_ms: float, count: int = 1):
+        """Latenz in Millisekunden aufnehmen"""
+        value_ms = min(max(value_ms, 0.0), MAX_TRACKABLE_MS)
+        self.counts[_bucket_index(int(value_ms * UNITS_PER_MS))] += count
+        self.total_count += count
+        self.sum_ms += value_ms * count
+        if value_ms < self.min_ms:
+            self.min_ms = value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Anderes Histogramm hinzuaddieren (in-place)"""
+        if not other.total_count:
+            return self
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total_count += other.total_count
+        self.sum_ms += other.sum_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> "LatencyHistogram":
+        """Neues Histogramm aus mehreren zusammenführen"""
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    def reset(self):
+        """Alle Zähler zurücksetzen (Speicher wird wiederverwendet)"""
+        if self.total_count:
+            for index in range(BUCKET_COUNT):
+                self.counts[index] = 0
+        self.total_count = 0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+        self.sum_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.total_count if self.total_count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> float:
+        """Latenz (ms) beim gegebenen Perzentil"""
+        return self.values_at_percentiles([percentile])[percentile]
+
+    def values_at_percentiles(self, percentiles: Iterable[float]) -> Dict[float, float]:
+        """Mehrere Perzentile in einem Durchlauf berechnen"""
+        percentiles = sorted(percentiles)
+        result = {p: 0.0 for p in percentiles}
+        if not self.total_count:
+            return result
+
+        targets = [(p, max(1, int(round(p / 100.0 * self.total_count)))) for p in percentiles]
+        position = 0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            seen += count
+            while position < len(targets) and seen >= targets[position][1]:
+                value = _bucket_value(index) / UNITS_PER_MS
+                # Obere Bucket-Grenze nie über das tatsächliche Maximum hinaus melden
+                result[targets[position][0]] = min(value, self.max_ms)
+                position += 1
+            if position == len(targets):
+                break
+        return result
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Kompakte Kennzahlen (für Anzeige und JSON)"""
+        values = self.values_at_percentiles(percentiles)
+        summary = {f"p{p:g}": round(v, 2) for p, v in values.items()}
+        summary["max"] = round(self.max_ms, 2)
+        summary["mean"] = round(self.mean_ms, 2)
+        summary["count"] = self.total_count
+        return summary
+
+    def to_dict(self) -> Dict[str, object]:
+        """Sparse Serialisierung (z.B. für Pipes zwischen Prozessen)"""
+        return {
+            "counts": {index: count for index, count in enumerate(self.counts) if count},
+            "total_count": self.total_count,
+            "min_ms": self.min_ms if self.total_count else None,
+            "max_ms": self.max_ms,
+            "sum_ms": self.sum_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "LatencyHistogram":
+        histogram = cls()
+        for index, count in data["counts"].items():
+            histogram.counts[int(index)] = count
+        histogram.total_count = data["total_count"]
+        histogram.min_ms = data["min_ms"] if data["min_ms"] is not None else float("inf")
+        histogram.max_ms = data["max_ms"]
+        histogram.sum_ms = data["sum_ms"]
+        return histogram
+
+    def iter_buckets(self):
+        """(obere Grenze in ms, Anzahl) für alle belegten Buckets"""
+        for index, count in enumerate(self.counts):
+            if count:
+                yield _bucket_value(index) / UNITS_PER_MS, count
+
+
+class _SlotRing:
+    """Ringpuffer aus Slot-Histogrammen fester Dauer"""
+
+    def __init__(self, slot_seconds: int, slots: int):
+        self.slot_seconds = slot_seconds
+        self.histograms: List[Optional[LatencyHistogram]] = [None] * slots
+        self.slot_ids: List[int] = [-1] * slots
+
+    def record(self, value_ms: float, now: float):
+        slot_id = int(now // self.slot_seconds)
+        position = slot_id % len(self.histograms)
+        histogram = self.histograms[position]
+        if histogram is None:
+            histogram = self.histograms[position] = LatencyHistogram()
+        if self.slot_ids[position] != slot_id:
+            histogram.reset()
+            self.slot_ids[position] = slot_id
+        histogram.record(value_ms)
+
+    def window(self, seconds: int, now: float) -> LatencyHistogram:
+        current = int(now // self.slot_seconds)
+        oldest = current - seconds // self.slot_seconds + 1
+        return LatencyHistogram.merged(
+            histogram
+            for histogram, slot_id in zip(self.histograms, self.slot_ids)
+            if histogram is not None and oldest <= slot_id <= current
+        )
+
+
+# Fenstername → (Sekunden, Ring) ; 1m/5m aus 10s-Slots, 1h aus 1min-Slots
+WINDOWS = {"1m": 60, "5m": 300, "1h": 3600}
+
+
+class LatencyTracker:
+    """Latenzen über Sliding Windows (1m / 5m / 1h) verfolgen"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.fine = _SlotRing(slot_seconds=10, slots=30)
+        self.coarse = _SlotRing(slot_seconds=60, slots=60)
+        self.last_ms = 0.0
+        self._cache: Dict[str, Dict[str, float]] = {}
+        self._cache_time = 0.0
+
+    def record(self, value_ms: float):
+        now = self.clock()
+        self.fine.record(value_ms, now)
+        self.coarse.record(value_ms, now)
+        self.last_ms = value_ms
+
+    def window(self, name: str) -> LatencyHistogram:
+        """Gemergtes Histogramm eines Fensters ('1m', '5m', '1h')"""
+        seconds = WINDOWS[name]
+        ring = self.fine if seconds <= 300 else self.coarse
+        return ring.window(seconds, self.clock())
+
+    def summary(self, max_age: float = 1.0) -> Dict[str, Dict[str, float]]:
+        """Perzentile aller Fenster; höchstens einmal pro max_age neu berechnet"""
+        now = self.clock()
+        if not self._cache or now - self._cache_time >= max_age:
+            self._cache = {name: self.window(name).summary() for name in WINDOWS}
+            self._cache_time = now
+        return self._cache
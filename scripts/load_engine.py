@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Socket.IO Load Engine
+=====================
+Skalierbarer Stress-Test für den Gaming-Server mit tausenden simulierten Spielern.
+
+Ablauf:
+1. Ramp-up: neue socketio.AsyncClient-Verbindungen mit fester Ankunftsrate
+   (open loop), gleichzeitige Connects durch einen Semaphore begrenzt
+2. Hold: alle Verbindungen für eine feste Dauer offen halten
+3. Teardown: alle Verbindungen nebenläufig trennen
+
+Gemessen werden die Connect-Latenz-Verteilung, Fehlergründe und wie weit die
+'player-count'-Broadcasts des Servers der echten Verbindungszahl hinterherlaufen.
+
+Usage:
+    python load_engine.py --clients 2000 --rate 200 --hold 30
+"""
+
+import argparse
+import asyncio
+import collections
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import socketio
+
+from latency_histogram import LatencyHistogram
+
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class LoadConfig:
+    """Parameter eines Lasttests"""
+    url: str = "http://localhost:3001"
+    clients: int = 1000
+    arrival_rate: float = 100.0          # neue Verbindungen pro Sekunde
+    max_concurrent_connects: int = 200   # gleichzeitig laufende Handshakes
+    hold_seconds: float = 30.0
+    connect_timeout: float = 10.0
+    transports: List[str] = field(default_factory=lambda: ["websocket"])
+    settle_seconds: float = 2.0          # Wartezeit auf letzte Broadcasts
+    observe_player_count: bool = True    # False in Workern - dort beobachtet der Koordinator
+
+
+@dataclass
+class LoadResult:
+    """Ergebnis eines Lasttests"""
+    attempted: int = 0
+    connected: int = 0
+    failed: int = 0
+    disconnected: int = 0
+    peak_connected: int = 0
+    connect_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    disconnect_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    broadcast_lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    failure_reasons: collections.Counter = field(default_factory=collections.Counter)
+    max_count_divergence: int = 0
+    unobserved_changes: int = 0
+    phase_durations: Dict[str, float] = field(default_factory=dict)
+
+    def merge(self, other: "LoadResult") -> "LoadResult":
+        """Ergebnis eines anderen Workers hinzuaddieren"""
+        self.attempted += other.attempted
+        self.connected += other.connected
+        self.failed += other.failed
+        self.disconnected += other.disconnected
+        self.peak_connected += other.peak_connected
+        self.connect_latency.merge(other.connect_latency)
+        self.disconnect_latency.merge(other.disconnect_latency)
+        self.broadcast_lag.merge(other.broadcast_lag)
+        self.failure_reasons.update(other.failure_reasons)
+        self.max_count_divergence = max(self.max_count_divergence, other.max_count_divergence)
+        self.unobserved_changes += other.unobserved_changes
+        for phase, duration in other.phase_durations.items():
+            self.phase_durations[phase] = max(self.phase_durations.get(phase, 0.0), duration)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialisierung für Pipes zwischen Prozessen"""
+        return {
+            "attempted": self.attempted,
+            "connected": self.connected,
+            "failed": self.failed,
+            "disconnected": self.disconnected,
+            "peak_connected": self.peak_connected,
+            "connect_latency": self.connect_latency.to_dict(),
+            "disconnect_latency": self.disconnect_latency.to_dict(),
+            "broadcast_lag": self.broadcast_lag.to_dict(),
+            "failure_reasons": dict(self.failure_reasons),
+            "max_count_divergence": self.max_count_divergence,
+            "unobserved_changes": self.unobserved_changes,
+            "phase_durations": dict(self.phase_durations),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadResult":
+        return cls(
+            attempted=data["attempted"],
+            connected=data["connected"],
+            failed=data["failed"],
+            disconnected=data["disconnected"],
+            peak_connected=data["peak_connected"],
+            connect_latency=LatencyHistogram.from_dict(data["connect_latency"]),
+            disconnect_latency=LatencyHistogram.from_dict(data["disconnect_latency"]),
+            broadcast_lag=LatencyHistogram.from_dict(data["broadcast_lag"]),
+            failure_reasons=collections.Counter(data["failure_reasons"]),
+            max_count_divergence=data["max_count_divergence"],
+            unobserved_changes=data["unobserved_changes"],
+            phase_durations=dict(data["phase_durations"]),
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "attempted": self.attempted,
+            "connected": self.connected,
+            "failed": self.failed,
+            "success_rate": round(self.connected / self.attempted * 100, 1) if self.attempted else 0.0,
+            "peak_connected": self.peak_connected,
+            "connect_latency_ms": self.connect_latency.summary(),
+            "disconnect_latency_ms": self.disconnect_latency.summary(),
+            "player_count_lag_ms": self.broadcast_lag.summary(),
+            "max_count_divergence": self.max_count_divergence,
+            "unobserved_count_changes": self.unobserved_changes,
+            "failure_reasons": dict(self.failure_reasons.most_common(10)),
+            "phase_durations_s": {k: round(v, 2) for k, v in self.phase_durations.items()},
+        }
+
+
+def failure_reason(error: BaseException) -> str:
+    """Fehler auf einen gruppierbaren Grund reduzieren"""
+    if isinstance(error, asyncio.TimeoutError):
+        return "timeout"
+    message = str(error).strip() or type(error).__name__
+    return f"{type(error).__name__}: {message[:80]}"
+
+
+class PlayerCountObserver:
+    """Vergleicht 'player-count'-Broadcasts mit der tatsächlichen Verbindungszahl
+
+    Broadcasts und Verbindungsänderungen werden nur mit Zeitstempel (monotone
+    Uhr, auf Linux prozessübergreifend gleich) gesammelt und erst am Ende
+    ausgewertet - so können auch Änderungen aus Worker-Prozessen nachträglich
+    eingespielt werden.
+    """
+
+    def __init__(self):
+        self.baseline: Optional[int] = None
+        self.broadcasts: List[Tuple[float, int]] = []
+        self.changes: List[Tuple[float, int]] = []
+        self.client = socketio.AsyncClient(reconnection=False)
+        self.baseline_event = asyncio.Event()
+
+        self.client.on("player-count", self.on_player_count)
+        # Ältere Backends senden den Event-Namen mit Unterstrich
+        self.client.on("player_count", self.on_player_count)
+
+    async def start(self, url: str, transports: List[str], timeout: float):
+        await asyncio.wait_for(self.client.connect(url, transports=transports), timeout)
+        try:
+            await asyncio.wait_for(self.baseline_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            # Server sendet keinen Count - Lag kann nicht gemessen werden
+            pass
+
+    async def stop(self):
+        if self.client.connected:
+            await self.client.disconnect()
+
+    async def on_player_count(self, count):
+        try:
+            count = int(count)
+        except (TypeError, ValueError):
+            return
+        if self.baseline is None:
+            self.baseline = count
+            self.baseline_event.set()
+            return
+        self.broadcasts.append((time.monotonic(), count))
+
+    def add_changes(self, changes: Iterable[Tuple[float, int]]):
+        """Verbindungsänderungen (Zeitpunkt, +1/-1) hinzufügen"""
+        self.changes.extend(changes)
+
+    def evaluate(self, result: LoadResult):
+        """Lag, maximale Abweichung und unbestätigte Änderungen berechnen"""
+        if self.baseline is None:
+            result.unobserved_changes += len(self.changes)
+            return
+
+        # Zeitlinie: bei gleichem Zeitstempel zuerst die Änderung, dann der Broadcast
+        timeline = sorted(
+            [(at, 0, direction) for at, direction in self.changes] +
+            [(at, 1, count) for at, count in self.broadcasts]
+        )
+        expected = self.baseline
+        reported = self.baseline
+        # (erwartete Zahl, Zeitpunkt der Änderung, Richtung)
+        pending: collections.deque = collections.deque()
+        for at, kind, value in timeline:
+            if kind == 0:
+                expected += value
+                pending.append((expected, at, value))
+            else:
+                reported = value
+                while pending:
+                    target, changed_at, direction = pending[0]
+                    if (direction > 0 and reported >= target) or (direction < 0 and reported <= target):
+                        result.broadcast_lag.record((at - changed_at) * 1000)
+                        pending.popleft()
+                    else:
+                        break
+            result.max_count_divergence = max(result.max_count_divergence, abs(expected - reported))
+        result.unobserved_changes += len(pending)
+
+
+async def start_observer(config: LoadConfig, result: LoadResult) -> Optional[PlayerCountObserver]:
+    """Beobachter-Client verbinden; Fehler landen in den Failure-Reasons"""
+    observer = PlayerCountObserver()
+    try:
+        await observer.start(config.url, config.transports, config.connect_timeout)
+    except Exception as e:
+        result.failure_reasons[f"observer {failure_reason(e)}"] += 1
+        return None
+    return observer
+
+
+class SocketLoadEngine:
+    """Ramp-up / Hold / Teardown mit tausenden Socket.IO-Clients"""
+
+    def __init__(self, config: LoadConfig, progress: Optional[ProgressCallback] = None,
+                 progress_interval: float = 1.0):
+        self.config = config
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.result = LoadResult()
+        self.clients: List[socketio.AsyncClient] = []
+        self.phase = "idle"
+        self.observer: Optional[PlayerCountObserver] = None
+        # (monotone Zeit, +1/-1) pro erfolgreichem Connect/Disconnect
+        self.changes: List[Tuple[float, int]] = []
+
+    async def _report(self):
+        if self.progress:
+            await self.progress({
+                "phase": self.phase,
+                "target": self.config.clients,
+                "connected": self.result.connected - self.result.disconnected,
+                "failed": self.result.failed,
+            })
+
+    async def _progress_loop(self):
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await self._report()
+
+    async def _connect_one(self, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            client = socketio.AsyncClient(reconnection=False)
+            self.result.attempted += 1
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    client.connect(self.config.url, transports=self.config.transports),
+                    self.config.connect_timeout,
+                )
+            except Exception as e:
+                self.result.failed += 1
+                self.result.failure_reasons[failure_reason(e)] += 1
+                try:
+                    await client.disconnect()
+                except Exception:
+                    pass
+                return
+            self.result.connect_latency.record((time.perf_counter() - start) * 1000)
+            self.result.connected += 1
+            self.clients.append(client)
+            self.result.peak_connected = max(self.result.peak_connected, len(self.clients))
+            self.changes.append((time.monotonic(), +1))
+
+    async def _disconnect_one(self, client: socketio.AsyncClient, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(client.disconnect(), self.config.connect_timeout)
+            except Exception as e:
+                self.result.failure_reasons[f"disconnect {failure_reason(e)}"] += 1
+            self.result.disconnect_latency.record((time.perf_counter() - start) * 1000)
+            self.result.disconnected += 1
+            self.changes.append((time.monotonic(), -1))
+
+    async def ramp_up(self):
+        """Verbindungen mit fester Ankunftsrate öffnen"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_connects)
+        start = loop.time()
+        tasks = []
+        for i in range(self.config.clients):
+            # Open loop: Ankunftszeit steht fest, unabhängig von laufenden Handshakes
+            delay = start + i / self.config.arrival_rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._connect_one(semaphore)))
+        await asyncio.gather(*tasks)
+
+    async def teardown(self):
+        """Alle Verbindungen nebenläufig trennen"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_connects)
+        clients, self.clients = self.clients, []
+        await asyncio.gather(*(self._disconnect_one(client, semaphore) for client in clients))
+
+    async def run(self) -> LoadResult:
+        """Kompletten Lasttest ausführen"""
+        config = self.config
+        progress_task = asyncio.create_task(self._progress_loop()) if self.progress else None
+        if config.observe_player_count:
+            self.observer = await start_observer(config, self.result)
+        try:
+            for phase, action in (("ramp_up", self.ramp_up),
+                                  ("hold", lambda: asyncio.sleep(config.hold_seconds)),
+                                  ("teardown", self.teardown),
+                                  ("settle", lambda: asyncio.sleep(config.settle_seconds))):
+                self.phase = phase
+                await self._report()
+                started = time.perf_counter()
+                await action()
+                self.result.phase_durations[phase] = time.perf_counter() - started
+        finally:
+            if self.clients:
+                await self.teardown()
+            if self.observer:
+                await self.observer.stop()
+                self.observer.add_changes(self.changes)
+                self.observer.evaluate(self.result)
+            if progress_task:
+                progress_task.cancel()
+            self.phase = "done"
+            await self._report()
+        return self.result
+
+
+FD_LIMIT_CAP = 65536
+
+
+def raise_fd_limit():
+    """Soft-Limit für offene Dateien anheben (ein Socket pro Client)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # macOS: hard = RLIM_INFINITY, das akzeptiert setrlimit nicht als Soft-Limit
+    target = FD_LIMIT_CAP if hard == resource.RLIM_INFINITY else hard
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass    # Limit bleibt wie es ist - viele Clients scheitern dann ggf. mit EMFILE
+
+
+def print_summary(summary: Dict[str, Any]):
+    """Ergebnis lesbar ausgeben"""
+    print("\n" + "=" * 60)
+    print("📊 LOAD TEST RESULT")
+    print("=" * 60)
+    print(f"Connected: {summary['connected']}/{summary['attempted']} ({summary['success_rate']}%) "
+          f"| Peak: {summary['peak_connected']}")
+    for label, key in (("Connect latency", "connect_latency_ms"),
+                       ("Disconnect latency", "disconnect_latency_ms"),
+                       ("player-count lag", "player_count_lag_ms")):
+        stats = summary[key]
+        if stats["count"]:
+            print(f"{label:<20} p50 {stats['p50']:.1f}ms | p90 {stats['p90']:.1f}ms | "
+                  f"p99 {stats['p99']:.1f}ms | max {stats['max']:.1f}ms (n={stats['count']})")
+    print(f"Max count divergence: {summary['max_count_divergence']} "
+          f"| Unconfirmed changes: {summary['unobserved_count_changes']}")
+    if summary["failure_reasons"]:
+        print("Failure reasons:")
+        for reason, count in summary["failure_reasons"].items():
+            print(f"  {count:>6}x {reason}")
+    print(f"Phases: {summary['phase_durations_s']}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='Socket.IO load engine')
+    parser.add_argument('--backend', default='http://localhost:3001', help='Backend URL')
+    parser.add_argument('--clients', type=int, default=1000, help='Simulated players (default: 1000)')
+    parser.add_argument('--rate', type=float, default=100.0, help='New connections per second (default: 100)')
+    parser.add_argument('--concurrency', type=int, default=200, help='Max concurrent handshakes (default: 200)')
+    parser.add_argument('--hold', type=float, default=30.0, help='Hold duration in seconds (default: 30)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Connect timeout in seconds (default: 10)')
+    parser.add_argument('--polling', action='store_true', help='Allow long-polling transport')
+    return parser
+
+
+def config_from_args(args) -> LoadConfig:
+    return LoadConfig(
+        url=args.backend,
+        clients=args.clients,
+        arrival_rate=args.rate,
+        max_concurrent_connects=args.concurrency,
+        hold_seconds=args.hold,
+        connect_timeout=args.timeout,
+        transports=["polling", "websocket"] if args.polling else ["websocket"],
+    )
+
+
+def main():
+    args = build_parser().parse_args()
+    raise_fd_limit()
+
+    async def progress(state):
+        print(f"  [{state['phase']}] connected {state['connected']}/{state['target']} | failed {state['failed']}")
+
+    engine = SocketLoadEngine(config_from_args(args), progress=progress)
+    try:
+        result = asyncio.run(engine.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Load test aborted")
+        return 1
+    print_summary(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
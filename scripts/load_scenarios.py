@@ -0,0 +1,740 @@
+#!/usr/bin/env python3
+"""
+Load Scenarios
+==============
+Deklarative Multiplayer-Szenarien für Lasttests gegen den MultiplayerSocketHandler.
+
+Ein Szenario beschreibt das Verhalten der Spieler eines Raums:
+- Session per quick_match (Fallback: create_session) oder direkt per create_session
+- weitere Spieler / Zuschauer per join_session
+- jeder Spieler sendet state_rate game_state_update pro Sekunde für duration
+  Sekunden, dazu chat_message mit chat_rate und game_action mit action_rate
+
+Szenarien kommen aus den eingebauten PRESETS, aus YAML (PyYAML optional),
+JSON oder einer Python-Datei mit SCENARIO / SCENARIOS. Der ScenarioRunner
+spielt rooms Räume pro Szenario parallel ab und misst die End-to-End-Latenz
+vom Sender zu jedem anderen Raum-Mitglied sowie die Zustellquote.
+
+Mit --fanout wird ein Szenario je Raumgröße (2, 4, 8 Spieler, mit Zuschauern -
+soweit max_players des Spiels reicht) mit eigenen Sessions (create_session)
+abgespielt und pro Empfänger Latenz, Verlust und Umordnung ausgewertet.
+
+Usage:
+    python load_scenarios.py duel
+    python load_scenarios.py --fanout --rooms 20 --duration 30
+    python load_scenarios.py scenarios/party.yaml --output results.json
+"""
+
+import argparse
+import asyncio
+import collections
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import socketio
+
+from latency_histogram import LatencyHistogram
+from load_engine import failure_reason, raise_fd_limit
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+# Antwort-Events der Request-artigen Aufrufe
+REPLY_EVENTS = {
+    "create_session": "session_created",
+    "join_session": "session_joined",
+    "quick_match": "quick_match_result",
+    "list_sessions": "sessions_list",
+}
+
+# Nach dem Spielen noch laufende Broadcasts abwarten, bevor der Raum verlassen wird
+DRAIN_SECONDS = 1.0
+
+CHAT_TIMESTAMP = re.compile(r"^\[load ([0-9.]+)\]")
+
+
+def now_ms() -> float:
+    """Monotone Zeit in ms (Sender und Empfänger laufen auf demselben Host)"""
+    return time.monotonic() * 1000
+
+
+@dataclass
+class Scenario:
+    """Verhalten der Spieler eines Raums"""
+    name: str = "duel"
+    game: str = "pong"                  # Slug für quick_match
+    game_id: Optional[int] = None       # für create_session; None = einmalig per quick_match ermitteln
+    matchmaking: str = "quick_match"    # quick_match | create
+    rooms: int = 10
+    players_per_room: int = 2
+    spectators_per_room: int = 0
+    room_rate: float = 5.0              # neue Räume pro Sekunde
+    duration: float = 30.0
+    state_rate: float = 10.0            # game_state_update pro Spieler und Sekunde
+    chat_rate: float = 0.0
+    action_rate: float = 0.0
+    payload_bytes: int = 64
+    # create_session (auch der quick_match-Fallback) schreibt host_user_id mit
+    # Fremdschlüssel auf users.id - die IDs müssen also in der users-Tabelle existieren
+    user_ids: List[int] = field(default_factory=list)  # vorhandene users.id
+    user_id_start: int = 1              # sonst fortlaufende IDs ab hier (müssen ebenfalls existieren)
+    response_timeout: float = 10.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Scenario":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown scenario keys: {', '.join(sorted(unknown))}")
+        scenario = cls(**data)
+        scenario.validate()
+        return scenario
+
+    def validate(self):
+        if self.matchmaking not in ("quick_match", "create"):
+            raise ValueError(f"{self.name}: matchmaking must be 'quick_match' or 'create'")
+        if self.players_per_room < 1:
+            raise ValueError(f"{self.name}: players_per_room must be >= 1")
+        if self.room_rate <= 0:
+            raise ValueError(f"{self.name}: room_rate must be positive")
+        if self.user_ids and len(set(self.user_ids)) < self.members_per_room:
+            # Doppelte user_id im selben Raum wird als Reconnect behandelt und belegt keinen Platz
+            raise ValueError(f"{self.name}: need at least {self.members_per_room} distinct user_ids per room")
+
+    @property
+    def members_per_room(self) -> int:
+        return self.players_per_room + self.spectators_per_room
+
+
+# joinSession zählt Zuschauer gegen max_players - kein Seed-Spiel hat mehr als 4 Plätze
+PRESETS: Dict[str, Scenario] = {
+    "duel": Scenario(name="duel", game="pong", players_per_room=2, state_rate=30.0),
+    "party": Scenario(name="party", game="snake", players_per_room=4, state_rate=10.0, chat_rate=0.5),
+    "spectated": Scenario(name="spectated", game="snake", players_per_room=2, spectators_per_room=2,
+                          state_rate=30.0, chat_rate=0.2),
+}
+
+
+# Raumgrößen für den Fan-out-Modus: (Spieler, Zuschauer); Standard sind die,
+# die in max_players des Spiels passen (Zuschauer belegen ebenfalls einen Platz)
+FANOUT_ROOM_SIZES = ((2, 0), (4, 0), (8, 0), (2, 2), (2, 6))
+SEEDED_MAX_PLAYERS = 4                  # größtes Seed-Spiel (snake), falls /api/games nicht antwortet
+
+
+def default_room_sizes(max_players: Optional[int]) -> List[Tuple[int, int]]:
+    limit = max_players or SEEDED_MAX_PLAYERS
+    return [(players, spectators) for players, spectators in FANOUT_ROOM_SIZES
+            if players + spectators <= limit]
+
+
+def parse_room_sizes(text: str) -> List[Tuple[int, int]]:
+    """'2,4,8,2+6' → [(2, 0), (4, 0), (8, 0), (2, 6)]"""
+    sizes = []
+    for item in text.split(","):
+        players, _, spectators = item.strip().partition("+")
+        sizes.append((int(players), int(spectators or 0)))
+    return sizes
+
+
+def fanout_scenarios(base: Scenario, sizes=FANOUT_ROOM_SIZES) -> List[Scenario]:
+    """Ein Szenario pro Raumgröße
+
+    Immer create_session: quick_match würde auch wartende Sessions anderer
+    Raumgrößen desselben Laufs füllen und die Messwerte vermischen.
+    """
+    return [
+        replace(base, name=f"fanout_{players}p" + (f"+{spectators}s" if spectators else ""),
+                players_per_room=players, spectators_per_room=spectators, matchmaking="create")
+        for players, spectators in sizes
+    ]
+
+
+async def fetch_game_limits(url: str, timeout: float = 5.0) -> Dict[str, int]:
+    """Slug → maxPlayers aus /api/games; leer, wenn das Backend nicht antwortet"""
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            async with session.get(f"{url.rstrip('/')}/api/games") as response:
+                data = await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return {}
+    games = data.get("availableGames", []) if isinstance(data, dict) else []
+    return {game["id"]: int(game["maxPlayers"]) for game in games
+            if isinstance(game, dict) and "id" in game and game.get("maxPlayers") is not None}
+
+
+def check_room_limits(scenarios: List[Scenario], limits: Dict[str, int]) -> List[str]:
+    """Szenarien, deren Räume (Spieler + Zuschauer) max_players des Spiels überschreiten"""
+    problems = []
+    for scenario in scenarios:
+        limit = limits.get(scenario.game)
+        if limit is None:
+            if limits:
+                problems.append(f"{scenario.name}: unknown game '{scenario.game}' "
+                                f"(available: {', '.join(sorted(limits))})")
+        elif scenario.members_per_room > limit:
+            problems.append(f"{scenario.name}: {scenario.players_per_room} players + "
+                            f"{scenario.spectators_per_room} spectators exceed {scenario.game} "
+                            f"max_players {limit} (spectators take a seat too)")
+    return problems
+
+
+def load_scenarios(spec: str) -> List[Scenario]:
+    """Preset-Name oder Pfad zu .yaml/.yml/.json/.py laden"""
+    if spec in PRESETS:
+        return [PRESETS[spec]]
+    if not os.path.exists(spec):
+        raise ValueError(f"Unknown scenario '{spec}' (presets: {', '.join(PRESETS)})")
+
+    extension = os.path.splitext(spec)[1].lower()
+    if extension in (".yaml", ".yml"):
+        if not YAML_AVAILABLE:
+            raise ValueError("YAML scenarios require PyYAML (pip install pyyaml)")
+        with open(spec, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+    elif extension == ".json":
+        with open(spec, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    elif extension == ".py":
+        module_spec = importlib.util.spec_from_file_location("scenario_file", spec)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        data = getattr(module, "SCENARIOS", None) or getattr(module, "SCENARIO", None)
+        if data is None:
+            raise ValueError(f"{spec} defines neither SCENARIO nor SCENARIOS")
+    else:
+        raise ValueError(f"Unsupported scenario file type: {extension}")
+
+    if isinstance(data, dict) and "scenarios" in data:
+        data = data["scenarios"]
+    items = data if isinstance(data, list) else [data]
+    return [item if isinstance(item, Scenario) else Scenario.from_dict(item) for item in items]
+
+
+class FanoutStats:
+    """Fan-out-Messung für game_state_update → game_state_updated
+
+    Jede Nachricht trägt (sender, seq) und den Sendezeitpunkt. Pro Empfänger
+    werden Latenz, Lücken/Umordnung im Strom jedes Absenders und Duplikate
+    erfasst; pro Nachricht die Zeit bis zum letzten erwarteten Empfänger.
+    Vollständig zugestellte Nachrichten werden sofort abgeschlossen, damit der
+    Speicher nicht mit der Laufzeit wächst.
+    """
+
+    def __init__(self):
+        # (sender, seq) → [Sendezeit, erwartete Empfänger, empfangen, erste Ankunft]
+        self.pending: Dict[Tuple[int, int], List] = {}
+        self.last_seq: Dict[Tuple[int, int], int] = {}
+        self.delivery = LatencyHistogram()
+        self.complete = LatencyHistogram()
+        self.spread = LatencyHistogram()
+        self.recipients: Dict[int, LatencyHistogram] = collections.defaultdict(LatencyHistogram)
+        self.messages = 0
+        self.expected = 0
+        self.received = 0
+        self.reordered = 0
+        self.duplicates = 0
+        self.unexpected = 0
+
+    def sent(self, sender: int, seq: int, sent_at: float, recipients: int):
+        self.messages += 1
+        self.expected += recipients
+        if recipients:
+            self.pending[(sender, seq)] = [sent_at, recipients, 0, None]
+
+    def delivered(self, recipient: int, sender: int, seq: int, sent_at: float, now: float):
+        latency = now - sent_at
+        self.received += 1
+        self.delivery.record(latency)
+        self.recipients[recipient].record(latency)
+
+        stream = (recipient, sender)
+        last = self.last_seq.get(stream)
+        if last is not None and seq <= last:
+            if seq == last:
+                self.duplicates += 1
+            else:
+                self.reordered += 1
+        else:
+            self.last_seq[stream] = seq
+
+        entry = self.pending.get((sender, seq))
+        if entry is None:
+            # z.B. Empfänger aus einer per quick_match geteilten Session
+            self.unexpected += 1
+            return
+        entry[2] += 1
+        if entry[3] is None:
+            entry[3] = now
+        if entry[2] >= entry[1]:
+            self.complete.record(now - entry[0])
+            self.spread.record(now - entry[3])
+            del self.pending[(sender, seq)]
+
+    def summary(self) -> Dict[str, Any]:
+        recipient_p99 = sorted(h.value_at_percentile(99.0) for h in self.recipients.values())
+        lost = max(self.expected - (self.received - self.duplicates - self.unexpected), 0)
+        return {
+            "messages": self.messages,
+            "expected_deliveries": self.expected,
+            "received": self.received,
+            "lost": lost,
+            "loss_ratio": round(lost / self.expected, 6) if self.expected else 0.0,
+            "incomplete_messages": len(self.pending),
+            "reordered": self.reordered,
+            "duplicates": self.duplicates,
+            "unexpected": self.unexpected,
+            "recipients": len(recipient_p99),
+            "delivery_ms": self.delivery.summary(),
+            "all_recipients_ms": self.complete.summary(),
+            "first_to_last_ms": self.spread.summary(),
+            "recipient_p99_ms": {
+                "median": round(recipient_p99[len(recipient_p99) // 2], 2) if recipient_p99 else 0.0,
+                "worst": round(recipient_p99[-1], 2) if recipient_p99 else 0.0,
+            },
+        }
+
+
+@dataclass
+class ScenarioStats:
+    """Messwerte eines Szenario-Laufs"""
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    requests: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: collections.defaultdict(LatencyHistogram))
+    broadcast: Dict[str, LatencyHistogram] = field(
+        default_factory=lambda: collections.defaultdict(LatencyHistogram))
+    sent: collections.Counter = field(default_factory=collections.Counter)
+    expected: collections.Counter = field(default_factory=collections.Counter)
+    received: collections.Counter = field(default_factory=collections.Counter)
+    errors: collections.Counter = field(default_factory=collections.Counter)
+    rooms_started: int = 0
+    rooms_completed: int = 0
+    fanout: Optional[FanoutStats] = None
+
+    def summary(self) -> Dict[str, Any]:
+        summary = {
+            "rooms_started": self.rooms_started,
+            "rooms_completed": self.rooms_completed,
+            "connect_ms": self.connect.summary(),
+            "requests_ms": {name: h.summary() for name, h in sorted(self.requests.items())},
+            "broadcast_ms": {kind: h.summary() for kind, h in sorted(self.broadcast.items())},
+            "delivery": {
+                kind: {
+                    "sent": self.sent[kind],
+                    "expected": self.expected[kind],
+                    "received": self.received[kind],
+                    "ratio": round(self.received[kind] / self.expected[kind], 4) if self.expected[kind] else None,
+                }
+                for kind in sorted(self.sent)
+            },
+            "errors": dict(self.errors.most_common(10)),
+        }
+        if self.fanout:
+            summary["fanout"] = self.fanout.summary()
+        return summary
+
+
+class VirtualPlayer:
+    """Ein simulierter Spieler / Zuschauer mit eigener Socket.IO-Verbindung"""
+
+    def __init__(self, runner: "ScenarioRunner", key: int, user: Dict[str, Any], spectator: bool = False):
+        self.runner = runner
+        # Lauf-weit eindeutig (user_ids können sich wiederholen)
+        self.key = key
+        self.user = user
+        self.spectator = spectator
+        self.session_id = None
+        self.client = socketio.AsyncClient(reconnection=False)
+        self.waiters: Dict[str, asyncio.Future] = {}
+
+        for reply in REPLY_EVENTS.values():
+            self.client.on(reply, self._make_reply_handler(reply))
+        self.client.on("game_state_updated", self.on_game_state)
+        self.client.on("game_action", self.on_game_action)
+        self.client.on("chat_message", self.on_chat)
+
+    def _make_reply_handler(self, event: str):
+        async def handler(data):
+            waiter = self.waiters.pop(event, None)
+            if waiter and not waiter.done():
+                waiter.set_result(data)
+        return handler
+
+    async def connect(self, url: str, timeout: float):
+        start = now_ms()
+        await asyncio.wait_for(self.client.connect(url, transports=["websocket"]), timeout)
+        self.runner.stats.connect.record(now_ms() - start)
+
+    async def request(self, event: str, data: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Event senden und auf das zugehörige Antwort-Event warten"""
+        reply = REPLY_EVENTS[event]
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[reply] = waiter
+        start = now_ms()
+        await self.client.emit(event, data)
+        try:
+            result = await asyncio.wait_for(waiter, timeout)
+        finally:
+            self.waiters.pop(reply, None)
+        self.runner.stats.requests[event].record(now_ms() - start)
+        if not result.get("success"):
+            raise RuntimeError(f"{event}: {result.get('error', 'unknown error')}")
+        return result
+
+    # Empfang: Latenz = jetzt - Sendezeitpunkt des Absenders
+
+    async def on_game_state(self, data):
+        sent_at = data.get("timestamp")
+        self.runner.record_delivery("game_state_update", sent_at)
+        state = data.get("gameState") or {}
+        if self.runner.stats.fanout and isinstance(sent_at, (int, float)):
+            self.runner.stats.fanout.delivered(self.key, state.get("sender"), state.get("seq", -1),
+                                               sent_at, now_ms())
+
+    async def on_game_action(self, data):
+        self.runner.record_delivery("game_action", data.get("sentAt"))
+
+    async def on_chat(self, data):
+        # Chat geht an den ganzen Raum inkl. Absender; user_ids können sich wiederholen,
+        # daher am lauf-weit eindeutigen loadKey erkennen
+        if (data.get("user") or {}).get("loadKey") == self.user["loadKey"]:
+            return
+        match = CHAT_TIMESTAMP.match(str(data.get("message", "")))
+        self.runner.record_delivery("chat_message", float(match.group(1)) if match else None)
+
+    # Senden
+
+    async def _ticker(self, rate: float, duration: float, send):
+        """Open-Loop-Takt: feste Sendezeitpunkte, unabhängig von der Sendedauer"""
+        if rate <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        count = int(duration * rate)
+        for n in range(count):
+            delay = start + n / rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await send(n)
+
+    async def send_state(self, seq: int):
+        state = {"seq": seq, "sender": self.key, "player": self.user["id"],
+                 "pad": "x" * self.runner.current.payload_bytes}
+        sent_at = now_ms()
+        recipients = self.runner.record_send("game_state_update", self.session_id)
+        if self.runner.stats.fanout:
+            self.runner.stats.fanout.sent(self.key, seq, sent_at, recipients)
+        await self.client.emit("game_state_update", {"gameState": state, "timestamp": sent_at})
+
+    async def send_action(self, seq: int):
+        self.runner.record_send("game_action", self.session_id)
+        await self.client.emit("game_action", {"action": "input", "seq": seq, "sentAt": now_ms()})
+
+    async def send_chat(self, seq: int):
+        self.runner.record_send("chat_message", self.session_id)
+        await self.client.emit("chat_message", {
+            "message": f"[load {now_ms():.3f}] gg #{seq}",
+            "user": self.user,
+        })
+
+    async def play(self, scenario: Scenario):
+        await asyncio.gather(
+            self._ticker(scenario.state_rate, scenario.duration, self.send_state),
+            self._ticker(scenario.action_rate, scenario.duration, self.send_action),
+            self._ticker(scenario.chat_rate, scenario.duration, self.send_chat),
+        )
+
+    async def close(self):
+        try:
+            if self.client.connected:
+                await self.client.emit("leave_session")
+                await self.client.disconnect()
+        except Exception:
+            pass
+
+
+class ScenarioRunner:
+    """Spielt Szenarien mit vielen Räumen parallel ab"""
+
+    def __init__(self, url: str = "http://localhost:3001", max_concurrent_connects: int = 100,
+                 connect_timeout: float = 10.0, fanout: bool = False):
+        self.url = url
+        self.connect_timeout = connect_timeout
+        self.fanout = fanout
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.max_concurrent_connects = max_concurrent_connects
+        self.stats = ScenarioStats()
+        self.current: Optional[Scenario] = None
+        # Session-ID → Anzahl Mitglieder (für erwartete Zustellungen)
+        self.session_members: Dict[Any, int] = collections.Counter()
+        # Slug → games.id aus quick_match-Antworten (für matchmaking: create ohne game_id)
+        self.game_ids: Dict[str, int] = {}
+        self._next_user = 0
+        # Präfix für loadKey, eindeutig auch bei parallel laufenden Lasttests
+        self.run_id = f"{os.getpid()}-{int(time.time())}"
+
+    def record_send(self, kind: str, session_id) -> int:
+        """Sendung zählen; liefert die Zahl der erwarteten Empfänger"""
+        self.stats.sent[kind] += 1
+        # Alle anderen Mitglieder der Session (Chat-Echo an den Absender zählt nicht)
+        recipients = max(self.session_members.get(session_id, 1) - 1, 0)
+        self.stats.expected[kind] += recipients
+        return recipients
+
+    def record_delivery(self, kind: str, sent_at):
+        self.stats.received[kind] += 1
+        try:
+            self.stats.broadcast[kind].record(now_ms() - float(sent_at))
+        except (TypeError, ValueError):
+            self.stats.errors[f"{kind}: missing timestamp"] += 1
+
+    def next_player(self, scenario: Scenario, spectator: bool = False) -> VirtualPlayer:
+        index = self._next_user
+        self._next_user += 1
+        if scenario.user_ids:
+            user_id = scenario.user_ids[index % len(scenario.user_ids)]
+        else:
+            user_id = scenario.user_id_start + index
+        role = "spectator" if spectator else "player"
+        user = {"id": user_id, "username": f"load_{role}_{index}", "loadKey": f"{self.run_id}-{index}"}
+        return VirtualPlayer(self, index, user, spectator)
+
+    async def _connect(self, player: VirtualPlayer):
+        async with self.semaphore:
+            await player.connect(self.url, self.connect_timeout)
+
+    async def _open_session(self, host: VirtualPlayer, scenario: Scenario):
+        """Session-ID für den Raum besorgen (quick_match oder create_session)"""
+        timeout = scenario.response_timeout
+        game_id, settings = scenario.game_id, {"loadTest": scenario.name}
+        if scenario.matchmaking == "quick_match":
+            match = await host.request("quick_match", {"gameSlug": scenario.game, "user": host.user}, timeout)
+            if match.get("action") == "join":
+                await host.request("join_session", {"sessionId": match["sessionId"], "user": host.user}, timeout)
+                return match["sessionId"]
+            game_id, settings = match["gameId"], {**match.get("settings", {}), **settings}
+            self.game_ids.setdefault(scenario.game, game_id)
+        created = await host.request("create_session", {
+            "gameId": game_id, "settings": settings, "user": host.user}, timeout)
+        return created["sessionId"]
+
+    async def resolve_game_id(self, scenario: Scenario) -> int:
+        """games.id für create_session: quick_match liefert sie, solange keine Session wartet"""
+        if scenario.game not in self.game_ids:
+            probe = self.next_player(scenario)
+            try:
+                await self._connect(probe)
+                match = await probe.request("quick_match", {"gameSlug": scenario.game, "user": probe.user},
+                                            scenario.response_timeout)
+            except Exception as e:
+                raise ValueError(f"{scenario.name}: cannot resolve game_id for '{scenario.game}': "
+                                 f"{failure_reason(e)}") from e
+            finally:
+                await probe.close()
+            if "gameId" not in match:
+                raise ValueError(f"{scenario.name}: cannot resolve game_id for '{scenario.game}' while "
+                                 f"another session is waiting - pass --game-id")
+            self.game_ids[scenario.game] = match["gameId"]
+        return self.game_ids[scenario.game]
+
+    async def run_room(self, scenario: Scenario):
+        """Ein Raum: verbinden, Session öffnen, beitreten, spielen, verlassen"""
+        self.stats.rooms_started += 1
+        members = [self.next_player(scenario) for _ in range(scenario.players_per_room)]
+        members += [self.next_player(scenario, spectator=True) for _ in range(scenario.spectators_per_room)]
+        host, others = members[0], members[1:]
+        joined: List[VirtualPlayer] = []
+        try:
+            await asyncio.gather(*(self._connect(member) for member in members))
+            session_id = await self._open_session(host, scenario)
+            host.session_id = session_id
+            self.session_members[session_id] += 1
+            joined.append(host)
+
+            async def join(member: VirtualPlayer):
+                await member.request("join_session", {
+                    "sessionId": session_id, "user": member.user, "asSpectator": member.spectator,
+                }, scenario.response_timeout)
+                member.session_id = session_id
+                self.session_members[session_id] += 1
+                joined.append(member)
+
+            await asyncio.gather(*(join(member) for member in others))
+            await asyncio.gather(*(member.play(scenario) for member in joined if not member.spectator))
+            await asyncio.sleep(DRAIN_SECONDS)
+            self.stats.rooms_completed += 1
+        except Exception as e:
+            self.stats.errors[failure_reason(e)] += 1
+        finally:
+            for member in joined:
+                self.session_members[member.session_id] -= 1
+            await asyncio.gather(*(member.close() for member in members))
+
+    async def run_scenario(self, scenario: Scenario):
+        """Räume mit fester Rate starten und auf alle warten"""
+        self.current = scenario
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        rooms = []
+        for i in range(scenario.rooms):
+            delay = start + i / scenario.room_rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            rooms.append(asyncio.create_task(self.run_room(scenario)))
+        await asyncio.gather(*rooms)
+
+    async def run(self, scenarios: List[Scenario]) -> Dict[str, Dict[str, Any]]:
+        """Szenarien nacheinander abspielen; Ergebnis je Szenario"""
+        self.semaphore = asyncio.Semaphore(self.max_concurrent_connects)
+        results = {}
+        for scenario in scenarios:
+            if scenario.matchmaking == "create" and scenario.game_id is None:
+                scenario = replace(scenario, game_id=await self.resolve_game_id(scenario))
+            self.stats = ScenarioStats(fanout=FanoutStats() if self.fanout else None)
+            started = time.monotonic()
+            await self.run_scenario(scenario)
+            summary = self.stats.summary()
+            summary["scenario"] = asdict(scenario)
+            summary["duration_s"] = round(time.monotonic() - started, 2)
+            results[scenario.name] = summary
+        return results
+
+
+def print_summary(name: str, summary: Dict[str, Any]):
+    """Ergebnis eines Szenarios ausgeben"""
+    print("\n" + "=" * 60)
+    print(f"🎮 SCENARIO: {name}")
+    print("=" * 60)
+    print(f"Rooms: {summary['rooms_completed']}/{summary['rooms_started']} completed "
+          f"in {summary['duration_s']}s")
+
+    def line(label, stats):
+        if stats["count"]:
+            print(f"  {label:<20} p50 {stats['p50']:.1f}ms | p99 {stats['p99']:.1f}ms | "
+                  f"max {stats['max']:.1f}ms (n={stats['count']})")
+
+    line("connect", summary["connect_ms"])
+    for request, stats in summary["requests_ms"].items():
+        line(request, stats)
+    print("📡 Broadcast latency (sender → other room members):")
+    for kind, stats in summary["broadcast_ms"].items():
+        line(kind, stats)
+    for kind, delivery in summary["delivery"].items():
+        ratio = f"{delivery['ratio'] * 100:.1f}%" if delivery["ratio"] is not None else "-"
+        print(f"  {kind:<20} sent {delivery['sent']} | delivered {delivery['received']}/"
+              f"{delivery['expected']} ({ratio})")
+    fanout = summary.get("fanout")
+    if fanout:
+        print("🔀 Fan-out (game_state_update → every other member):")
+        line("per delivery", fanout["delivery_ms"])
+        line("all recipients", fanout["all_recipients_ms"])
+        line("first → last", fanout["first_to_last_ms"])
+        print(f"  lost {fanout['lost']}/{fanout['expected_deliveries']} ({fanout['loss_ratio'] * 100:.2f}%) | "
+              f"reordered {fanout['reordered']} | duplicates {fanout['duplicates']} | "
+              f"incomplete messages {fanout['incomplete_messages']}")
+        print(f"  recipient p99: median {fanout['recipient_p99_ms']['median']:.1f}ms | "
+              f"worst {fanout['recipient_p99_ms']['worst']:.1f}ms ({fanout['recipients']} recipients)")
+    if summary["errors"]:
+        print("❌ Errors:")
+        for reason, count in summary["errors"].items():
+            print(f"  {count:>6}x {reason}")
+
+
+def print_fanout_table(results: Dict[str, Dict[str, Any]]):
+    """Fan-out-Kennzahlen aller Raumgrößen nebeneinander"""
+    print("\n" + "=" * 78)
+    print("🔀 FAN-OUT BY ROOM SIZE")
+    print("=" * 78)
+    print(f"{'Room':<14} {'Recipients':>10} {'p50':>8} {'p99':>8} {'all p99':>9} {'worst rcpt':>11} "
+          f"{'Loss':>8} {'Reord':>6}")
+    for name, summary in results.items():
+        fanout = summary.get("fanout")
+        if not fanout:
+            continue
+        print(f"{name:<14} {fanout['recipients']:>10} {fanout['delivery_ms']['p50']:>7.1f}ms "
+              f"{fanout['delivery_ms']['p99']:>7.1f}ms {fanout['all_recipients_ms']['p99']:>8.1f}ms "
+              f"{fanout['recipient_p99_ms']['worst']:>10.1f}ms {fanout['loss_ratio'] * 100:>7.2f}% "
+              f"{fanout['reordered']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay multiplayer scenarios against the backend')
+    parser.add_argument('scenario', nargs='*',
+                        help=f"Preset ({', '.join(PRESETS)}) or scenario file (.yaml/.json/.py)")
+    parser.add_argument('--fanout', action='store_true',
+                        help='Fan-out mode: run the (first) scenario once per room size and track '
+                             'per-recipient latency, loss and reordering')
+    parser.add_argument('--room-sizes',
+                        help="Fan-out room sizes as players[+spectators] "
+                             "(default: those of 2,4,8,2+2,2+6 that fit the game's max_players)")
+    parser.add_argument('--game', help='Override game slug (room sizes are checked against its max_players)')
+    parser.add_argument('--game-id', type=int, help='games.id for create_session (default: resolved via quick_match)')
+    parser.add_argument('--backend', default='http://localhost:3001', help='Backend URL')
+    parser.add_argument('--rooms', type=int, help='Override rooms per scenario')
+    parser.add_argument('--duration', type=float, help='Override play duration in seconds')
+    parser.add_argument('--concurrency', type=int, default=100, help='Max concurrent handshakes (default: 100)')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    if not args.scenario and not args.fanout:
+        parser.error("give at least one scenario or --fanout")
+    overrides = {key: value for key, value in (("rooms", args.rooms), ("duration", args.duration),
+                                               ("game", args.game), ("game_id", args.game_id))
+                 if value is not None}
+    if args.game and args.game_id is None:
+        overrides["game_id"] = None     # game_id der Szenario-Datei gehört zum alten Spiel
+    limits = asyncio.run(fetch_game_limits(args.backend))
+    if not limits:
+        print(f"⚠️ Could not read /api/games from {args.backend} - room sizes not checked")
+    try:
+        scenarios = [replace(scenario, **overrides)
+                     for spec in args.scenario for scenario in load_scenarios(spec)]
+        if args.fanout:
+            base = scenarios[0] if scenarios else replace(
+                Scenario(name="fanout", game="snake", state_rate=30.0), **overrides)
+            sizes = (parse_room_sizes(args.room_sizes) if args.room_sizes
+                     else default_room_sizes(limits.get(base.game)))
+            scenarios = fanout_scenarios(base, sizes)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    problems = check_room_limits(scenarios, limits)
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+
+    raise_fd_limit()
+    runner = ScenarioRunner(args.backend, max_concurrent_connects=args.concurrency, fanout=args.fanout)
+    try:
+        results = asyncio.run(runner.run(scenarios))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    except KeyboardInterrupt:
+        print("\n🛑 Scenario run aborted")
+        return 1
+
+    for name, summary in results.items():
+        print_summary(name, summary)
+    if args.fanout:
+        print_fanout_table(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results saved: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Load Workers
+============
+Verteilt den Socket.IO-Lasttest auf mehrere Worker-Prozesse.
+
+Ein einzelner Event-Loop ist durch JSON-Parsing und Engine.IO-Framing bei
+einigen tausend Clients CPU-gebunden (GIL). Der ShardedLoadRunner teilt
+Clients, Ankunftsrate und Handshake-Limit auf N Prozesse auf; jeder Worker
+führt eine eigene SocketLoadEngine aus und meldet seinen kumulativen Stand
+(Zähler + Histogramme, sparse serialisiert) regelmäßig über eine Pipe. Der
+Koordinator merged die letzten Stände aller Worker zu einer Live-Ansicht.
+
+Der 'player-count'-Beobachter läuft nur im Koordinator; die Worker liefern
+am Ende ihre Verbindungsänderungen mit Zeitstempel (monotone Uhr) nach.
+
+Usage:
+    python load_workers.py --clients 20000 --rate 1000 --workers 8
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+from dataclasses import replace
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+
+from load_engine import (LoadConfig, LoadResult, ProgressCallback, SocketLoadEngine,
+                         build_parser, config_from_args, print_summary, raise_fd_limit,
+                         start_observer)
+
+
+def split_evenly(total: int, parts: int) -> List[int]:
+    """total möglichst gleichmäßig auf parts aufteilen"""
+    base, rest = divmod(total, parts)
+    return [base + (1 if i < rest else 0) for i in range(parts)]
+
+
+def _worker_main(index: int, config: LoadConfig, conn, report_interval: float):
+    """Einstiegspunkt eines Worker-Prozesses"""
+    raise_fd_limit()
+    engine: Optional[SocketLoadEngine] = None
+
+    async def progress(state):
+        conn.send(("progress", index, state, engine.result.to_dict()))
+
+    try:
+        engine = SocketLoadEngine(config, progress=progress, progress_interval=report_interval)
+        result = asyncio.run(engine.run())
+        conn.send(("done", index, result.to_dict(), engine.changes))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        conn.send(("error", index, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class ShardedLoadRunner:
+    """Koordiniert mehrere Worker-Prozesse und merged ihre Ergebnisse live"""
+
+    def __init__(self, config: LoadConfig, workers: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None, report_interval: float = 1.0):
+        self.config = config
+        self.workers = max(1, min(workers or os.cpu_count() or 1, config.clients or 1))
+        self.progress = progress
+        self.report_interval = report_interval
+        self.latest: Dict[int, LoadResult] = {}
+        self.phases: Dict[int, str] = {}
+        self.changes: List[tuple] = []
+        self.errors: Dict[int, str] = {}
+
+    def worker_configs(self) -> List[LoadConfig]:
+        """Clients, Rate und Handshake-Limit auf die Worker verteilen"""
+        clients = split_evenly(self.config.clients, self.workers)
+        concurrency = split_evenly(max(self.config.max_concurrent_connects, self.workers), self.workers)
+        return [
+            replace(
+                self.config,
+                clients=clients[i],
+                arrival_rate=self.config.arrival_rate * clients[i] / max(self.config.clients, 1),
+                max_concurrent_connects=concurrency[i],
+                settle_seconds=0.0,
+                observe_player_count=False,
+            )
+            for i in range(self.workers)
+        ]
+
+    def merged(self) -> LoadResult:
+        """Aktuelle Gesamtansicht aus den letzten Ständen aller Worker"""
+        result = LoadResult()
+        for partial in self.latest.values():
+            result.merge(partial)
+        return result
+
+    def live_view(self) -> Dict[str, Any]:
+        merged = self.merged()
+        phases = sorted(set(self.phases.values())) or ["starting"]
+        return {
+            "phase": "/".join(phases),
+            "target": self.config.clients,
+            "connected": merged.connected - merged.disconnected,
+            "failed": merged.failed,
+            "workers": self.workers,
+            "workers_done": sum(1 for phase in self.phases.values() if phase == "done"),
+            "connect_latency_ms": merged.connect_latency.summary(),
+        }
+
+    def _handle(self, message) -> bool:
+        """Nachricht eines Workers verarbeiten; True = Worker fertig"""
+        kind, index = message[0], message[1]
+        if kind == "progress":
+            self.phases[index] = message[2]["phase"]
+            self.latest[index] = LoadResult.from_dict(message[3])
+            return False
+        if kind == "done":
+            self.phases[index] = "done"
+            self.latest[index] = LoadResult.from_dict(message[2])
+            self.changes.extend(message[3])
+        else:
+            self.phases[index] = "failed"
+            self.errors[index] = message[2]
+        return True
+
+    async def run(self) -> LoadResult:
+        """Worker starten, Meldungen einsammeln, Ergebnis mergen"""
+        loop = asyncio.get_running_loop()
+        # spawn statt fork: der Koordinator läuft ggf. in einem Prozess mit aktivem Event-Loop
+        context = multiprocessing.get_context("spawn")
+        processes = []
+        readers = {}
+
+        # Beobachter vor den Workern verbinden, damit die Baseline noch ohne Last ist
+        observer_result = LoadResult()
+        observer = None
+        if self.config.observe_player_count:
+            observer = await start_observer(self.config, observer_result)
+
+        try:
+            for index, worker_config in enumerate(self.worker_configs()):
+                reader, writer = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_worker_main,
+                    args=(index, worker_config, writer, self.report_interval),
+                    name=f"load-worker-{index}",
+                    daemon=True,
+                )
+                process.start()
+                writer.close()
+                processes.append(process)
+                readers[reader] = index
+
+            open_readers = list(readers)
+            while open_readers:
+                ready = await loop.run_in_executor(None, wait, open_readers, self.report_interval)
+                for reader in ready:
+                    try:
+                        message = reader.recv()
+                    except EOFError:
+                        # Worker ohne Abschlussmeldung beendet (z.B. abgestürzt)
+                        index = readers[reader]
+                        if self.phases.get(index) not in ("done", "failed"):
+                            self.phases[index] = "failed"
+                            self.errors[index] = "worker exited unexpectedly"
+                        open_readers.remove(reader)
+                        continue
+                    if self._handle(message):
+                        open_readers.remove(reader)
+                if self.progress:
+                    await self.progress(self.live_view())
+
+            if observer:
+                await asyncio.sleep(self.config.settle_seconds)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join(timeout=5)
+            for reader in readers:
+                reader.close()
+            if observer:
+                await observer.stop()
+
+        result = self.merged()
+        for index, error in self.errors.items():
+            result.failure_reasons[f"worker {index}: {error}"] += 1
+        result.failure_reasons.update(observer_result.failure_reasons)
+        if observer:
+            observer.add_changes(self.changes)
+            observer.evaluate(result)
+        return result
+
+
+def main():
+    parser = build_parser()
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+    raise_fd_limit()
+
+    async def progress(state):
+        latency = state["connect_latency_ms"]
+        print(f"  [{state['phase']}] connected {state['connected']}/{state['target']} | "
+              f"failed {state['failed']} | workers done {state['workers_done']}/{state['workers']} | "
+              f"connect p99 {latency['p99']:.1f}ms")
+
+    runner = ShardedLoadRunner(config_from_args(args), workers=args.workers, progress=progress)
+    print(f"🚀 Load test: {args.clients} clients on {runner.workers} workers")
+    try:
+        result = asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Load test aborted")
+        return 1
+    print_summary(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
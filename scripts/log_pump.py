@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Log Pump
+========
+Liest stdout/stderr gestarteter Server (node server.js, npm start) kontinuierlich
+aus, damit die Pipe (64 KB) nie vollläuft und den Kindprozess blockiert.
+
+Jede Zeile landet
+- in einem begrenzten Ring-Puffer im Speicher (tail() für Fehlermeldungen),
+- optional in einer rotierenden Log-Datei (RotatingFileHandler),
+- bei allen Hooks, deren Regex passt (Fehler, "running on port", Socket.IO-Warnungen).
+
+Hooks werden im Pump-Thread aufgerufen, sobald die Zeile da ist - andere Tools
+abonnieren per on() oder blockieren per wait_for(), ohne zu pollen.
+
+Usage:
+    python log_pump.py --log backend.log -- node ../backend/server.js
+"""
+
+import argparse
+import logging
+import logging.handlers
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Callable, Deque, Dict, List, Optional, Pattern, Union
+
+# Standard-Ereignisse für Node-Server
+DEFAULT_PATTERNS = {
+    "error": r"(?i)\b(error|exception|unhandled|fatal)\b|❌|EADDRINUSE|ECONNREFUSED",
+    "listening": r"(?i)(running|listening) on port (\d+)",
+    "socketio_warning": r"(?i)socket\.?io.*\b(warn|warning|error|timeout)\b",
+}
+
+
+@dataclass
+class LogLine:
+    """Eine Zeile aus stdout/stderr"""
+    seq: int
+    timestamp: float
+    stream: str
+    text: str
+
+
+@dataclass
+class LogHook:
+    name: str
+    pattern: Optional[Pattern]
+    callback: Callable[[LogLine, Optional[re.Match]], None]
+
+
+class LogPump:
+    """Liest die Ausgabe eines Prozesses in Hintergrund-Threads"""
+
+    def __init__(self, name: str, ring_size: int = 1000,
+                 log_path: Optional[Union[str, Path]] = None,
+                 max_bytes: int = 1024 * 1024, backups: int = 3,
+                 echo: Optional[Callable[[str], None]] = None,
+                 patterns: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.ring: Deque[LogLine] = deque(maxlen=ring_size)
+        self.echo = echo
+        self.counts: Counter = Counter()
+        self._hooks: List[LogHook] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._logger: Optional[logging.Logger] = None
+        self._handler: Optional[logging.Handler] = None
+        if log_path:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+            self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            # Eigener Logger pro Pump, nicht an den Root-Logger weitergeben
+            self._logger = logging.getLogger(f"log_pump.{name}.{id(self)}")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            self._logger.addHandler(self._handler)
+        # Ereignisse, deren Treffer in counts gezählt werden
+        self.patterns = dict(DEFAULT_PATTERNS if patterns is None else patterns)
+        for event, pattern in self.patterns.items():
+            self.on(pattern, lambda line, match: None, name=event)
+
+    # --- Hooks ---
+
+    def on(self, pattern: Optional[str], callback: Callable[[LogLine, Optional[re.Match]], None],
+           name: Optional[str] = None) -> LogHook:
+        """callback(line, match) für jede passende Zeile; pattern None = jede Zeile"""
+        hook = LogHook(name or (pattern or "*"), re.compile(pattern) if pattern else None, callback)
+        with self._lock:
+            self._hooks.append(hook)
+        return hook
+
+    def off(self, hook: LogHook):
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def on_event(self, event: str, callback: Callable[[LogLine, Optional[re.Match]], None]) -> LogHook:
+        """Hook auf eines der Ereignisse (Standard: error, listening, socketio_warning)"""
+        return self.on(self.patterns[event], callback, name=event)
+
+    def wait_for(self, pattern: str, timeout: Optional[float] = None,
+                 include_history: bool = True) -> Optional[LogLine]:
+        """Blockiert bis eine Zeile auf pattern passt; None bei Timeout"""
+        regex = re.compile(self.patterns.get(pattern, pattern))
+        found: List[LogLine] = []
+        event = threading.Event()
+
+        def hit(line: LogLine, match):
+            if not found:
+                found.append(line)
+                event.set()
+
+        hook = self.on(regex.pattern, hit, name=f"wait:{pattern}")
+        try:
+            if include_history:
+                for line in list(self.ring):
+                    if regex.search(line.text):
+                        return line
+            event.wait(timeout)
+            return found[0] if found else None
+        finally:
+            self.off(hook)
+
+    # --- Lesen ---
+
+    def feed(self, text: str, stream: str = "stdout"):
+        """Eine Zeile verarbeiten (auch für Ausgaben, die nicht über attach() kommen)"""
+        text = text.rstrip("\r\n")
+        with self._lock:
+            self._seq += 1
+            line = LogLine(self._seq, time.time(), stream, text)
+            self.ring.append(line)
+            hooks = list(self._hooks)
+        self.counts["lines"] += 1
+        if self._logger:
+            self._logger.info("[%s] %s", stream, text)
+        if self.echo:
+            self.echo(text)
+        counted = set()
+        for hook in hooks:
+            match = None
+            if hook.pattern is not None:
+                match = hook.pattern.search(text)
+                if not match:
+                    continue
+            if hook.name in self.patterns and hook.name not in counted:
+                counted.add(hook.name)
+                self.counts[hook.name] += 1
+            try:
+                hook.callback(line, match)
+            except Exception as e:
+                print(f"⚠️ Log hook '{hook.name}' failed: {e}")
+
+    def _pump(self, stream: IO, label: str):
+        # Text- und Binär-Pipes; leere Zeile = EOF
+        while True:
+            raw = stream.readline()
+            if not raw:
+                break
+            self.feed(raw if isinstance(raw, str) else raw.decode("utf-8", "replace"), label)
+
+    def attach(self, stream: Optional[IO], label: str = "stdout"):
+        """Einen Stream bis EOF in einem Daemon-Thread auslesen"""
+        if stream is None:
+            return
+        thread = threading.Thread(target=self._pump, args=(stream, label),
+                                  name=f"log-pump-{self.name}-{label}", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def attach_process(self, process: subprocess.Popen):
+        """stdout und (falls separat) stderr eines Popen auslesen"""
+        self.attach(process.stdout, "stdout")
+        self.attach(process.stderr, "stderr")
+
+    # --- Auswertung ---
+
+    def tail(self, count: int = 20) -> List[str]:
+        lines = list(self.ring)[-count:] if count else []
+        return [line.text for line in lines]
+
+    def text(self, count: int = 20) -> str:
+        return "\n".join(self.tail(count))
+
+    def matching(self, event: str, count: int = 10) -> List[str]:
+        """Letzte Zeilen aus dem Ring-Puffer, die auf ein Ereignis/Regex passen"""
+        regex = re.compile(self.patterns.get(event, event))
+        return [line.text for line in self.ring if regex.search(line.text)][-count:]
+
+    def close(self, timeout: float = 2.0):
+        """Auf EOF warten (Prozess sollte beendet sein) und die Log-Datei schließen"""
+        for thread in self._threads:
+            thread.join(timeout)
+        if self._handler:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a command and capture its output with event hooks')
+    parser.add_argument('--log', help='Rotating log file')
+    parser.add_argument('--max-bytes', type=int, default=1024 * 1024, help='Rotate after N bytes (default: 1 MB)')
+    parser.add_argument('--tail', type=int, default=20, help='Lines shown after exit (default: 20)')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='Command to run (after --)')
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        parser.error("command required")
+
+    pump = LogPump(Path(command[-1]).name, log_path=args.log, max_bytes=args.max_bytes)
+    pump.on_event("error", lambda line, match: print(f"❌ [{line.stream}] {line.text}"))
+    pump.on_event("listening", lambda line, match: print(f"✅ listening on port {match.group(2)}"))
+    pump.on_event("socketio_warning", lambda line, match: print(f"⚠️ {line.text}"))
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+    pump.attach_process(process)
+    try:
+        exit_code = process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        exit_code = process.wait()
+    pump.close()
+
+    print(f"\n📋 Exit code {exit_code}, {pump.counts['lines']} lines, "
+          f"{pump.counts['error']} errors, {pump.counts['socketio_warning']} Socket.IO warnings")
+    for text in pump.tail(args.tail):
+        print(f"   | {text}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
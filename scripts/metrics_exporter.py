@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Metrics Exporter
+================
+Minimaler OpenMetrics-Exporter (Text-Format) für den Gaming Platform Monitor,
+ohne externe Abhängigkeiten.
+
+Alle Werte sind vor-aggregiert (Counter, Gauges, Histogramme mit festen
+Bucket-Grenzen). Jede Serie cached ihre gerenderten Zeilen und wird nur nach
+einer Änderung neu formatiert - ein Scrape alle 1-5s setzt damit im
+Wesentlichen nur fertige Strings zusammen.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latenz-Buckets in Sekunden (1ms .. 10s)
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _label_string(names: Sequence[str], values: Sequence[str],
+                  extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _MetricFamily:
+    """Gemeinsame Basis: Labels, Serien-Cache, Header"""
+
+    metric_type = "unknown"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help_text: str,
+                 labels: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._values: Dict[LabelValues, object] = {}
+        self._rendered: Dict[LabelValues, str] = {}
+        self._header = (
+            f"# TYPE {name} {self.metric_type}\n"
+            f"# HELP {name} {_escape(help_text)}\n"
+        )
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _invalidate(self, key: LabelValues):
+        self._rendered.pop(key, None)
+
+    def remove(self, **labels):
+        """Serie entfernen (z.B. beendete Game-Session)"""
+        key = self._key(labels)
+        with self.registry.lock:
+            self._values.pop(key, None)
+            self._rendered.pop(key, None)
+
+    def _render_series(self, key: LabelValues) -> str:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        parts = [self._header]
+        for key in self._values:
+            text = self._rendered.get(key)
+            if text is None:
+                text = self._rendered[key] = self._render_series(key)
+            parts.append(text)
+        return "".join(parts)
+
+
+class Gauge(_MetricFamily):
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            if self._values.get(key) != value:
+                self._values[key] = value
+                self._invalidate(key)
+
+    def _render_series(self, key: LabelValues) -> str:
+        labels = _label_string(self.label_names, key)
+        return f"{self.name}{labels} {_format_value(self._values[key])}\n"
+
+
+class Counter(_MetricFamily):
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counter can only increase")
+        key = self._key(labels)
+        with self.registry.lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+            self._invalidate(key)
+
+    def _render_series(self, key: LabelValues) -> str:
+        labels = _label_string(self.label_names, key)
+        return f"{self.name}_total{labels} {_format_value(self._values[key])}\n"
+
+
+class Histogram(_MetricFamily):
+    metric_type = "histogram"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, help_text: str,
+                 labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(registry, name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            state = self._values.get(key)
+            if state is None:
+                # [Bucket-Zähler (nicht kumulativ) ..., +Inf-Zähler], Summe
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+            self._invalidate(key)
+
+    def _render_series(self, key: LabelValues) -> str:
+        counts, total = self._values[key]
+        lines: List[str] = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            labels = _label_string(self.label_names, key, ("le", _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}\n")
+        labels = _label_string(self.label_names, key)
+        lines.append(f"{self.name}_count{labels} {cumulative}\n")
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}\n")
+        return "".join(lines)
+
+
+class MetricsRegistry:
+    """Sammlung aller Metrik-Familien; render() liefert den Scrape-Body"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.families: Dict[str, _MetricFamily] = {}
+
+    def _register(self, family: _MetricFamily) -> _MetricFamily:
+        if family.name in self.families:
+            raise ValueError(f"Duplicate metric family: {family.name}")
+        self.families[family.name] = family
+        return family
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self, name, help_text, labels))
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self, name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        with self.lock:
+            return "".join(family.render() for family in self.families.values()) + "# EOF\n"
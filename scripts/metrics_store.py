@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Metrics Store
+=============
+Eingebetteter, append-only Time-Series-Store für den Gaming Platform Monitor.
+Basiert auf SQLite (nur Standard-Library) und schreibt jede Probe direkt in
+drei Rollup-Stufen (1s / 1m / 1h). Jede Stufe hat ihre eigene Aufbewahrungszeit,
+dadurch bleibt der Platzbedarf auf der Platte begrenzt, während Range-Queries
+über Tage auf der groben Stufe nur wenige hundert Zeilen lesen.
+
+Usage:
+    store = MetricsStore("gaming_metrics.db")
+    store.record("performance.latency", 12.5)
+    store.flush()
+    store.query("performance.latency", since=time.time() - 3600)
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Auflösung in Sekunden pro Rollup-Stufe (fein → grob)
+ROLLUP_RESOLUTIONS: Dict[str, int] = {
+    "1s": 1,
+    "1m": 60,
+    "1h": 3600,
+}
+
+# Aufbewahrung pro Stufe in Sekunden - begrenzt den Platzbedarf
+DEFAULT_RETENTION: Dict[str, int] = {
+    "1s": 6 * 3600,          # 6 Stunden in voller Auflösung
+    "1m": 14 * 24 * 3600,    # 14 Tage Minuten-Rollups
+    "1h": 400 * 24 * 3600,   # ~13 Monate Stunden-Rollups
+}
+
+EVENT_RETENTION = 7 * 24 * 3600
+
+
+class MetricsStore:
+    """Append-only Time-Series-Store mit Downsampling-Rollups"""
+
+    def __init__(self, path: str = "gaming_metrics.db",
+                 retention: Optional[Dict[str, int]] = None,
+                 flush_threshold: int = 500,
+                 compact_interval: int = 300):
+        self.path = path
+        self.retention = dict(DEFAULT_RETENTION)
+        if retention:
+            self.retention.update(retention)
+        self.flush_threshold = flush_threshold
+        self.compact_interval = compact_interval
+
+        # Ein Lock reicht: Web-Mode und Monitoring-Loop teilen sich den Store
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, float, float]] = []
+        self._pending_events: List[Tuple[float, str, str, str]] = []
+        self._series_ids: Dict[str, int] = {}
+        self._last_compact = time.time()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._setup_schema()
+
+    def _setup_schema(self):
+        """Tabellen und Pragmas anlegen"""
+        cur = self._conn.cursor()
+        # auto_vacuum muss vor der ersten Tabelle gesetzt werden
+        cur.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+
+        cur.execute(
+            "CREATE TABLE IF NOT EXISTS series ("
+            " id INTEGER PRIMARY KEY,"
+            " name TEXT UNIQUE NOT NULL)"
+        )
+        for name in ROLLUP_RESOLUTIONS:
+            # WITHOUT ROWID: Daten liegen geclustert nach (series_id, bucket),
+            # eine Range-Query ist damit ein einziger B-Tree-Scan
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS rollup_{name} ("
+                " series_id INTEGER NOT NULL,"
+                " bucket INTEGER NOT NULL,"
+                " count INTEGER NOT NULL,"
+                " sum REAL NOT NULL,"
+                " min REAL NOT NULL,"
+                " max REAL NOT NULL,"
+                " last REAL NOT NULL,"
+                " PRIMARY KEY (series_id, bucket)"
+                ") WITHOUT ROWID"
+            )
+        cur.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " ts REAL NOT NULL,"
+            " level TEXT NOT NULL,"
+            " message TEXT NOT NULL,"
+            " source TEXT NOT NULL)"
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts)")
+        self._conn.commit()
+
+        for series_id, name in cur.execute("SELECT id, name FROM series"):
+            self._series_ids[name] = series_id
+
+    def _series_id(self, cur: sqlite3.Cursor, name: str) -> int:
+        """Series-ID holen oder neu anlegen (Lock muss gehalten werden)"""
+        series_id = self._series_ids.get(name)
+        if series_id is None:
+            cur.execute("INSERT OR IGNORE INTO series(name) VALUES (?)", (name,))
+            series_id = cur.execute(
+                "SELECT id FROM series WHERE name = ?", (name,)
+            ).fetchone()[0]
+            self._series_ids[name] = series_id
+        return series_id
+
+    # =========================================
+    # SCHREIBEN
+    # =========================================
+
+    def record(self, series: str, value: float, ts: Optional[float] = None):
+        """Einzelnen Messwert puffern"""
+        self.record_many([(series, value)], ts)
+
+    def record_many(self, samples: Iterable[Tuple[str, float]],
+                    ts: Optional[float] = None):
+        """Mehrere Messwerte mit gemeinsamem Zeitstempel puffern"""
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            self._pending.extend((name, ts, float(value)) for name, value in samples)
+            should_flush = len(self._pending) >= self.flush_threshold
+        if should_flush:
+            self.flush()
+
+    def record_sample(self, prefix: str, sample: Any, ts: Optional[float] = None):
+        """Numerische Felder einer Datenklasse als eigene Serien speichern"""
+        fields = sample if isinstance(sample, dict) else vars(sample)
+        self.record_many(
+            (
+                (f"{prefix}.{key}", float(value))
+                for key, value in fields.items()
+                if isinstance(value, (int, float, bool))
+            ),
+            ts,
+        )
+
+    def record_event(self, level: str, message: str, source: str = "monitor",
+                     ts: Optional[float] = None):
+        """Activity-Log-Eintrag puffern"""
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            self._pending_events.append((ts, level, message, source))
+
+    def flush(self):
+        """Gepufferte Samples in alle Rollup-Stufen schreiben"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            events, self._pending_events = self._pending_events, []
+            if not pending and not events:
+                return
+
+            cur = self._conn.cursor()
+            rows = [
+                (self._series_id(cur, name), ts, value)
+                for name, ts, value in pending
+            ]
+            for name, resolution in ROLLUP_RESOLUTIONS.items():
+                cur.executemany(
+                    f"INSERT INTO rollup_{name} "
+                    "(series_id, bucket, count, sum, min, max, last) "
+                    "VALUES (?, ?, 1, ?, ?, ?, ?) "
+                    "ON CONFLICT(series_id, bucket) DO UPDATE SET "
+                    " count = count + 1,"
+                    " sum = sum + excluded.sum,"
+                    " min = MIN(min, excluded.min),"
+                    " max = MAX(max, excluded.max),"
+                    " last = excluded.last",
+                    (
+                        (series_id, int(ts // resolution) * resolution,
+                         value, value, value, value)
+                        for series_id, ts, value in rows
+                    ),
+                )
+            if events:
+                cur.executemany(
+                    "INSERT INTO events (ts, level, message, source) VALUES (?, ?, ?, ?)",
+                    events,
+                )
+            self._conn.commit()
+
+        if time.time() - self._last_compact >= self.compact_interval:
+            self.compact()
+
+    def compact(self):
+        """Abgelaufene Rollups löschen und freie Seiten zurückgeben"""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.cursor()
+            for name, keep in self.retention.items():
+                cur.execute(
+                    f"DELETE FROM rollup_{name} WHERE bucket < ?", (int(now - keep),)
+                )
+            cur.execute("DELETE FROM events WHERE ts < ?", (now - EVENT_RETENTION,))
+            self._conn.commit()
+            cur.execute("PRAGMA incremental_vacuum")
+            self._last_compact = now
+
+    # =========================================
+    # LESEN
+    # =========================================
+
+    def series_names(self) -> List[str]:
+        """Alle bekannten Serien"""
+        with self._lock:
+            return sorted(self._series_ids)
+
+    def pick_resolution(self, since: float, until: float, max_points: int = 2000) -> str:
+        """Feinste Rollup-Stufe wählen, die noch abgedeckt ist und max_points einhält"""
+        now = time.time()
+        for name, resolution in ROLLUP_RESOLUTIONS.items():
+            covered = since >= now - self.retention[name]
+            if covered and (until - since) / resolution <= max_points:
+                return name
+        return list(ROLLUP_RESOLUTIONS)[-1]
+
+    def query(self, series: str, since: float, until: Optional[float] = None,
+              resolution: Optional[str] = None,
+              max_points: int = 2000) -> List[Dict[str, float]]:
+        """Range-Query über eine Serie
+
+        Liefert pro Bucket count/avg/min/max/last. Ohne explizite Auflösung wird
+        die feinste Stufe gewählt, die den Zeitraum mit max_points Buckets abdeckt.
+        """
+        until = time.time() if until is None else until
+        resolution = resolution or self.pick_resolution(since, until, max_points)
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        with self._lock:
+            series_id = self._series_ids.get(series)
+            if series_id is None:
+                return []
+            rows = self._conn.execute(
+                f"SELECT bucket, count, sum, min, max, last FROM rollup_{resolution} "
+                "WHERE series_id = ? AND bucket >= ? AND bucket <= ? ORDER BY bucket",
+                (series_id, int(since) - ROLLUP_RESOLUTIONS[resolution] + 1, int(until)),
+            ).fetchall()
+
+        return [
+            {
+                "timestamp": bucket,
+                "count": count,
+                "avg": total / count,
+                "min": low,
+                "max": high,
+                "last": last,
+            }
+            for bucket, count, total, low, high, last in rows
+        ]
+
+    def recent_events(self, limit: int = 100) -> List[Tuple[float, str, str, str]]:
+        """Letzte Activity-Log-Einträge (älteste zuerst)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT ts, level, message, source FROM events ORDER BY ts DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return list(reversed(rows))
+
+    def close(self):
+        """Restliche Samples schreiben und Verbindung schließen"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -9,13 +9,17 @@ Features:
 - Real-time Socket.IO Monitoring
 - Server Health Tracking
 - Database Status Überwachung  
-- Performance Metrics
+- Performance Metrics (p50/p90/p99/p99.9 über 1m/5m/1h)
 - Live Activity Log
 - Stress Testing
-- Web Dashboard (optional)
+- Web Dashboard (optional) inkl. /metrics (OpenMetrics)
+- Persistente Metrik-Historie (SQLite, 1s/1m/1h Rollups)
+- Prozess-Ressourcen (RSS/CPU/Threads/FDs aus /proc, inkl. Kindprozessen)
 
 Usage:
-    python monitor.py [--mode=terminal|web] [--interval=5]
+    python monitor.py [--mode=terminal|web] [--interval=5] [--store=gaming_metrics.db]
+    python monitor.py --history performance.latency --since 12
+    python monitor.py --watch backend=server.js --watch frontend=react-scripts --process-hz 2
 """
 
 import asyncio
@@ -23,16 +27,24 @@ import aiohttp
 import socketio
 import time
 import json
-import threading
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from collections import deque
 import argparse
 import sys
 import os
 
+from metrics_store import MetricsStore
+from probe_scheduler import ProbeScheduler
+from latency_histogram import LatencyTracker
+from metrics_exporter import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsRegistry
+from dashboard_push import DashboardPublisher
+from load_engine import LoadConfig, SocketLoadEngine, raise_fd_limit
+from load_workers import ShardedLoadRunner
+from process_sampler import PROC_AVAILABLE, ProcessSampler, format_tree
+
 # Rich für schöne Terminal-Ausgabe
 try:
     from rich.console import Console
@@ -48,13 +60,8 @@ except ImportError:
     print("⚠️  Rich nicht installiert. Installiere mit: pip install rich")
     RICH_AVAILABLE = False
 
-# Flask für Web-Dashboard (optional)
-try:
-    from flask import Flask, render_template_string, jsonify
-    from flask_socketio import SocketIO as FlaskSocketIO
-    FLASK_AVAILABLE = True
-except ImportError:
-    FLASK_AVAILABLE = False
+# Web-Dashboard läuft auf aiohttp + python-socketio im selben Event-Loop wie der Monitor
+from aiohttp import web
 
 # Datenklassen für Struktur
 @dataclass
@@ -65,6 +72,8 @@ class ServerHealth:
     connected_users: int
     timestamp: str
     response_time: float = 0.0
+    connect_time: float = 0.0
+    ttfb: float = 0.0
 
 @dataclass
 class DatabaseStatus:
@@ -92,6 +101,14 @@ class GameSession:
     active: bool
     timestamp: str
 
+@dataclass
+class RequestTiming:
+    """Aufgeteilte Latenz eines HTTP-Requests (alle Werte in ms)"""
+    connect: float = 0.0      # DNS + TCP-Aufbau, 0 bei Keep-Alive-Reuse
+    ttfb: float = 0.0         # Request gesendet bis Response-Header empfangen
+    total: float = 0.0        # Gesamte Dauer inkl. Body
+    reused: bool = False
+
 @dataclass
 class LogEntry:
     timestamp: str
@@ -103,19 +120,80 @@ class GamingPlatformMonitor:
     """Haupt-Monitor-Klasse für die Gaming Platform"""
     
     def __init__(self, backend_url: str = "http://localhost:3001", 
-                 update_interval: int = 5):
+                 update_interval: int = 5,
+                 store_path: Optional[str] = "gaming_metrics.db",
+                 http_timeout: float = 10.0,
+                 connect_timeout: float = 3.0,
+                 max_connections_per_host: int = 4,
+                 db_interval: Optional[float] = None,
+                 api_interval: float = 30.0,
+                 ping_interval: float = 1.0,
+                 stress_config: Optional[LoadConfig] = None,
+                 stress_workers: int = 1,
+                 watch_processes: Optional[Dict[str, str]] = None,
+                 process_interval: float = 1.0):
         self.backend_url = backend_url
         self.frontend_url = "http://localhost:3000"
         self.update_interval = update_interval
         
+        # Probe-Takte (jede Probe läuft unabhängig im eigenen Intervall)
+        self.db_interval = db_interval or update_interval * 2
+        self.api_interval = api_interval
+        self.ping_interval = ping_interval
+        self.api_probe_paths = ["/api/games", "/api/sessions", "/api/leaderboard"]
+        self.custom_probes: List[tuple] = []
+        self.scheduler: Optional[ProbeScheduler] = None
+        self.background_tasks: Dict[str, asyncio.Task] = {}
+        self.stress_config = stress_config or LoadConfig(clients=100, arrival_rate=20.0, hold_seconds=10.0)
+        # >1: Clients auf Worker-Prozesse verteilen (ein Event-Loop ist CPU-gebunden)
+        self.stress_workers = stress_workers
+        self.last_stress_result: Optional[Dict[str, Any]] = None
+        
+        # Prozess-Ressourcen: Name → PID oder Teil der Kommandozeile
+        self.process_interval = process_interval
+        self.process_sampler = ProcessSampler()
+        for name, target in (watch_processes or {}).items():
+            if str(target).isdigit():
+                self.process_sampler.watch(name, int(target))
+            else:
+                self.process_sampler.watch_pattern(name, target)
+        self.process_stats: Dict[str, Any] = {}
+        
+        # HTTP Connection-Pool (lazy, lebt so lange wie der Monitor)
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.http_timeout = http_timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections_per_host = max_connections_per_host
+        
         # Data Storage
         self.server_health: Optional[ServerHealth] = None
         self.database_status: Optional[DatabaseStatus] = None
         self.performance_metrics: deque = deque(maxlen=100)
         self.game_sessions: Dict[str, GameSession] = {}
         self.activity_log: deque = deque(maxlen=500)
+        # Laufende Zähler für Dashboard-Deltas
+        self.log_seq = 0
+        self.metrics_seq = 0
         self.connected_users: List[str] = []
         
+        # Latenz-Histogramme pro Serie (socketio.ping, http, http./health, ...)
+        self.latency: Dict[str, LatencyTracker] = {}
+        
+        # Vor-aggregierte Metriken für /metrics
+        self.metrics = MetricsRegistry()
+        self.setup_metrics()
+        
+        # Persistente Historie (None = nur In-Memory)
+        self.store: Optional[MetricsStore] = MetricsStore(store_path) if store_path else None
+        if self.store:
+            for ts, level, message, source in self.store.recent_events(self.activity_log.maxlen):
+                self.activity_log.append(LogEntry(
+                    timestamp=datetime.fromtimestamp(ts).strftime("%H:%M:%S"),
+                    level=level,
+                    message=message,
+                    source=source
+                ))
+        
         # Socket.IO Client
         self.sio = socketio.AsyncClient()
         self.is_connected = False
@@ -145,6 +223,41 @@ class GamingPlatformMonitor:
         )
         self.logger = logging.getLogger(__name__)
     
+    def setup_metrics(self):
+        """OpenMetrics-Familien anlegen (werden bei jedem Update direkt gepflegt)"""
+        self.metric_probe_latency = self.metrics.histogram(
+            "retro_probe_latency_seconds", "Probe latency (HTTP TTFB, Socket.IO ping RTT)", ["probe"])
+        self.metric_connected_users = self.metrics.gauge(
+            "retro_connected_users", "Connected users reported by /health")
+        self.metric_uptime = self.metrics.gauge(
+            "retro_backend_uptime_seconds", "Backend uptime reported by /health")
+        self.metric_backend_up = self.metrics.gauge(
+            "retro_backend_up", "1 if the last /health probe succeeded")
+        self.metric_session_players = self.metrics.gauge(
+            "retro_game_session_players", "Players per game session", ["game"])
+        self.metric_socket_connected = self.metrics.gauge(
+            "retro_socketio_connected", "1 if the monitor's Socket.IO client is connected")
+        self.metric_connection_attempts = self.metrics.gauge(
+            "retro_socketio_connection_attempts", "Failed connection attempts since last connect")
+        self.metric_reconnects = self.metrics.counter(
+            "retro_socketio_reconnects", "Socket.IO reconnects after the initial connect")
+        self.metric_connect_errors = self.metrics.counter(
+            "retro_socketio_connect_errors", "Socket.IO connection errors")
+        self.metric_process_rss = self.metrics.gauge(
+            "retro_process_resident_memory_bytes", "Resident memory of a watched process tree", ["process"])
+        self.metric_process_cpu = self.metrics.gauge(
+            "retro_process_cpu_percent", "CPU usage of a watched process tree (100 = one core)", ["process"])
+        self.metric_process_threads = self.metrics.gauge(
+            "retro_process_threads", "Threads of a watched process tree", ["process"])
+        self.metric_process_fds = self.metrics.gauge(
+            "retro_process_open_fds", "Open file descriptors of a watched process tree", ["process"])
+        self.metric_process_up = self.metrics.gauge(
+            "retro_process_up", "1 if the root of a watched process tree is running", ["process"])
+        self.metric_socket_connected.set(0)
+        self.metric_connection_attempts.set(0)
+        self.metric_backend_up.set(0)
+        self.has_connected = False
+    
     def setup_socketio_events(self):
         """Socket.IO Event-Handler einrichten"""
         
@@ -152,29 +265,40 @@ class GamingPlatformMonitor:
         async def connect():
             self.is_connected = True
             self.connection_attempts = 0
+            if self.has_connected:
+                self.metric_reconnects.inc()
+            self.has_connected = True
+            self.metric_socket_connected.set(1)
+            self.metric_connection_attempts.set(0)
             await self.log_event("success", f"Connected to gaming server! Socket ID: {self.sio.sid}")
         
         @self.sio.event
         async def disconnect():
             self.is_connected = False
+            self.metric_socket_connected.set(0)
             await self.log_event("error", "Disconnected from gaming server")
         
         @self.sio.event
         async def connect_error(data):
             self.connection_attempts += 1
+            self.metric_connect_errors.inc()
+            self.metric_connection_attempts.set(self.connection_attempts)
             await self.log_event("error", f"Connection error (attempt {self.connection_attempts}): {data}")
         
         @self.sio.event
         async def player_count(count):
             await self.log_event("info", f"Player count updated: {count}")
             # Update metrics
+            memory, cpu = self.process_sampler.totals()
             metrics = PerformanceMetrics(
                 latency=0,
                 player_count=count,
                 socket_connections=count,
-                timestamp=datetime.now().isoformat()
+                timestamp=datetime.now().isoformat(),
+                memory_usage=memory,
+                cpu_usage=cpu
             )
-            self.performance_metrics.append(metrics)
+            self.add_performance_metrics(metrics)
         
         @self.sio.event
         async def player_joined(data):
@@ -193,17 +317,20 @@ class GamingPlatformMonitor:
         @self.sio.event
         async def pong(data):
             if 'timestamp' in data:
-                latency = time.time() * 1000 - data['timestamp']
-                await self.log_event("info", f"Ping: {latency:.1f}ms")
+                latency = time.perf_counter() * 1000 - data['timestamp']
+                self.record_latency("socketio.ping", latency)
                 
                 # Update metrics
+                memory, cpu = self.process_sampler.totals()
                 metrics = PerformanceMetrics(
                     latency=latency,
                     player_count=len(self.connected_users),
                     socket_connections=len(self.connected_users),
-                    timestamp=datetime.now().isoformat()
+                    timestamp=datetime.now().isoformat(),
+                    memory_usage=memory,
+                    cpu_usage=cpu
                 )
-                self.performance_metrics.append(metrics)
+                self.add_performance_metrics(metrics)
     
     async def log_event(self, level: str, message: str, source: str = "monitor"):
         """Event zum Activity Log hinzufügen"""
@@ -214,6 +341,9 @@ class GamingPlatformMonitor:
             source=source
         )
         self.activity_log.append(entry)
+        self.log_seq += 1
+        if self.store:
+            self.store.record_event(level, message, source)
         
         # Auch ins normale Log
         if level == "error":
@@ -223,6 +353,26 @@ class GamingPlatformMonitor:
         else:
             self.logger.info(message)
     
+    def record_latency(self, name: str, latency_ms: float, export: bool = True):
+        """Latenz in das Sliding-Window-Histogramm der Serie aufnehmen"""
+        tracker = self.latency.get(name)
+        if tracker is None:
+            tracker = self.latency[name] = LatencyTracker()
+        tracker.record(latency_ms)
+        if export:
+            self.metric_probe_latency.observe(latency_ms / 1000, probe=name)
+    
+    def latency_summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Perzentile aller Latenz-Serien über alle Fenster"""
+        return {name: tracker.summary() for name, tracker in self.latency.items()}
+    
+    def add_performance_metrics(self, metrics: PerformanceMetrics):
+        """Performance-Sample im Speicher halten und persistieren"""
+        self.performance_metrics.append(metrics)
+        self.metrics_seq += 1
+        if self.store:
+            self.store.record_sample("performance", metrics)
+    
     def update_game_session(self, game_id: str, player_change: int):
         """Game Session Update"""
         if game_id in self.game_sessions:
@@ -244,50 +394,132 @@ class GamingPlatformMonitor:
                 active=True,
                 timestamp=datetime.now().isoformat()
             )
+        self.metric_session_players.set(self.game_sessions[game_id].player_count, game=game_id)
+    
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """Trace-Hooks, die Connect-Zeit und TTFB pro Request messen"""
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, ctx, params):
+            ctx.start = time.perf_counter()
+            ctx.connect = 0.0
+        
+        async def on_connection_create_start(session, ctx, params):
+            ctx.connect_start = time.perf_counter()
+        
+        async def on_connection_create_end(session, ctx, params):
+            ctx.connect = time.perf_counter() - ctx.connect_start
+        
+        async def on_connection_reuseconn(session, ctx, params):
+            if isinstance(ctx.trace_request_ctx, RequestTiming):
+                ctx.trace_request_ctx.reused = True
+        
+        async def on_request_end(session, ctx, params):
+            # Wird nach Empfang der Response-Header ausgelöst (Body noch nicht gelesen)
+            timing = ctx.trace_request_ctx
+            if isinstance(timing, RequestTiming):
+                timing.connect = ctx.connect * 1000
+                timing.ttfb = (time.perf_counter() - ctx.start - ctx.connect) * 1000
+        
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+    
+    async def get_http_session(self) -> aiohttp.ClientSession:
+        """Gemeinsame Keep-Alive-Session für alle Probes (wird bei Bedarf angelegt)"""
+        if self.http_session is None or self.http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=max(30, self.update_interval * 3),
+                ttl_dns_cache=300
+            )
+            self.http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=self.http_timeout,
+                    sock_connect=self.connect_timeout
+                ),
+                trace_configs=[self.create_trace_config()]
+            )
+        return self.http_session
+    
+    async def close_http_session(self):
+        """Connection-Pool sauber schließen"""
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+    
+    async def timed_get(self, path: str, timeout: Optional[float] = None):
+        """GET über den Pool; liefert (status, json_data, RequestTiming)"""
+        session = await self.get_http_session()
+        timing = RequestTiming()
+        start_time = time.perf_counter()
+        # Ohne explizites Timeout gilt das Session-Timeout
+        kwargs = {'timeout': aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        async with session.get(f"{self.backend_url}{path}", trace_request_ctx=timing,
+                               **kwargs) as response:
+            data = await response.json() if response.status == 200 else None
+        timing.total = (time.perf_counter() - start_time) * 1000
+        self.record_latency(f"http.{path}", timing.ttfb)
+        self.record_latency("http", timing.ttfb, export=False)
+        return response.status, data, timing
     
     async def fetch_server_health(self) -> bool:
         """Server Health von Backend abrufen"""
         try:
-            start_time = time.time()
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.backend_url}/health", timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        response_time = (time.time() - start_time) * 1000
-                        
-                        self.server_health = ServerHealth(
-                            status=data.get('status', 'Unknown'),
-                            uptime=data.get('uptime', 0),
-                            version=data.get('version', 'Unknown'),
-                            connected_users=data.get('connectedUsers', 0),
-                            timestamp=datetime.now().isoformat(),
-                            response_time=response_time
-                        )
-                        return True
+            status, data, timing = await self.timed_get("/health")
+            if status == 200:
+                self.server_health = ServerHealth(
+                    status=data.get('status', 'Unknown'),
+                    uptime=data.get('uptime', 0),
+                    version=data.get('version', 'Unknown'),
+                    connected_users=data.get('connectedUsers', 0),
+                    timestamp=datetime.now().isoformat(),
+                    response_time=timing.total,
+                    connect_time=timing.connect,
+                    ttfb=timing.ttfb
+                )
+                if self.store:
+                    self.store.record_sample("server", self.server_health)
+                    self.store.record("server.up", 1.0 if self.server_health.status == "OK" else 0.0)
+                self.metric_connected_users.set(self.server_health.connected_users)
+                self.metric_uptime.set(self.server_health.uptime)
+                self.metric_backend_up.set(1 if self.server_health.status == "OK" else 0)
+                return True
+            self.metric_backend_up.set(0)
             return False
         except Exception as e:
+            self.metric_backend_up.set(0)
             await self.log_event("error", f"Failed to fetch server health: {e}")
             return False
     
     async def fetch_database_status(self) -> bool:
         """Database Status abrufen"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.backend_url}/health-db", timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        databases = data.get('databases', {})
-                        features = data.get('features', {})
-                        
-                        self.database_status = DatabaseStatus(
-                            postgresql=databases.get('postgresql', 'unknown'),
-                            redis=databases.get('redis', 'unknown'),
-                            user_management=features.get('userManagement', False),
-                            session_management=features.get('sessionManagement', False),
-                            score_tracking=features.get('scoreTracking', False),
-                            timestamp=datetime.now().isoformat()
-                        )
-                        return True
+            status, data, timing = await self.timed_get("/health-db")
+            if status == 200:
+                databases = data.get('databases', {})
+                features = data.get('features', {})
+                
+                self.database_status = DatabaseStatus(
+                    postgresql=databases.get('postgresql', 'unknown'),
+                    redis=databases.get('redis', 'unknown'),
+                    user_management=features.get('userManagement', False),
+                    session_management=features.get('sessionManagement', False),
+                    score_tracking=features.get('scoreTracking', False),
+                    timestamp=datetime.now().isoformat()
+                )
+                if self.store:
+                    self.store.record_sample("database", self.database_status)
+                    self.store.record_many([
+                        ("database.postgresql_up", self.database_status.postgresql == "connected"),
+                        ("database.redis_up", self.database_status.redis == "connected"),
+                        ("database.ttfb", timing.ttfb),
+                    ])
+                return True
             return False
         except Exception as e:
             await self.log_event("error", f"Failed to fetch database status: {e}")
@@ -306,37 +538,56 @@ class GamingPlatformMonitor:
         """Ping zum Server senden"""
         if self.is_connected:
             try:
-                await self.sio.emit('ping', time.time() * 1000)
+                # Monotone Uhr: der Server spiegelt den Wert nur zurück
+                await self.sio.emit('ping', time.perf_counter() * 1000)
             except Exception as e:
                 await self.log_event("error", f"Ping failed: {e}")
     
-    async def run_stress_test(self, num_connections: int = 10):
-        """Stress Test mit mehreren Verbindungen"""
-        await self.log_event("warning", f"Starting stress test with {num_connections} connections...")
-        
-        test_clients = []
-        for i in range(num_connections):
-            try:
-                client = socketio.AsyncClient()
-                await client.connect(self.backend_url)
-                test_clients.append(client)
-                await self.log_event("success", f"Stress test client {i+1} connected")
-                await asyncio.sleep(0.2)  # Kleine Pause zwischen Verbindungen
-            except Exception as e:
-                await self.log_event("error", f"Stress test client {i+1} failed: {e}")
-        
-        # 10 Sekunden warten
-        await asyncio.sleep(10)
-        
-        # Alle Test-Clients disconnecten
-        for i, client in enumerate(test_clients):
-            try:
-                await client.disconnect()
-                await self.log_event("warning", f"Stress test client {i+1} disconnected")
-            except Exception as e:
-                await self.log_event("error", f"Failed to disconnect test client {i+1}: {e}")
+    async def run_stress_test(self, num_connections: Optional[int] = None,
+                              progress=None, **overrides):
+        """Stress Test: Ramp-up / Hold / Teardown über die SocketLoadEngine"""
+        config = replace(self.stress_config, url=self.backend_url, **overrides)
+        if num_connections is not None:
+            config.clients = num_connections
+        await self.log_event("warning", f"Starting stress test: {config.clients} clients @ "
+                                        f"{config.arrival_rate:g}/s, hold {config.hold_seconds:g}s, "
+                                        f"{self.stress_workers} worker(s)")
+        
+        async def on_progress(state):
+            if progress:
+                await progress({'task': 'stress_test', 'status': 'progress', **state})
+        
+        if self.stress_workers > 1:
+            engine = ShardedLoadRunner(config, workers=self.stress_workers, progress=on_progress)
+        else:
+            engine = SocketLoadEngine(config, progress=on_progress)
+        result = await engine.run()
+        summary = result.summary()
+        self.last_stress_result = summary
+        
+        connect = summary['connect_latency_ms']
+        lag = summary['player_count_lag_ms']
+        level = "success" if not result.failed else "warning"
+        await self.log_event(level, f"Stress test: {result.connected}/{result.attempted} connected "
+                                    f"({summary['success_rate']}%) | connect p50 {connect['p50']:.0f}ms "
+                                    f"p99 {connect['p99']:.0f}ms")
+        if lag['count']:
+            await self.log_event("info", f"player-count lag p50 {lag['p50']:.0f}ms p99 {lag['p99']:.0f}ms | "
+                                         f"max divergence {summary['max_count_divergence']}")
+        for reason, count in summary['failure_reasons'].items():
+            await self.log_event("error", f"Stress test failures: {count}x {reason}")
+        
+        if self.store:
+            self.store.record_sample("stress", {
+                'connected': result.connected,
+                'failed': result.failed,
+                'connect_p50': connect['p50'],
+                'connect_p99': connect['p99'],
+                'player_count_lag_p99': lag['p99'],
+            })
         
         await self.log_event("info", "Stress test completed")
+        return summary
     
     async def run_api_tests(self):
         """API Endpunkte testen"""
@@ -349,27 +600,25 @@ class GamingPlatformMonitor:
             ("/api/status", "Status API")
         ]
         
-        async with aiohttp.ClientSession() as session:
-            for endpoint, name in endpoints:
-                try:
-                    async with session.get(f"{self.backend_url}{endpoint}", timeout=5) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if 'availableGames' in data:
-                                count = len(data['availableGames'])
-                                await self.log_event("success", f"{name}: {count} games found")
-                            elif 'leaderboard' in data:
-                                count = len(data['leaderboard'])
-                                await self.log_event("success", f"{name}: {count} entries")
-                            elif 'sessions' in data:
-                                count = len(data['sessions'])
-                                await self.log_event("success", f"{name}: {count} active sessions")
-                            else:
-                                await self.log_event("success", f"{name}: OK")
-                        else:
-                            await self.log_event("error", f"{name}: HTTP {response.status}")
-                except Exception as e:
-                    await self.log_event("error", f"{name}: {e}")
+        for endpoint, name in endpoints:
+            try:
+                status, data, timing = await self.timed_get(endpoint, timeout=5)
+                if status == 200:
+                    if 'availableGames' in data:
+                        count = len(data['availableGames'])
+                        await self.log_event("success", f"{name}: {count} games found ({timing.ttfb:.1f}ms)")
+                    elif 'leaderboard' in data:
+                        count = len(data['leaderboard'])
+                        await self.log_event("success", f"{name}: {count} entries ({timing.ttfb:.1f}ms)")
+                    elif 'sessions' in data:
+                        count = len(data['sessions'])
+                        await self.log_event("success", f"{name}: {count} active sessions ({timing.ttfb:.1f}ms)")
+                    else:
+                        await self.log_event("success", f"{name}: OK ({timing.ttfb:.1f}ms)")
+                else:
+                    await self.log_event("error", f"{name}: HTTP {status}")
+            except Exception as e:
+                await self.log_event("error", f"{name}: {e}")
         
         await self.log_event("info", "API tests completed")
     
@@ -391,9 +640,10 @@ class GamingPlatformMonitor:
         )
         
         layout["left"].split_column(
-            Layout(name="server", size=8),
+            Layout(name="server", size=10),
             Layout(name="database", size=8),
-            Layout(name="performance", size=8)
+            Layout(name="performance", size=8),
+            Layout(name="latency", size=12)
         )
         
         layout["right"].split_column(
@@ -425,7 +675,8 @@ class GamingPlatformMonitor:
             server_table.add_row("Uptime", uptime_str)
             server_table.add_row("Version", self.server_health.version)
             server_table.add_row("Users", str(self.server_health.connected_users))
-            server_table.add_row("Response", f"{self.server_health.response_time:.1f}ms")
+            server_table.add_row("Backend (TTFB)", f"{self.server_health.ttfb:.1f}ms")
+            server_table.add_row("Connect", f"{self.server_health.connect_time:.1f}ms")
             
             layout["server"].update(server_table)
         
@@ -456,9 +707,30 @@ class GamingPlatformMonitor:
             perf_table.add_row("Players", str(latest.player_count))
             perf_table.add_row("Connections", str(latest.socket_connections))
             perf_table.add_row("Latency", f"{latest.latency:.1f}ms")
+            for tree in self.process_stats.values():
+                perf_table.add_row(tree.name, format_tree(tree).split(": ", 1)[1])
             
             layout["performance"].update(perf_table)
         
+        # Latenz-Perzentile
+        latency_table = Table(title="📈 Latency Percentiles (ms)", box=box.ROUNDED)
+        latency_table.add_column("Series", style="cyan")
+        for column in ("p50", "p90", "p99", "p99.9", "max", "n"):
+            latency_table.add_column(column, style="yellow", justify="right")
+        
+        for name, label in (("socketio.ping", "Ping"), ("http", "HTTP")):
+            tracker = self.latency.get(name)
+            if not tracker:
+                continue
+            for window, stats in tracker.summary().items():
+                latency_table.add_row(
+                    f"{label} {window}",
+                    *(f"{stats[key]:.1f}" for key in ("p50", "p90", "p99", "p99.9", "max")),
+                    str(stats["count"])
+                )
+        
+        layout["latency"].update(latency_table)
+        
         # Game Sessions
         games_table = Table(title="🎮 Game Sessions", box=box.ROUNDED)
         games_table.add_column("Game", style="cyan")
@@ -510,6 +782,8 @@ class GamingPlatformMonitor:
         if self.performance_metrics:
             latest = self.performance_metrics[-1]
             print(f"Performance: {latest.player_count} players | {latest.latency:.1f}ms latency")
+        for tree in self.process_stats.values():
+            print(f"Process {format_tree(tree)}")
         
         # Recent logs
         print("\nRecent Activity:")
@@ -518,38 +792,116 @@ class GamingPlatformMonitor:
         
         print("\nPress 's' for stress test, 'a' for API test, 'q' to quit")
     
+    def add_probe(self, name: str, func, interval: float,
+                  timeout: Optional[float] = None, jitter: float = 0.1):
+        """Eigene Probe registrieren (async Callable ohne Argumente)
+
+        Auch während des Monitorings möglich (aus dem Event-Loop, z.B. aus einer Probe) -
+        die Probe läuft dann sofort im eigenen Takt mit.
+        """
+        self.custom_probes.append((name, func, interval, timeout, jitter))
+        if self.scheduler:
+            self.scheduler.add(name, func, interval, timeout, jitter)
+    
+    async def probe_api_endpoint(self, path: str):
+        """Leichtgewichtige API-Probe: nur Fehler werden geloggt"""
+        try:
+            status, _, timing = await self.timed_get(path, timeout=5)
+        except Exception as e:
+            await self.log_event("error", f"API probe {path}: {e}")
+            return
+        if status != 200:
+            await self.log_event("error", f"API probe {path}: HTTP {status}")
+        if self.store:
+            self.store.record(f"api.{path.strip('/').replace('/', '_')}.ttfb", timing.ttfb)
+    
+    async def sample_processes(self):
+        """RSS/CPU/Threads/FDs der beobachteten Prozessbäume (liest nur /proc, kein Subprozess)"""
+        previous = self.process_stats
+        samples = self.process_sampler.sample()
+        for name, tree in samples.items():
+            self.metric_process_up.set(1 if tree.alive else 0, process=name)
+            was_alive = previous[name].alive if name in previous else None
+            if was_alive and not tree.alive:
+                await self.log_event("error", f"Process '{name}' (PID {tree.root_pid}) is gone")
+            elif was_alive is False and tree.alive:
+                await self.log_event("success", f"Process '{name}' running again (PID {tree.root_pid})")
+            if not tree.alive:
+                continue
+            self.metric_process_rss.set(tree.rss_mb * 1024 * 1024, process=name)
+            self.metric_process_cpu.set(tree.cpu_percent, process=name)
+            self.metric_process_threads.set(tree.threads, process=name)
+            self.metric_process_fds.set(tree.fds, process=name)
+            if self.store:
+                self.store.record_sample(f"process.{name}", {
+                    "rss_mb": tree.rss_mb,
+                    "cpu_percent": tree.cpu_percent,
+                    "threads": tree.threads,
+                    "fds": tree.fds,
+                    "processes": tree.processes,
+                })
+        # Neues Dict pro Sample - das Dashboard erkennt Änderungen an der Identität
+        self.process_stats = samples
+    
+    async def flush_store(self):
+        """Historie schreiben (ein Commit für alle Samples seit dem letzten Flush)"""
+        if self.store:
+            self.store.flush()
+    
+    async def on_probe_error(self, probe, error: BaseException):
+        """Fehler- und Timeout-Callback des Schedulers"""
+        if isinstance(error, asyncio.TimeoutError):
+            await self.log_event("warning", f"Probe '{probe.name}' exceeded {probe.deadline:.1f}s deadline")
+        else:
+            await self.log_event("error", f"Probe '{probe.name}' failed: {error}")
+    
+    def build_scheduler(self) -> ProbeScheduler:
+        """Scheduler mit Standard-Probes und eigenen Probes aufbauen"""
+        scheduler = ProbeScheduler(on_error=self.on_probe_error)
+        scheduler.add("health", self.fetch_server_health, self.update_interval)
+        scheduler.add("database", self.fetch_database_status, self.db_interval)
+        scheduler.add("ping", self.send_ping, self.ping_interval)
+        for path in self.api_probe_paths:
+            scheduler.add(f"api:{path}", lambda path=path: self.probe_api_endpoint(path),
+                          self.api_interval)
+        if PROC_AVAILABLE and self.process_sampler.roots:
+            scheduler.add("processes", self.sample_processes, self.process_interval, jitter=0)
+        scheduler.add("store_flush", self.flush_store, 1.0, jitter=0)
+        for name, func, interval, timeout, jitter in self.custom_probes:
+            scheduler.add(name, func, interval, timeout, jitter)
+        return scheduler
+    
+    def stop(self):
+        """Monitoring beenden"""
+        self.running = False
+        if self.scheduler:
+            self.scheduler.stop()
+    
     async def monitoring_loop(self):
-        """Haupt-Monitoring-Loop"""
+        """Haupt-Monitoring-Loop: alle Probes laufen nebenläufig im eigenen Takt"""
         self.running = True
         await self.log_event("info", "Starting monitoring loop...")
         
         # Socket.IO Connection versuchen
         await self.connect_socketio()
         
-        while self.running:
-            try:
-                # Data Updates
-                await self.fetch_server_health()
-                await self.fetch_database_status()
-                
-                # Ping senden
-                await self.send_ping()
-                
-                # Kurz warten
-                await asyncio.sleep(self.update_interval)
-                
-            except KeyboardInterrupt:
-                await self.log_event("info", "Monitoring stopped by user")
-                break
-            except Exception as e:
-                await self.log_event("error", f"Monitoring loop error: {e}")
-                await asyncio.sleep(5)  # Längere Pause bei Fehlern
-        
-        # Cleanup
-        if self.is_connected:
-            await self.sio.disconnect()
-        
-        await self.log_event("info", "Monitoring stopped")
+        self.scheduler = self.build_scheduler()
+        try:
+            await self.scheduler.run()
+        except asyncio.CancelledError:
+            await self.log_event("info", "Monitoring stopped by user")
+        finally:
+            self.running = False
+            self.scheduler = None
+            
+            # Cleanup
+            if self.is_connected:
+                await self.sio.disconnect()
+            
+            await self.close_http_session()
+            await self.log_event("info", "Monitoring stopped")
+            if self.store:
+                self.store.flush()
     
     async def start_terminal_mode(self):
         """Terminal-basiertes Monitoring starten"""
@@ -579,51 +931,99 @@ class GamingPlatformMonitor:
                 simple_display()
             )
     
-    def start_web_mode(self, port: int = 5000):
-        """Web-basiertes Dashboard starten"""
-        if not FLASK_AVAILABLE:
-            print("❌ Flask nicht installiert. Installiere mit: pip install flask flask-socketio")
-            return
-        
-        app = Flask(__name__)
-        app.config['SECRET_KEY'] = 'gaming-monitor-secret'
-        socketio_web = FlaskSocketIO(app, cors_allowed_origins="*")
-        
-        @app.route('/')
-        def dashboard():
-            return render_template_string(WEB_DASHBOARD_HTML)
-        
-        @app.route('/api/status')
-        def api_status():
-            return jsonify({
-                'server_health': asdict(self.server_health) if self.server_health else None,
-                'database_status': asdict(self.database_status) if self.database_status else None,
-                'performance_metrics': [asdict(m) for m in list(self.performance_metrics)[-10:]],
-                'game_sessions': {k: asdict(v) for k, v in self.game_sessions.items()},
-                'activity_log': [asdict(entry) for entry in list(self.activity_log)[-20:]],
-                'is_connected': self.is_connected
-            })
-        
-        @socketio_web.on('stress_test')
-        def handle_stress_test():
-            asyncio.create_task(self.run_stress_test())
-        
-        @socketio_web.on('api_test')
-        def handle_api_test():
-            asyncio.create_task(self.run_api_tests())
-        
-        print(f"🌐 Web Dashboard starting on http://localhost:{port}")
-        
-        # Monitoring in separatem Thread
-        def run_monitoring():
-            asyncio.run(self.monitoring_loop())
-        
-        monitor_thread = threading.Thread(target=run_monitoring)
-        monitor_thread.daemon = True
-        monitor_thread.start()
+    def schedule_task(self, name: str, coro_factory, on_progress=None) -> bool:
+        """Hintergrund-Task im Monitor-Loop starten (höchstens einer pro Name)"""
+        task = self.background_tasks.get(name)
+        if task and not task.done():
+            return False
         
-        # Web Server starten
-        socketio_web.run(app, host='0.0.0.0', port=port, debug=False)
+        async def runner():
+            started = time.monotonic()
+            if on_progress:
+                await on_progress({'task': name, 'status': 'started'})
+            try:
+                await coro_factory()
+                status = {'task': name, 'status': 'completed'}
+            except asyncio.CancelledError:
+                status = {'task': name, 'status': 'cancelled'}
+                raise
+            except Exception as e:
+                await self.log_event("error", f"Task {name} failed: {e}")
+                status = {'task': name, 'status': 'failed', 'error': str(e)}
+            finally:
+                if on_progress:
+                    status['duration'] = round(time.monotonic() - started, 2)
+                    await on_progress(status)
+        
+        self.background_tasks[name] = asyncio.create_task(runner())
+        return True
+    
+    async def start_web_mode(self, port: int = 5000, frame_budget: float = 0.25):
+        """Web-basiertes Dashboard starten (aiohttp + Socket.IO im Monitor-Loop)"""
+        web_sio = socketio.AsyncServer(async_mode='aiohttp', cors_allowed_origins='*')
+        app = web.Application()
+        web_sio.attach(app)
+        publisher = DashboardPublisher(self, frame_budget=frame_budget)
+        
+        async def dashboard(request):
+            return web.Response(text=WEB_DASHBOARD_HTML, content_type='text/html')
+        
+        async def metrics(request):
+            return web.Response(body=self.metrics.render().encode('utf-8'),
+                                headers={'Content-Type': METRICS_CONTENT_TYPE})
+        
+        async def api_status(request):
+            return web.json_response(publisher.snapshot())
+        
+        app.router.add_get('/', dashboard)
+        app.router.add_get('/metrics', metrics)
+        app.router.add_get('/api/status', api_status)
+        
+        @web_sio.event
+        async def connect(sid, environ, auth=None):
+            # Voller Snapshot nur für den neuen Client, danach nur noch Deltas
+            await web_sio.emit('snapshot', publisher.snapshot(), to=sid)
+        
+        async def task_progress(progress):
+            await web_sio.emit('task_progress', progress)
+        
+        @web_sio.event
+        async def stress_test(sid, data=None):
+            # Optionale Overrides vom Dashboard: {clients, arrival_rate, hold_seconds}
+            overrides = {key: data[key] for key in ('clients', 'arrival_rate', 'hold_seconds')
+                         if isinstance(data, dict) and key in data}
+            if not self.schedule_task('stress_test',
+                                      lambda: self.run_stress_test(progress=task_progress, **overrides),
+                                      task_progress):
+                await web_sio.emit('task_progress', {'task': 'stress_test', 'status': 'busy'}, to=sid)
+        
+        @web_sio.event
+        async def api_test(sid, data=None):
+            if not self.schedule_task('api_test', self.run_api_tests, task_progress):
+                await web_sio.emit('task_progress', {'task': 'api_test', 'status': 'busy'}, to=sid)
+        
+        async def push_deltas():
+            """Änderungen pro Frame sammeln und einmal an alle Clients broadcasten"""
+            while True:
+                await asyncio.sleep(frame_budget)
+                delta = publisher.collect_delta(time.monotonic())
+                if delta:
+                    await web_sio.emit('delta', delta)
+        
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, '0.0.0.0', port).start()
+        print(f"🌐 Web Dashboard running on http://localhost:{port}")
+        
+        push_task = asyncio.create_task(push_deltas())
+        try:
+            await self.monitoring_loop()
+        finally:
+            push_task.cancel()
+            for task in self.background_tasks.values():
+                task.cancel()
+            await asyncio.gather(push_task, *self.background_tasks.values(), return_exceptions=True)
+            await runner.cleanup()
 
 # Web Dashboard HTML Template
 WEB_DASHBOARD_HTML = """
@@ -661,6 +1061,14 @@ WEB_DASHBOARD_HTML = """
             <h3>⚡ Performance</h3>
             <div id="performance"></div>
         </div>
+        <div class="card">
+            <h3>🧠 Processes</h3>
+            <div id="processes"></div>
+        </div>
+        <div class="card">
+            <h3>📈 Latency Percentiles</h3>
+            <div id="latency"></div>
+        </div>
         <div class="card">
             <h3>🎮 Game Sessions</h3>
             <div id="game-sessions"></div>
@@ -670,23 +1078,66 @@ WEB_DASHBOARD_HTML = """
             <div class="log" id="activity-log"></div>
             <button onclick="runStressTest()">Stress Test</button>
             <button onclick="runAPITest()">API Test</button>
+            <span id="task-status"></span>
         </div>
     </div>
 
     <script>
         const socket = io();
-        
-        function updateDashboard() {
-            fetch('/api/status')
-                .then(response => response.json())
-                .then(data => {
-                    updateServerStatus(data.server_health);
-                    updateDatabaseStatus(data.database_status);
-                    updatePerformance(data.performance_metrics);
-                    updateGameSessions(data.game_sessions);
-                    updateActivityLog(data.activity_log);
-                });
-        }
+        const MAX_LOG_ENTRIES = 50;
+        let state = null;
+        
+        // Voller Zustand beim Verbinden
+        socket.on('snapshot', data => {
+            state = data;
+            updateServerStatus(state.server_health);
+            updateDatabaseStatus(state.database_status);
+            updatePerformance(state.performance_metrics);
+            updateLatency(state.latency);
+            updateProcesses(state.processes);
+            updateGameSessions(state.game_sessions);
+            updateActivityLog(state.activity_log);
+        });
+        
+        // Danach nur geänderte Felder
+        socket.on('delta', delta => {
+            if (!state) return;
+            if ('server_health' in delta) {
+                state.server_health = delta.server_health;
+                updateServerStatus(state.server_health);
+            }
+            if ('database_status' in delta) {
+                state.database_status = delta.database_status;
+                updateDatabaseStatus(state.database_status);
+            }
+            if (delta.performance_metrics) {
+                state.performance_metrics = state.performance_metrics.concat(delta.performance_metrics).slice(-10);
+                updatePerformance(state.performance_metrics);
+            }
+            if (delta.latency) {
+                state.latency = delta.latency;
+                updateLatency(state.latency);
+            }
+            if (delta.processes) {
+                state.processes = delta.processes;
+                updateProcesses(state.processes);
+            }
+            if (delta.game_sessions) {
+                for (const [gameId, session] of Object.entries(delta.game_sessions)) {
+                    if (session === null) delete state.game_sessions[gameId];
+                    else state.game_sessions[gameId] = session;
+                }
+                updateGameSessions(state.game_sessions);
+            }
+            if (delta.activity_log) {
+                // Einträge, die schon im Snapshot waren, überspringen
+                const firstSeq = delta.activity_log_seq - delta.activity_log.length + 1;
+                const fresh = delta.activity_log.filter((_, i) => firstSeq + i > state.activity_log_seq);
+                state.activity_log_seq = delta.activity_log_seq;
+                state.activity_log = state.activity_log.concat(fresh).slice(-MAX_LOG_ENTRIES);
+                updateActivityLog(state.activity_log);
+            }
+        });
         
         function updateServerStatus(health) {
             const container = document.getElementById('server-status');
@@ -697,7 +1148,8 @@ WEB_DASHBOARD_HTML = """
                     <div class="metric"><span>Uptime:</span><span>${uptime}</span></div>
                     <div class="metric"><span>Version:</span><span>${health.version}</span></div>
                     <div class="metric"><span>Users:</span><span>${health.connected_users}</span></div>
-                    <div class="metric"><span>Response:</span><span>${health.response_time.toFixed(1)}ms</span></div>
+                    <div class="metric"><span>Backend (TTFB):</span><span>${health.ttfb.toFixed(1)}ms</span></div>
+                    <div class="metric"><span>Connect:</span><span>${health.connect_time.toFixed(1)}ms</span></div>
                 `;
             } else {
                 container.innerHTML = '<div class="status-error">No data available</div>';
@@ -730,12 +1182,45 @@ WEB_DASHBOARD_HTML = """
                     <div class="metric"><span>Players:</span><span class="status-good">${latest.player_count}</span></div>
                     <div class="metric"><span>Connections:</span><span class="status-good">${latest.socket_connections}</span></div>
                     <div class="metric"><span>Latency:</span><span class="${latencyClass}">${latest.latency.toFixed(1)}ms</span></div>
+                    <div class="metric"><span>Memory:</span><span>${latest.memory_usage.toFixed(1)}MB</span></div>
+                    <div class="metric"><span>CPU:</span><span>${latest.cpu_usage.toFixed(0)}%</span></div>
                 `;
             } else {
                 container.innerHTML = '<div class="status-error">No performance data</div>';
             }
         }
         
+        function updateLatency(latency) {
+            const container = document.getElementById('latency');
+            const labels = {'socketio.ping': 'Ping', 'http': 'HTTP'};
+            let html = '<table style="width:100%"><tr><th></th><th>p50</th><th>p90</th><th>p99</th><th>p99.9</th><th>max</th></tr>';
+            for (const [name, label] of Object.entries(labels)) {
+                if (!latency || !latency[name]) continue;
+                for (const [windowName, stats] of Object.entries(latency[name])) {
+                    const p99Class = stats.p99 < 50 ? 'status-good' : stats.p99 < 100 ? 'status-warning' : 'status-error';
+                    html += `<tr><td>${label} ${windowName}</td><td>${stats.p50.toFixed(1)}</td><td>${stats.p90.toFixed(1)}</td>` +
+                            `<td class="${p99Class}">${stats.p99.toFixed(1)}</td><td>${stats['p99.9'].toFixed(1)}</td><td>${stats.max.toFixed(1)}</td></tr>`;
+                }
+            }
+            container.innerHTML = html + '</table>';
+        }
+        
+        function updateProcesses(processes) {
+            const container = document.getElementById('processes');
+            let html = '';
+            for (const [name, tree] of Object.entries(processes || {})) {
+                if (!tree.alive) {
+                    html += `<div class="metric"><span>${name}:</span><span class="status-error">not running</span></div>`;
+                    continue;
+                }
+                const cpuClass = tree.cpu_percent < 50 ? 'status-good' : tree.cpu_percent < 90 ? 'status-warning' : 'status-error';
+                html += `<div class="metric"><span>${name} (${tree.processes} proc):</span>` +
+                        `<span>${tree.rss_mb.toFixed(1)}MB | <span class="${cpuClass}">${tree.cpu_percent.toFixed(0)}%</span> | ` +
+                        `${tree.threads} thr | ${tree.fds} fds</span></div>`;
+            }
+            container.innerHTML = html || '<div class="status-warning">No watched processes</div>';
+        }
+        
         function updateGameSessions(sessions) {
             const container = document.getElementById('game-sessions');
             let html = '';
@@ -758,6 +1243,18 @@ WEB_DASHBOARD_HTML = """
             container.scrollTop = container.scrollHeight;
         }
         
+        // Fortschritt von Stress-/API-Tests
+        socket.on('task_progress', progress => {
+            if (progress.status === 'progress') {
+                document.getElementById('task-status').textContent =
+                    `${progress.task}: ${progress.phase} - ${progress.connected}/${progress.target} connected, ${progress.failed} failed`;
+                return;
+            }
+            const labels = {started: '⏳ running', completed: '✅ done', failed: '❌ failed', busy: '⚠️ already running', cancelled: '⏹️ cancelled'};
+            const duration = progress.duration !== undefined ? ` (${progress.duration}s)` : '';
+            document.getElementById('task-status').textContent = `${progress.task}: ${labels[progress.status] || progress.status}${duration}`;
+        });
+        
         function runStressTest() {
             socket.emit('stress_test');
         }
@@ -766,14 +1263,31 @@ WEB_DASHBOARD_HTML = """
             socket.emit('api_test');
         }
         
-        // Auto-update every 5 seconds
-        setInterval(updateDashboard, 5000);
-        updateDashboard(); // Initial load
     </script>
 </body>
 </html>
 """
 
+def print_history(store_path: str, series: str, since_hours: float):
+    """Gespeicherte Historie einer Serie ausgeben"""
+    store = MetricsStore(store_path)
+    try:
+        since = time.time() - since_hours * 3600
+        points = store.query(series, since=since, max_points=120)
+        if not points:
+            print(f"❌ Keine Daten für '{series}' in den letzten {since_hours}h")
+            print(f"Verfügbare Serien: {', '.join(store.series_names()) or '-'}")
+            return 1
+        
+        print(f"📈 {series} - letzte {since_hours}h ({len(points)} Buckets)")
+        print(f"{'Zeit':<20} {'Avg':>10} {'Min':>10} {'Max':>10} {'N':>6}")
+        for point in points:
+            when = datetime.fromtimestamp(point['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{when:<20} {point['avg']:>10.1f} {point['min']:>10.1f} {point['max']:>10.1f} {point['count']:>6}")
+        return 0
+    finally:
+        store.close()
+
 def main():
     """Haupt-Funktion mit Argument-Parsing"""
     parser = argparse.ArgumentParser(description='Gaming Platform Monitor')
@@ -785,9 +1299,46 @@ def main():
                        help='Backend URL (default: http://localhost:3001)')
     parser.add_argument('--port', type=int, default=5000,
                        help='Web dashboard port (default: 5000)')
+    parser.add_argument('--db-interval', type=float, default=None,
+                       help='Database probe interval in seconds (default: 2x interval)')
+    parser.add_argument('--api-interval', type=float, default=30.0,
+                       help='API endpoint probe interval in seconds (default: 30)')
+    parser.add_argument('--frame-budget', type=float, default=0.25,
+                       help='Web mode: coalesce dashboard updates per frame in seconds (default: 0.25)')
+    parser.add_argument('--ping-interval', type=float, default=1.0,
+                       help='Socket.IO ping interval in seconds (default: 1)')
+    parser.add_argument('--http-timeout', type=float, default=10.0,
+                       help='Total timeout per HTTP probe in seconds (default: 10)')
+    parser.add_argument('--max-conn-per-host', type=int, default=4,
+                       help='Keep-alive connection pool size per host (default: 4)')
+    parser.add_argument('--stress-clients', type=int, default=100,
+                       help='Stress test: simulated players (default: 100)')
+    parser.add_argument('--stress-rate', type=float, default=20.0,
+                       help='Stress test: new connections per second (default: 20)')
+    parser.add_argument('--stress-concurrency', type=int, default=200,
+                       help='Stress test: max concurrent handshakes (default: 200)')
+    parser.add_argument('--stress-workers', type=int, default=1,
+                       help='Stress test: worker processes to shard clients across (default: 1)')
+    parser.add_argument('--stress-hold', type=float, default=10.0,
+                       help='Stress test: hold duration in seconds (default: 10)')
+    parser.add_argument('--watch', action='append', metavar='NAME=PID|PATTERN',
+                       help='Process tree to sample from /proc (default: backend=server.js); repeatable')
+    parser.add_argument('--process-hz', type=float, default=1.0,
+                       help='Process sampling rate, 0.1-10 Hz (default: 1)')
+    parser.add_argument('--store', default='gaming_metrics.db',
+                       help='Metrics history database (default: gaming_metrics.db)')
+    parser.add_argument('--no-store', action='store_true',
+                       help='Disable persistent metrics history')
+    parser.add_argument('--history', metavar='SERIES',
+                       help='Print stored history of a series (e.g. performance.latency) and exit')
+    parser.add_argument('--since', type=float, default=12,
+                       help='History window in hours for --history (default: 12)')
     
     args = parser.parse_args()
     
+    if args.history:
+        return print_history(args.store, args.history, args.since)
+    
     # Banner anzeigen
     print("="*60)
     print("🎮 Gaming Platform Monitor v1.0")
@@ -795,6 +1346,7 @@ def main():
     print(f"Mode: {args.mode}")
     print(f"Backend: {args.backend}")
     print(f"Update Interval: {args.interval}s")
+    print(f"History: {'disabled' if args.no_store else args.store}")
     if args.mode == 'web':
         print(f"Web Dashboard: http://localhost:{args.port}")
     print("="*60)
@@ -803,18 +1355,36 @@ def main():
     missing_deps = []
     if args.mode == 'terminal' and not RICH_AVAILABLE:
         missing_deps.append("rich")
-    if args.mode == 'web' and not FLASK_AVAILABLE:
-        missing_deps.extend(["flask", "flask-socketio"])
     
     if missing_deps:
         print(f"❌ Missing dependencies: {', '.join(missing_deps)}")
         print(f"Install with: pip install {' '.join(missing_deps)}")
         return 1
     
+    # Ein Socket pro simuliertem Spieler im Stress Test
+    raise_fd_limit()
+    
     # Monitor erstellen und starten
     monitor = GamingPlatformMonitor(
         backend_url=args.backend,
-        update_interval=args.interval
+        update_interval=args.interval,
+        store_path=None if args.no_store else args.store,
+        http_timeout=args.http_timeout,
+        max_connections_per_host=args.max_conn_per_host,
+        db_interval=args.db_interval,
+        api_interval=args.api_interval,
+        ping_interval=args.ping_interval,
+        stress_config=LoadConfig(
+            url=args.backend,
+            clients=args.stress_clients,
+            arrival_rate=args.stress_rate,
+            max_concurrent_connects=args.stress_concurrency,
+            hold_seconds=args.stress_hold
+        ),
+        stress_workers=args.stress_workers,
+        watch_processes=dict(item.split('=', 1) if '=' in item else (item, item)
+                             for item in (args.watch or ['backend=server.js'])),
+        process_interval=1.0 / min(max(args.process_hz, 0.1), 10.0)
     )
     
     try:
@@ -823,13 +1393,16 @@ def main():
             asyncio.run(monitor.start_terminal_mode())
         else:
             # Web Mode
-            monitor.start_web_mode(args.port)
+            asyncio.run(monitor.start_web_mode(args.port, frame_budget=args.frame_budget))
     except KeyboardInterrupt:
         print("\n🛑 Monitor stopped by user")
         return 0
     except Exception as e:
         print(f"❌ Monitor error: {e}")
         return 1
+    finally:
+        if monitor.store:
+            monitor.store.close()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Port Inspect
+============
+Wer belegt Port X? - direkt aus /proc statt über lsof/netstat.
+
+- /proc/net/tcp und /proc/net/tcp6  → Sockets mit lokalem Port, Zustand, Inode
+- /proc/<pid>/fd/*                  → Symlinks 'socket:[<inode>]' → besitzende PID
+
+Beide Dateien werden pro Anfrage einmal gelesen, egal wie viele Ports gefragt
+sind. Der Inode→PID-Index wird zwischengespeichert: bekannte Inodes werden über
+einen einzelnen readlink bestätigt, nur bei unbekannten Inodes wird /proc/*/fd
+erneut durchsucht (und abgebrochen, sobald alle gesuchten Inodes gefunden sind).
+
+Usage:
+    python port_inspect.py 3000 3001 5000 8000
+    python port_inspect.py 3001 --all-states
+    python port_inspect.py 3000 3001 --kill
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PROC = "/proc"
+PROC_NET_FILES = (f"{PROC}/net/tcp", f"{PROC}/net/tcp6")
+PORT_INSPECT_AVAILABLE = os.path.exists(PROC_NET_FILES[0])
+
+# Zustände aus include/net/tcp_states.h
+TCP_STATES = {
+    "01": "ESTABLISHED", "02": "SYN_SENT", "03": "SYN_RECV", "04": "FIN_WAIT1",
+    "05": "FIN_WAIT2", "06": "TIME_WAIT", "07": "CLOSE", "08": "CLOSE_WAIT",
+    "09": "LAST_ACK", "0A": "LISTEN", "0B": "CLOSING",
+}
+
+
+@dataclass
+class SocketEntry:
+    """Eine Zeile aus /proc/net/tcp{,6}"""
+    local_address: str
+    local_port: int
+    remote_address: str
+    remote_port: int
+    state: str
+    uid: int
+    inode: int
+
+
+@dataclass
+class PortOwner:
+    """Prozess, der einen Socket auf einem Port hält"""
+    port: int
+    pid: Optional[int]          # None = Inode keinem (sichtbaren) Prozess zuzuordnen
+    name: str
+    state: str
+    address: str
+
+
+def _decode_address(hex_address: str) -> Tuple[str, int]:
+    """'0100007F:0BB9' → ('127.0.0.1', 3001); IPv6 als 4 little-endian 32-Bit-Wörter"""
+    address, port = hex_address.split(":")
+    raw = bytes.fromhex(address)
+    if len(raw) == 4:
+        host = socket.inet_ntop(socket.AF_INET, raw[::-1])
+    else:
+        words = b"".join(raw[i:i + 4][::-1] for i in range(0, 16, 4))
+        host = socket.inet_ntop(socket.AF_INET6, words)
+    return host, int(port, 16)
+
+
+def read_sockets(ports: Optional[Iterable[int]] = None,
+                 states: Optional[Iterable[str]] = ("LISTEN",)) -> List[SocketEntry]:
+    """Sockets aus /proc/net/tcp{,6}, gefiltert nach lokalem Port und Zustand (None = alle)"""
+    wanted_ports = set(ports) if ports is not None else None
+    wanted_states = set(states) if states is not None else None
+    entries = []
+    for path in PROC_NET_FILES:
+        try:
+            with open(path, "r") as f:
+                next(f, None)  # Kopfzeile
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            # Port vor dem vollen Dekodieren prüfen - die meisten Zeilen fallen hier raus
+            local_port = int(fields[1].rsplit(":", 1)[1], 16)
+            if wanted_ports is not None and local_port not in wanted_ports:
+                continue
+            state = TCP_STATES.get(fields[3], fields[3])
+            if wanted_states is not None and state not in wanted_states:
+                continue
+            local_address, _ = _decode_address(fields[1])
+            remote_address, remote_port = _decode_address(fields[2])
+            entries.append(SocketEntry(
+                local_address=local_address,
+                local_port=local_port,
+                remote_address=remote_address,
+                remote_port=remote_port,
+                state=state,
+                uid=int(fields[7]),
+                inode=int(fields[9]),
+            ))
+    return entries
+
+
+def _process_name(pid: int) -> str:
+    try:
+        with open(f"{PROC}/{pid}/comm", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return "?"
+
+
+class InodeIndex:
+    """Socket-Inode → {PID: FD}, zwischen Anfragen gecacht
+
+    Ein Inode kann mehreren Prozessen gehören (über fork geerbter LISTEN-Socket,
+    z.B. npm → node), daher eine PID-Menge pro Inode. Der eigene Prozess wird
+    mit indexiert - sonst bliebe jeder eigene Socket ein Cache-Miss mit Rescan.
+    """
+
+    def __init__(self):
+        self._index: Dict[int, Dict[int, str]] = {}
+        self.scans = 0
+
+    def _confirm(self, inode: int) -> Set[int]:
+        """Gecachte Einträge mit je einem readlink bestätigen"""
+        holders = self._index[inode]
+        for pid, fd in list(holders.items()):
+            try:
+                if os.readlink(f"{PROC}/{pid}/fd/{fd}") == f"socket:[{inode}]":
+                    continue
+            except OSError:
+                pass
+            del holders[pid]
+        if not holders:
+            del self._index[inode]
+        return set(holders)
+
+    def _scan(self, wanted: Set[int], complete: bool = False):
+        """/proc/*/fd durchsuchen; ohne complete nur bis alle gesuchten Inodes einen Besitzer haben"""
+        self.scans += 1
+        # Gesuchte Inodes neu aufbauen, damit beendete Besitzer nicht im Index bleiben
+        for inode in wanted:
+            self._index.pop(inode, None)
+        remaining = set(wanted)
+        for entry in os.listdir(PROC):
+            if not entry.isdigit():
+                continue
+            fd_dir = f"{PROC}/{entry}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue  # Prozess beendet oder keine Berechtigung
+            for fd in fds:
+                try:
+                    target = os.readlink(f"{fd_dir}/{fd}")
+                except OSError:
+                    continue
+                if target.startswith("socket:["):
+                    inode = int(target[8:-1])
+                    self._index.setdefault(inode, {}).setdefault(int(entry), fd)
+                    remaining.discard(inode)
+            if not remaining and not complete:
+                return
+
+    def lookup(self, inodes: Iterable[int], complete: bool = False) -> Dict[int, Set[int]]:
+        """PIDs pro Inode (leer = keinem sichtbaren Prozess zuzuordnen)
+
+        Höchstens ein Scan von /proc für alle unbekannten Inodes. complete=True
+        scannt immer vollständig - nur so werden alle Erben eines Sockets gefunden
+        (z.B. vor dem Beenden).
+        """
+        result: Dict[int, Set[int]] = {}
+        missing = set()
+        for inode in set(inodes):
+            if not inode:
+                result[inode] = set()
+                continue
+            pids = self._confirm(inode) if inode in self._index and not complete else set()
+            if not pids:
+                missing.add(inode)
+            result[inode] = pids
+        if missing:
+            self._scan(missing, complete)
+            for inode in missing:
+                result[inode] = set(self._index.get(inode, {}))
+        return result
+
+    def clear(self):
+        self._index.clear()
+
+
+class PortInspector:
+    """Beantwortet 'wer belegt Port X' für viele Ports in einem Durchgang"""
+
+    def __init__(self):
+        self.index = InodeIndex()
+
+    def owners(self, ports: Iterable[int], states: Optional[Iterable[str]] = ("LISTEN",),
+               complete: bool = False) -> Dict[int, List[PortOwner]]:
+        """Port → Besitzer (ein Eintrag pro PID); leere Liste = Port frei
+
+        complete=True findet garantiert alle Prozesse, die einen Socket geerbt haben.
+        """
+        ports = list(ports)
+        entries = read_sockets(ports, states)
+        # TIME_WAIT-Sockets gehören keinem Prozess mehr (Inode 0)
+        pids = self.index.lookup((entry.inode for entry in entries if entry.inode), complete)
+        result: Dict[int, List[PortOwner]] = {port: [] for port in ports}
+        seen = set()
+        for entry in entries:
+            for pid in sorted(pids.get(entry.inode) or [None]):
+                # IPv4 und IPv6 auf demselben Port meist vom selben Prozess - einmal reicht
+                key = (entry.local_port, pid, entry.state) if pid else (entry.local_port, entry.inode, entry.state)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result[entry.local_port].append(PortOwner(
+                    port=entry.local_port,
+                    pid=pid,
+                    name=_process_name(pid) if pid else "?",
+                    state=entry.state,
+                    address=f"{entry.local_address}:{entry.local_port}",
+                ))
+        return result
+
+    def pids_on_port(self, port: int, states: Optional[Iterable[str]] = ("LISTEN",),
+                     complete: bool = False) -> List[int]:
+        """Sortierte PIDs, die einen Socket auf port halten (inkl. des eigenen Prozesses)"""
+        return sorted({owner.pid for owner in self.owners([port], states, complete)[port] if owner.pid})
+
+    def kill_port(self, port: int, sig: int = signal.SIGKILL) -> List[int]:
+        """Alle Prozesse mit einem LISTEN-Socket auf port beenden (außer dem eigenen); gibt die PIDs zurück"""
+        killed = []
+        for pid in self.pids_on_port(port, complete=True):
+            if pid == os.getpid():
+                continue
+            try:
+                os.kill(pid, sig)
+                killed.append(pid)
+            except ProcessLookupError:
+                killed.append(pid)
+            except PermissionError:
+                pass
+        return killed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show which processes own TCP ports (from /proc)')
+    parser.add_argument('ports', nargs='+', type=int, help='Ports to inspect')
+    parser.add_argument('--all-states', action='store_true',
+                       help='Include connected sockets, not only LISTEN')
+    parser.add_argument('--kill', action='store_true', help='Kill the processes listening on the ports')
+    args = parser.parse_args()
+
+    if not PORT_INSPECT_AVAILABLE:
+        print("❌ /proc/net/tcp not available on this system")
+        return 1
+
+    inspector = PortInspector()
+    start = time.perf_counter()
+    owners = inspector.owners(args.ports, None if args.all_states else ("LISTEN",))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for port, port_owners in owners.items():
+        if not port_owners:
+            print(f"✅ Port {port}: free")
+            continue
+        print(f"🔴 Port {port}:")
+        for owner in port_owners:
+            pid = owner.pid if owner.pid else "-"
+            print(f"   {owner.state:<12} {owner.address:<28} PID {pid:<7} {owner.name}")
+    print(f"⏱️ {elapsed_ms:.1f}ms ({inspector.index.scans} fd scan(s))")
+
+    if args.kill:
+        for port in args.ports:
+            for pid in inspector.kill_port(port):
+                print(f"💀 Killed PID {pid} on port {port}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
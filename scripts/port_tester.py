@@ -24,9 +24,16 @@ import signal
 import requests
 import socket
 import json
+import argparse
+import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from log_pump import LogPump
+from port_inspect import PORT_INSPECT_AVAILABLE, PortInspector
+from readiness import ReadinessWatcher, http_probe
+
 try:
     import psutil
     PSUTIL_AVAILABLE = True
@@ -35,13 +42,121 @@ except ImportError:
     print("💡 Tipp: 'pip install psutil' für bessere Prozess-Kontrolle")
 
 
+class PortInstance:
+    """Ein Backend-Prozess der Port-Matrix mit seinem Health-Verlauf"""
+    
+    def __init__(self, config_name, port, method, failure_threshold=3):
+        self.config_name = config_name
+        self.port = port
+        self.method = method
+        self.process = None
+        self.log_pump = None
+        self.temp_server_path = None
+        self.ready_at = None        # time.monotonic() bei erfolgreichem Start
+        self.healthy = True
+        self.died_at = None         # Sekunden nach Start
+        self.exit_code = None
+        self.samples = 0
+        self.failures = 0
+        self.first_failure_at = None
+        self.down_since = None
+        self.consecutive_failures = 0
+        # Erst so viele Fehlschläge am Stück gelten als "tot" (ein langsamer Sample reicht nicht)
+        self.failure_threshold = failure_threshold
+        self.transitions = []       # [(Sekunden, "down"/"up"/"dead")]
+        self.latencies = []
+        self.result = {
+            "config": config_name,
+            "backend_port": port,
+            "method": method,
+            "backend_started": False,
+            "initial_health_check": False,
+            "survived_30s": False,
+            "survived_60s": False,
+            "final_status": "unknown",
+            "error_messages": []
+        }
+    
+    def record_sample(self, elapsed, ok, latency_ms):
+        self.samples += 1
+        if ok:
+            self.latencies.append(latency_ms)
+            self.consecutive_failures = 0
+            if not self.healthy:
+                self.transitions.append((round(elapsed, 1), "up"))
+                self.down_since = None
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.first_failure_at is None:
+                self.first_failure_at = elapsed
+            if self.healthy:
+                self.transitions.append((round(elapsed, 1), "down"))
+                self.down_since = elapsed
+        self.healthy = ok
+    
+    def record_death(self, elapsed, exit_code):
+        self.died_at = elapsed
+        self.exit_code = exit_code
+        self.healthy = False
+        self.transitions.append((round(elapsed, 1), "dead"))
+    
+    def finish(self, window):
+        """Legacy-Felder (30s/60s) aus dem Health-Verlauf ableiten"""
+        result = self.result
+        # Tot = Prozess beendet, oder /health antwortet bis zum Ende mindestens
+        # failure_threshold Samples am Stück nicht mehr
+        dead_at = self.died_at
+        if dead_at is None and self.consecutive_failures >= self.failure_threshold:
+            dead_at = self.down_since
+        result["died_at_s"] = round(dead_at, 1) if dead_at is not None else None
+        result["exit_code"] = self.exit_code
+        result["health_samples"] = self.samples
+        result["health_failures"] = self.failures
+        result["first_failure_s"] = round(self.first_failure_at, 1) if self.first_failure_at is not None else None
+        result["health_transitions"] = self.transitions
+        if self.latencies:
+            latencies = sorted(self.latencies)
+            result["health_latency_ms"] = {
+                "p50": round(latencies[len(latencies) // 2], 1),
+                "max": round(latencies[-1], 1)
+            }
+        
+        result["survived_30s"] = window >= 30 and (dead_at is None or dead_at >= 30)
+        result["survived_60s"] = window >= 60 and dead_at is None
+        if dead_at is None:
+            result["final_status"] = "stable"
+        elif dead_at < 30:
+            result["final_status"] = "died_before_30s"
+        else:
+            result["final_status"] = "died_after_30s"
+        if self.died_at is not None:
+            result["error_messages"].append(
+                f"Backend-Prozess starb nach {self.died_at:.1f}s mit Exit-Code: {self.exit_code}")
+        elif dead_at is not None:
+            result["error_messages"].append(f"/health antwortet seit {dead_at:.1f}s nicht mehr")
+
+
 class PortTester:
     """Testet verschiedene Ports auf System-Manipulation"""
     
-    def __init__(self):
+    def __init__(self, survival_window=60.0, sample_interval=1.0, all_methods=False,
+                 failure_threshold=3):
         self.scripts_root = Path(__file__).parent  # scripts/
         self.project_root = self.scripts_root.parent  # root/
         self.test_results = {}
+        self.port_inspector = PortInspector() if PORT_INSPECT_AVAILABLE else None
+        # Shell nur unter Windows; unter POSIX würde shell=True mit Liste nur 'node' starten
+        self.use_shell = platform.system() == 'Windows'
+        
+        # Überlebensfenster mit kontinuierlichem Health-Sampling statt fester sleep(30)
+        self.survival_window = survival_window
+        self.sample_interval = sample_interval
+        self.start_timeout = 20.0
+        self.probe_timeout = min(max(sample_interval, 1.0), 5.0)
+        self.failure_threshold = max(1, failure_threshold)
+        # ENV und TEMP für jeden Port testen (sonst TEMP nur, wenn ENV nicht stabil war)
+        self.all_methods = all_methods
         
         # Test verschiedene Port-Kombinationen für Backend
         self.port_configs = [
@@ -66,7 +181,7 @@ class PortTester:
         print(f"📁 Scripts: {self.scripts_root}")
         print(f"📁 Projekt: {self.project_root}")
         print("🎯 Teste Backend-Server auf verschiedenen Ports")
-        print("🔍 Ports: 3001, 8080, 8081, 3333, 5000, 4000, 9000, 7000, 6000, 8888")
+        print(f"🔍 Ports: {', '.join(str(config['backend']) for config in self.port_configs)}")
         print("-" * 80)
     
     def check_project_structure(self):
@@ -120,8 +235,14 @@ class PortTester:
         """Tötet Prozesse auf einem Port"""
         killed = False
         
+        # Methode 0: /proc/net/tcp (Linux) - ein Durchgang, kein Subprozess
+        if PORT_INSPECT_AVAILABLE:
+            for pid in self.port_inspector.kill_port(port):
+                print(f"🔨 Töte Prozess PID {pid} auf Port {port}")
+                killed = True
+        
         # Methode 1: psutil (falls verfügbar)
-        if PSUTIL_AVAILABLE:
+        elif PSUTIL_AVAILABLE:
             try:
                 for proc in psutil.process_iter(['pid', 'name']):
                     try:
@@ -136,7 +257,7 @@ class PortTester:
                 pass
         
         # Methode 2: Windows netstat + taskkill
-        if not killed:
+        if not killed and not PORT_INSPECT_AVAILABLE:
             try:
                 result = subprocess.run(['netstat', '-ano'], capture_output=True, text=True, shell=True)
                 for line in result.stdout.split('\\n'):
@@ -154,147 +275,31 @@ class PortTester:
         
         return killed
     
-    def test_port_with_env_var(self, port, config_name):
-        """Testet Backend-Port mit Umgebungsvariable"""
-        print(f"\\n🧪 TESTE {config_name}: Backend-Port {port} (Umgebungsvariable)")
-        print("-" * 60)
-        
-        result = {
-            "config": config_name,
-            "backend_port": port,
-            "method": "environment_variable",
-            "backend_started": False,
-            "initial_health_check": False,
-            "survived_30s": False,
-            "survived_60s": False,
-            "final_status": "unknown",
-            "error_messages": []
+    def start_log_pump(self, process, name):
+        """Backend-Ausgabe kontinuierlich lesen - eine volle Pipe (64 KB) würde node blockieren"""
+        pump = LogPump(name, log_path=self.scripts_root / "logs" / f"{name}.log")
+        pump.on_event("error", lambda line, match: print(f"   ❌ [{name}] {line.text}"))
+        pump.on_event("socketio_warning", lambda line, match: print(f"   ⚠️ [{name}] {line.text}"))
+        pump.attach_process(process)
+        return pump
+    
+    @staticmethod
+    def stop_log_pump(pump, result):
+        """Log-Pump schließen und Zusammenfassung im Ergebnis ablegen"""
+        if pump is None:
+            return
+        pump.close()
+        result["log_summary"] = {
+            "lines": pump.counts["lines"],
+            "errors": pump.counts["error"],
+            "socketio_warnings": pump.counts["socketio_warning"],
+            "last_errors": pump.matching("error", 5)
         }
-        
-        backend_process = None
-        
-        try:
-            # Port säubern
-            print("🧹 Säubere Port...")
-            self.kill_processes_on_port(port)
-            
-            # Backend mit Umgebungsvariable starten
-            print(f"🚀 Starte Backend mit PORT={port} Umgebungsvariable...")
-            
-            env = os.environ.copy()
-            env['PORT'] = str(port)
-            
-            backend_process = subprocess.Popen(
-                ['node', '../backend/server.js'],  # Pfad angepasst für scripts/
-                cwd=self.scripts_root,  # Aus scripts/ ausführen
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                shell=True,
-                env=env
-            )
-            
-            # Auf Backend-Start warten
-            backend_url = f"http://localhost:{port}"
-            backend_ready = False
-            
-            print("⏳ Warte auf Backend-Start...")
-            for i in range(20):  # 20 Sekunden Timeout
-                try:
-                    response = requests.get(f"{backend_url}/health", timeout=3)
-                    if response.status_code == 200:
-                        print(f"✅ Backend erfolgreich gestartet auf Port {port}")
-                        result["backend_started"] = True
-                        result["initial_health_check"] = True
-                        backend_ready = True
-                        break
-                except requests.exceptions.ConnectionError:
-                    # Normal beim Startup
-                    pass
-                except Exception as e:
-                    if i == 19:  # Letzter Versuch
-                        result["error_messages"].append(f"Health-Check Fehler: {e}")
-                time.sleep(1)
-            
-            if not backend_ready:
-                # Prozess-Status prüfen
-                if backend_process.poll() is not None:
-                    exit_code = backend_process.poll()
-                    try:
-                        stdout, _ = backend_process.communicate(timeout=2)
-                        result["error_messages"].append(f"Backend-Prozess beendet (Exit: {exit_code}): {stdout[-300:]}")
-                    except:
-                        result["error_messages"].append(f"Backend-Prozess beendet mit Exit-Code: {exit_code}")
-                else:
-                    result["error_messages"].append("Backend-Start Timeout - Prozess läuft noch aber antwortet nicht")
-                result["final_status"] = "start_failed"
-                return result
-            
-            # 30-Sekunden-Test
-            print("⏳ Teste 30-Sekunden-Überleben...")
-            time.sleep(30)
-            
-            try:
-                response = requests.get(f"{backend_url}/health", timeout=5)
-                if response.status_code == 200:
-                    print("✅ Backend hat 30 Sekunden überlebt!")
-                    result["survived_30s"] = True
-                else:
-                    print(f"❌ Backend 30s-Test fehlgeschlagen: HTTP {response.status_code}")
-                    result["error_messages"].append(f"30s-Test fehlgeschlagen: HTTP {response.status_code}")
-            except requests.exceptions.ConnectionError:
-                print("❌ Backend 30s-Test fehlgeschlagen: VERBINDUNG VERWEIGERT")
-                result["error_messages"].append("30s-Test fehlgeschlagen: VERBINDUNG VERWEIGERT")
-            except requests.exceptions.Timeout:
-                print("❌ Backend 30s-Test fehlgeschlagen: TIMEOUT")
-                result["error_messages"].append("30s-Test fehlgeschlagen: TIMEOUT")
-            except Exception as e:
-                print(f"❌ Backend 30s-Test fehlgeschlagen: {e}")
-                result["error_messages"].append(f"30s-Test fehlgeschlagen: {e}")
-            
-            # 60-Sekunden-Test (falls 30s erfolgreich)
-            if result["survived_30s"]:
-                print("⏳ Teste 60-Sekunden-Überleben...")
-                time.sleep(30)  # Weitere 30s
-                
-                try:
-                    response = requests.get(f"{backend_url}/health", timeout=5)
-                    if response.status_code == 200:
-                        print("✅ Backend hat 60 Sekunden überlebt!")
-                        result["survived_60s"] = True
-                        result["final_status"] = "stable"
-                    else:
-                        result["error_messages"].append(f"60s-Test fehlgeschlagen: HTTP {response.status_code}")
-                        result["final_status"] = "died_after_30s"
-                except Exception as e:
-                    result["error_messages"].append(f"60s-Test fehlgeschlagen: {e}")
-                    result["final_status"] = "died_after_30s"
-            else:
-                result["final_status"] = "died_before_30s"
-            
-            # Prozess-Status final prüfen
-            if backend_process and backend_process.poll() is not None:
-                exit_code = backend_process.poll()
-                result["error_messages"].append(f"Backend-Prozess starb mit Exit-Code: {exit_code}")
-            
-            return result
-            
-        except Exception as e:
-            result["error_messages"].append(f"Test-Exception: {e}")
-            result["final_status"] = "test_error"
-            return result
-            
-        finally:
-            # Aufräumen
-            if backend_process:
-                try:
-                    backend_process.terminate()
-                    backend_process.wait(timeout=5)
-                except Exception:
-                    try:
-                        backend_process.kill()
-                    except Exception:
-                        pass
+    
+    def test_port_with_env_var(self, port, config_name):
+        """Testet Backend-Port mit Umgebungsvariable (Matrix mit einer Zelle)"""
+        cell = {"backend": port, "name": config_name, "method": "environment_variable"}
+        return self.run_port_matrix([cell])[config_name]
     
     def create_temp_server_js(self, port):
         """Erstellt temporäre server.js mit gewünschtem Port"""
@@ -340,147 +345,167 @@ class PortTester:
             return None
     
     def test_port_with_temp_file(self, port, config_name):
-        """Testet Backend-Port mit temporärer Datei"""
-        print(f"\\n🧪 TESTE {config_name}: Backend-Port {port} (Temporäre Datei)")
-        print("-" * 60)
-        
-        result = {
-            "config": config_name,
-            "backend_port": port,
-            "method": "temporary_file",
-            "backend_started": False,
-            "initial_health_check": False,
-            "survived_30s": False,
-            "survived_60s": False,
-            "final_status": "unknown",
-            "error_messages": []
-        }
-        
-        backend_process = None
-        temp_server_path = None
+        """Testet Backend-Port mit temporärer Datei (Matrix mit einer Zelle)"""
+        cell = {"backend": port, "name": config_name, "method": "temporary_file"}
+        return self.run_port_matrix([cell])[config_name]
+    
+    def start_instance(self, cell):
+        """Startet das Backend einer Port/Methoden-Zelle und wartet auf /health"""
+        instance = PortInstance(cell["name"], cell["backend"], cell["method"],
+                                failure_threshold=self.failure_threshold)
+        port, result = instance.port, instance.result
         
         try:
             # Port säubern
-            print("🧹 Säubere Port...")
             self.kill_processes_on_port(port)
             
-            # Temporäre server.js erstellen
-            temp_server_path = self.create_temp_server_js(port)
-            if not temp_server_path:
-                result["error_messages"].append("Konnte temporäre server.js nicht erstellen")
-                result["final_status"] = "temp_file_failed"
-                return result
-            
-            print(f"📁 Temporäre server.js erstellt: {temp_server_path.name}")
-            
-            # Backend mit temporärer Datei starten
-            print(f"🚀 Starte Backend mit temporärer Datei...")
-            
-            # Relativer Pfad zur temporären Datei
-            relative_temp_path = f"../backend/{temp_server_path.name}"
+            env = os.environ.copy()
+            if instance.method == "environment_variable":
+                env['PORT'] = str(port)
+                script = '../backend/server.js'  # Pfad angepasst für scripts/
+                log_name = f"backend_{port}_env"
+            else:
+                instance.temp_server_path = self.create_temp_server_js(port)
+                if not instance.temp_server_path:
+                    result["error_messages"].append("Konnte temporäre server.js nicht erstellen")
+                    result["final_status"] = "temp_file_failed"
+                    return instance
+                env.pop('PORT', None)  # Port kommt aus der temporären Datei
+                script = f"../backend/{instance.temp_server_path.name}"
+                log_name = f"backend_{port}_tempfile"
             
-            backend_process = subprocess.Popen(
-                ['node', relative_temp_path],
-                cwd=self.scripts_root,
+            print(f"🚀 {instance.config_name}: starte Backend auf Port {port} ({instance.method})")
+            started_at = time.monotonic()
+            instance.process = subprocess.Popen(
+                ['node', script],
+                cwd=self.scripts_root,  # Aus scripts/ ausführen
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                shell=True
+                shell=self.use_shell,
+                env=env
             )
+            instance.log_pump = self.start_log_pump(instance.process, log_name)
             
-            # Rest des Tests identisch zur env_var Methode
-            backend_url = f"http://localhost:{port}"
-            backend_ready = False
-            
-            print("⏳ Warte auf Backend-Start...")
-            for i in range(20):
-                try:
-                    response = requests.get(f"{backend_url}/health", timeout=3)
-                    if response.status_code == 200:
-                        print(f"✅ Backend erfolgreich gestartet auf Port {port}")
-                        result["backend_started"] = True
-                        result["initial_health_check"] = True
-                        backend_ready = True
-                        break
-                except requests.exceptions.ConnectionError:
-                    pass
-                except Exception as e:
-                    if i == 19:
-                        result["error_messages"].append(f"Health-Check Fehler: {e}")
-                time.sleep(1)
-            
-            if not backend_ready:
-                if backend_process.poll() is not None:
-                    exit_code = backend_process.poll()
-                    try:
-                        stdout, _ = backend_process.communicate(timeout=2)
-                        result["error_messages"].append(f"Backend-Prozess beendet (Exit: {exit_code}): {stdout[-300:]}")
-                    except:
-                        result["error_messages"].append(f"Backend-Prozess beendet mit Exit-Code: {exit_code}")
-                else:
-                    result["error_messages"].append("Backend-Start Timeout")
-                result["final_status"] = "start_failed"
-                return result
-            
-            # 30-Sekunden-Test
-            print("⏳ Teste 30-Sekunden-Überleben...")
-            time.sleep(30)
+            # Readiness: "running on port"-Zeile aus der Log-Pump + /health mit Backoff
+            watcher = ReadinessWatcher(instance.config_name, port, url=f"http://localhost:{port}/health",
+                                       process=instance.process, ready_pattern=r"running on port",
+                                       started_at=started_at)
+            instance.log_pump.on(None, lambda line, match: watcher.feed_line(line.text))
+            readiness = watcher.wait(timeout=self.start_timeout)
             
-            try:
-                response = requests.get(f"{backend_url}/health", timeout=5)
-                if response.status_code == 200:
-                    print("✅ Backend hat 30 Sekunden überlebt!")
-                    result["survived_30s"] = True
-                else:
-                    result["error_messages"].append(f"30s-Test fehlgeschlagen: HTTP {response.status_code}")
-            except Exception as e:
-                result["error_messages"].append(f"30s-Test fehlgeschlagen: {e}")
+            if readiness.ready:
+                instance.ready_at = time.monotonic()
+                result["backend_started"] = True
+                result["initial_health_check"] = True
+                result["startup_ms"] = round(readiness.time_to_ready * 1000)
+                print(f"✅ {instance.config_name}: Backend bereit in {result['startup_ms']}ms")
+                return instance
             
-            # 60-Sekunden-Test
-            if result["survived_30s"]:
-                print("⏳ Teste 60-Sekunden-Überleben...")
-                time.sleep(30)
-                
-                try:
-                    response = requests.get(f"{backend_url}/health", timeout=5)
-                    if response.status_code == 200:
-                        print("✅ Backend hat 60 Sekunden überlebt!")
-                        result["survived_60s"] = True
-                        result["final_status"] = "stable"
-                    else:
-                        result["error_messages"].append(f"60s-Test fehlgeschlagen: HTTP {response.status_code}")
-                        result["final_status"] = "died_after_30s"
-                except Exception as e:
-                    result["error_messages"].append(f"60s-Test fehlgeschlagen: {e}")
-                    result["final_status"] = "died_after_30s"
+            # Prozess-Status prüfen
+            if instance.process.poll() is not None:
+                exit_code = instance.process.poll()
+                instance.log_pump.close()
+                result["error_messages"].append(
+                    f"Backend-Prozess beendet (Exit: {exit_code}): {instance.log_pump.text()[-300:]}")
             else:
-                result["final_status"] = "died_before_30s"
-            
-            return result
+                result["error_messages"].append("Backend-Start Timeout - Prozess läuft noch aber antwortet nicht")
+            result["final_status"] = "start_failed"
+            print(f"❌ {instance.config_name}: Start fehlgeschlagen")
             
         except Exception as e:
             result["error_messages"].append(f"Test-Exception: {e}")
             result["final_status"] = "test_error"
-            return result
-            
-        finally:
-            # Aufräumen
-            if backend_process:
-                try:
-                    backend_process.terminate()
-                    backend_process.wait(timeout=5)
-                except Exception:
-                    try:
-                        backend_process.kill()
-                    except Exception:
-                        pass
-            
-            # Temporäre Datei löschen
-            if temp_server_path and temp_server_path.exists():
+        return instance
+    
+    def sample_instance(self, instance, now):
+        """Ein Health-Sample: lebt der Prozess, antwortet /health?"""
+        elapsed = now - instance.ready_at
+        if instance.process.poll() is not None:
+            instance.record_death(elapsed, instance.process.poll())
+            print(f"💀 {instance.config_name}: Backend-Prozess starb nach {elapsed:.1f}s "
+                  f"(Exit: {instance.process.poll()})")
+            return
+        start = time.perf_counter()
+        ok = http_probe(f"http://localhost:{instance.port}/health", timeout=self.probe_timeout)
+        instance.record_sample(elapsed, ok, (time.perf_counter() - start) * 1000)
+    
+    def stop_instance(self, instance):
+        """Prozess beenden, Log-Pump schließen, temporäre Datei löschen, Status ableiten"""
+        if instance.process:
+            try:
+                instance.process.terminate()
+                instance.process.wait(timeout=5)
+            except Exception:
                 try:
-                    temp_server_path.unlink()
+                    instance.process.kill()
                 except Exception:
                     pass
+        self.stop_log_pump(instance.log_pump, instance.result)
+        if instance.temp_server_path and instance.temp_server_path.exists():
+            try:
+                instance.temp_server_path.unlink()
+            except Exception:
+                pass
+        if instance.ready_at is not None:
+            instance.finish(self.survival_window)
+        return instance.result
+    
+    def _run_wave(self, cells):
+        """Zellen mit unterschiedlichen Ports gleichzeitig: Start, ein Überlebensfenster, Stop"""
+        with ThreadPoolExecutor(max_workers=len(cells)) as pool:
+            instances = list(pool.map(self.start_instance, cells))
+        
+        live = [instance for instance in instances if instance.ready_at is not None]
+        if live:
+            print(f"⏳ Überwache {len(live)} Backend(s) für {self.survival_window:.0f}s "
+                  f"(Health-Sample alle {self.sample_interval:g}s)...")
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, len(live))) as pool:
+                next_tick = time.monotonic()
+                next_report = next_tick + 10
+                while True:
+                    now = time.monotonic()
+                    active = [instance for instance in live
+                              if instance.died_at is None and now - instance.ready_at < self.survival_window]
+                    if not active:
+                        break
+                    list(pool.map(lambda instance: self.sample_instance(instance, now), active))
+                    
+                    if now >= next_report:
+                        up = sum(1 for instance in active if instance.healthy)
+                        dead = sum(1 for instance in live if instance.died_at is not None)
+                        elapsed = now - min(instance.ready_at for instance in live)
+                        print(f"   ⏱️ {elapsed:.0f}s: {up} healthy, {len(active) - up} not responding, {dead} dead")
+                        next_report += 10
+                    
+                    next_tick += self.sample_interval
+                    time.sleep(max(0.0, next_tick - time.monotonic()))
+        finally:
+            results = {instance.config_name: self.stop_instance(instance) for instance in instances}
+        return results
+    
+    def run_port_matrix(self, cells):
+        """Port/Methoden-Matrix parallel testen
+        
+        Zellen mit demselben Port können nicht gleichzeitig laufen - sie kommen in
+        spätere Wellen. Jede Welle dauert ein Überlebensfenster.
+        """
+        waves = []
+        for cell in cells:
+            for wave in waves:
+                if all(other["backend"] != cell["backend"] for other in wave):
+                    wave.append(cell)
+                    break
+            else:
+                waves.append([cell])
+        
+        results = {}
+        for i, wave in enumerate(waves, 1):
+            if len(waves) > 1:
+                print(f"\n🌊 Welle {i}/{len(waves)}: {len(wave)} Konfiguration(en)")
+            results.update(self._run_wave(wave))
+        return results
     
     def cleanup_temp_files(self):
         """Räumt temporäre Dateien auf"""
@@ -513,7 +538,9 @@ class PortTester:
                 print(f"✅ {config_name} (Port {backend_port}, {method}): STABIL")
             elif status in ["died_before_30s", "died_after_30s"]:
                 unstable_ports.append(backend_port)
-                print(f"❌ {config_name} (Port {backend_port}): WIRD GETÖTET")
+                died_at = result.get("died_at_s")
+                died = f" nach {died_at:.1f}s" if died_at is not None else ""
+                print(f"❌ {config_name} (Port {backend_port}): WIRD GETÖTET{died}")
                 print(f"   📝 Fehler: {', '.join(result['error_messages'][:2])}")  # Nur erste 2 Fehler
             else:
                 failed_ports.append(backend_port)
@@ -908,38 +935,38 @@ if __name__ == "__main__":
             print("❌ Projekt-Struktur-Problem - Test wird abgebrochen")
             return []
         
+        # Ohne --all-methods kommt für nicht stabile ENV-Ports eine zweite Welle (TEMP) dazu
+        window_minutes = (self.survival_window + self.start_timeout) / 60
         print("\\n🏁 STARTE PORT-TESTS...")
-        print("⏱️  Geschätzte Dauer: ~20 Minuten")
-        print("🔍 Teste jeden Port mit 2 Methoden (ENV + TEMP)")
-        
-        # Jede Konfiguration mit beiden Methoden testen
-        for i, config in enumerate(self.port_configs, 1):
-            port = config["backend"]
-            name = config["name"]
-            
-            print(f"\\n📋 TEST {i}/{len(self.port_configs)} - {name} (Port {port})")
-            print("="*70)
-            
-            # Methode 1: Umgebungsvariable (bevorzugt)
-            print("🧪 Teste Methode 1: Umgebungsvariable")
-            result_env = self.test_port_with_env_var(port, f"{name}-ENV")
-            self.test_results[f"{name}-ENV"] = result_env
-            
-            # Kurze Pause zwischen Methoden
-            time.sleep(2)
-            
-            # Methode 2: Temporäre Datei (falls ENV nicht stabil)
-            if result_env["final_status"] != "stable":
-                print("🧪 Teste Methode 2: Temporäre Datei")
-                result_temp = self.test_port_with_temp_file(port, f"{name}-TEMP")
-                self.test_results[f"{name}-TEMP"] = result_temp
+        if self.all_methods:
+            estimate = f"~{2 * window_minutes:.0f} Minute(n)"
+        else:
+            estimate = (f"~{window_minutes:.0f} Minute(n), bis ~{2 * window_minutes:.0f} "
+                        f"falls TEMP-Wiederholungen nötig")
+        print(f"⏱️  Geschätzte Dauer: {estimate} "
+              f"({len(self.port_configs)} Ports parallel, {self.survival_window:.0f}s Fenster)")
+        print("🔍 Teste jeden Port mit Umgebungsvariable, temporäre Datei "
+              + ("immer" if self.all_methods else "falls ENV nicht stabil"))
+        
+        # Methode 1: Umgebungsvariable (bevorzugt) - alle Ports gleichzeitig
+        env_cells = [{"backend": config["backend"], "name": f"{config['name']}-ENV",
+                      "method": "environment_variable"} for config in self.port_configs]
+        temp_cells = [{"backend": config["backend"], "name": f"{config['name']}-TEMP",
+                       "method": "temporary_file"} for config in self.port_configs]
+        
+        if self.all_methods:
+            # Gleicher Port → automatisch zweite Welle
+            self.test_results.update(self.run_port_matrix(env_cells + temp_cells))
+        else:
+            self.test_results.update(self.run_port_matrix(env_cells))
+            # Methode 2: Temporäre Datei (nur für Ports, deren ENV-Test nicht stabil war)
+            retry = [cell for cell, env_cell in zip(temp_cells, env_cells)
+                     if self.test_results[env_cell["name"]]["final_status"] != "stable"]
+            if retry:
+                print(f"\n🧪 Teste Methode 2 (Temporäre Datei) für {len(retry)} Port(s)")
+                self.test_results.update(self.run_port_matrix(retry))
             else:
-                print("✅ Umgebungsvariable war stabil - überspringe temporäre Datei")
-            
-            # Längere Pause zwischen Port-Tests
-            if i < len(self.port_configs):
-                print("\\n⏸️  Pause zwischen Port-Tests...")
-                time.sleep(5)
+                print("✅ Umgebungsvariable war überall stabil - überspringe temporäre Datei")
         
         # Ergebnisse analysieren
         stable_ports = self.analyze_results()
@@ -963,7 +990,23 @@ def main():
     print("📁 Testet Backend-Server auf verschiedenen Ports")
     print("🎯 Findet stabile Ports die nicht vom System getötet werden")
     
-    tester = PortTester()
+    parser = argparse.ArgumentParser(description='Parallel backend port stability matrix')
+    parser.add_argument('--window', type=float, default=60.0,
+                       help='Survival window per backend in seconds (default: 60)')
+    parser.add_argument('--interval', type=float, default=1.0,
+                       help='Seconds between health samples (default: 1)')
+    parser.add_argument('--all-methods', action='store_true',
+                       help='Test the temp-file method for every port, not only after ENV failures')
+    parser.add_argument('--ports', type=int, nargs='+', help='Only test these ports')
+    parser.add_argument('--failure-threshold', type=int, default=3,
+                       help='Consecutive failed health samples before a live process counts as dead (default: 3)')
+    args = parser.parse_args()
+    
+    tester = PortTester(survival_window=args.window, sample_interval=args.interval,
+                        all_methods=args.all_methods, failure_threshold=args.failure_threshold)
+    if args.ports:
+        known = {config["backend"]: config["name"] for config in tester.port_configs}
+        tester.port_configs = [{"backend": port, "name": known.get(port, f"Port-{port}")} for port in args.ports]
     
     try:
         stable_ports = tester.run_comprehensive_test()
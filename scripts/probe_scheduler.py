@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Probe Scheduler
+===============
+Nebenläufiger Scheduler für die Probes des Gaming Platform Monitors.
+
+Jede Probe (Health, DB, Ping, API-Endpunkte, eigene Probes) läuft in ihrem
+eigenen Takt auf der monotonen Event-Loop-Uhr:
+- Drift-frei: der nächste Termin wird aus dem Raster berechnet, nicht aus
+  "Ende der letzten Ausführung + Intervall"
+- Jitter: jeder Termin wird um einen kleinen Zufallsanteil verschoben, damit
+  nicht alle Probes gleichzeitig auf das Backend treffen
+- Deadline: eine Probe, die länger als ihr Timeout braucht, wird abgebrochen
+- Kein Aufstauen: läuft die vorherige Ausführung noch, wird der Tick
+  übersprungen statt eine zweite Ausführung zu starten
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class Probe:
+    """Eine periodisch ausgeführte Probe inkl. Laufzeit-Statistik"""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: float
+    timeout: Optional[float] = None
+    jitter: float = 0.1
+    runs: int = 0
+    skipped: int = 0
+    timeouts: int = 0
+    failures: int = 0
+    last_duration: float = 0.0
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def deadline(self) -> float:
+        """Timeout der Probe; standardmäßig ein Intervall"""
+        return self.timeout if self.timeout is not None else self.interval
+
+
+class ProbeScheduler:
+    """Führt registrierte Probes nebenläufig und drift-frei aus"""
+
+    def __init__(self, on_error: Optional[Callable[[Probe, BaseException], Awaitable[None]]] = None):
+        self.probes: Dict[str, Probe] = {}
+        self.on_error = on_error
+        self._stop_event: Optional[asyncio.Event] = None
+        self._loops: Dict[str, asyncio.Task] = {}
+
+    def add(self, name: str, func: Callable[[], Awaitable[Any]], interval: float,
+            timeout: Optional[float] = None, jitter: float = 0.1) -> Probe:
+        """Probe registrieren (vor oder während run(); während run() aus dem Event-Loop-Thread)"""
+        if interval <= 0:
+            raise ValueError(f"Probe interval must be positive: {name}")
+        probe = Probe(name=name, func=func, interval=interval, timeout=timeout, jitter=jitter)
+        self.probes[name] = probe
+        if self._stop_event is not None and not self._stop_event.is_set():
+            # Scheduler läuft bereits - Takt sofort starten, run() bricht ihn beim Stop ab
+            self._start_loop(probe)
+        return probe
+
+    def _start_loop(self, probe: Probe):
+        previous = self._loops.get(probe.name)
+        if previous:
+            previous.cancel()   # gleichnamige Probe ersetzt
+        self._loops[probe.name] = asyncio.create_task(self._probe_loop(probe))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Laufzeit-Statistik aller Probes"""
+        return {
+            name: {
+                "interval": probe.interval,
+                "runs": probe.runs,
+                "skipped": probe.skipped,
+                "timeouts": probe.timeouts,
+                "failures": probe.failures,
+                "last_duration_ms": probe.last_duration * 1000,
+            }
+            for name, probe in self.probes.items()
+        }
+
+    def stop(self):
+        """Alle Probe-Loops beenden"""
+        if self._stop_event:
+            self._stop_event.set()
+
+    async def run(self):
+        """Alle Probes bis stop() ausführen"""
+        self._stop_event = asyncio.Event()
+        for probe in self.probes.values():
+            self._start_loop(probe)
+        try:
+            await self._stop_event.wait()
+        finally:
+            loops = list(self._loops.values())
+            self._loops.clear()
+            for task in loops:
+                task.cancel()
+            running = [probe.task for probe in self.probes.values()
+                       if probe.task and not probe.task.done()]
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*loops, *running, return_exceptions=True)
+
+    async def _probe_loop(self, probe: Probe):
+        """Raster-basierter Takt einer einzelnen Probe"""
+        loop = asyncio.get_running_loop()
+        # Start zufällig im ersten Intervall verteilen, damit Probes nicht synchron laufen
+        next_tick = loop.time() + random.uniform(0, probe.interval * probe.jitter)
+
+        while not self._stop_event.is_set():
+            fire_at = next_tick + random.uniform(-1, 1) * probe.interval * probe.jitter
+            delay = fire_at - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+
+            if probe.task and not probe.task.done():
+                # Vorherige Ausführung läuft noch - Tick auslassen statt aufzustauen
+                probe.skipped += 1
+            else:
+                probe.task = asyncio.create_task(self._execute(probe))
+
+            # Drift-frei: nächster Termin im festen Raster
+            next_tick += probe.interval
+            behind = loop.time() - next_tick
+            if behind > 0:
+                missed = int(behind // probe.interval) + 1
+                probe.skipped += missed
+                next_tick += missed * probe.interval
+
+    async def _execute(self, probe: Probe):
+        """Eine Ausführung mit Deadline"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await asyncio.wait_for(probe.func(), timeout=probe.deadline)
+            probe.runs += 1
+        except asyncio.TimeoutError as e:
+            probe.timeouts += 1
+            if self.on_error:
+                await self.on_error(probe, e)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            probe.failures += 1
+            if self.on_error:
+                await self.on_error(probe, e)
+        finally:
+            probe.last_duration = loop.time() - start
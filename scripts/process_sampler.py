@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Process Sampler
+===============
+Ressourcen-Sampler für gestartete Backend-/Frontend-Prozesse inkl. aller
+Kindprozesse (z.B. node-Prozesse unter 'npm start' oder einer Shell).
+
+Liest direkt aus /proc, ohne ps/top aufzurufen:
+- /proc/<pid>/stat    → Eltern-PID, Zustand, CPU-Zeit (utime + stime)
+- /proc/<pid>/status  → VmRSS, Threads
+- /proc/<pid>/fd      → Anzahl offener Dateideskriptoren
+
+Pro Tick werden nur die bekannten Prozesse des Baums gelesen. Der Baum selbst
+(welche PIDs gehören dazu) wird über /proc/<pid>/task/<tid>/children bestimmt,
+ohne diese Kernel-Option über einen Scan aller /proc/*/stat - der Scan läuft
+höchstens alle tree_refresh Sekunden. Damit sind 1-10 Hz unkritisch.
+
+Usage:
+    python process_sampler.py --pid 12345 --hz 2
+    python process_sampler.py --match server.js --hz 5 --duration 60
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROC = "/proc"
+PROC_AVAILABLE = os.path.isdir(PROC)
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+@dataclass
+class ProcessInfo:
+    """Momentaufnahme eines einzelnen Prozesses"""
+    pid: int
+    ppid: int
+    name: str
+    state: str
+    cpu_seconds: float
+    rss_mb: float = 0.0
+    threads: int = 0
+    fds: Optional[int] = None    # None = keine Berechtigung für /proc/<pid>/fd
+
+
+@dataclass
+class TreeSample:
+    """Summen über einen Prozessbaum"""
+    name: str
+    root_pid: Optional[int]
+    alive: bool
+    timestamp: float
+    processes: int = 0
+    rss_mb: float = 0.0
+    cpu_percent: float = 0.0
+    threads: int = 0
+    fds: int = 0
+    members: List[ProcessInfo] = field(default_factory=list, repr=False)
+
+
+def read_process(pid: int, with_fds: bool = True) -> Optional[ProcessInfo]:
+    """/proc/<pid> lesen; None wenn der Prozess weg oder ein Zombie ist"""
+    base = f"{PROC}/{pid}"
+    try:
+        with open(f"{base}/stat", "r") as f:
+            stat = f.read()
+        with open(f"{base}/status", "r") as f:
+            status = f.read()
+    except OSError:
+        return None
+    # comm steht in Klammern und darf Leerzeichen enthalten
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    if fields[0] in ("Z", "X"):
+        return None
+    info = ProcessInfo(
+        pid=pid,
+        ppid=int(fields[1]),
+        name=name,
+        state=fields[0],
+        cpu_seconds=(int(fields[11]) + int(fields[12])) / CLOCK_TICKS,
+    )
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            info.rss_mb = int(line.split()[1]) / 1024
+        elif line.startswith("Threads:"):
+            info.threads = int(line.split()[1])
+    if with_fds:
+        try:
+            info.fds = len(os.listdir(f"{base}/fd"))
+        except OSError:
+            info.fds = None
+    return info
+
+
+def _read_ppid(pid: str) -> Optional[int]:
+    try:
+        with open(f"{PROC}/{pid}/stat", "r") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    return int(stat[stat.rindex(")") + 2:].split()[1])
+
+
+def parent_map() -> Dict[int, List[int]]:
+    """Eltern-PID → Kind-PIDs über alle Prozesse (ein Scan von /proc)"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir(PROC):
+        if entry.isdigit():
+            ppid = _read_ppid(entry)
+            if ppid is not None:
+                children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def direct_children(pid: int) -> Optional[List[int]]:
+    """Kinder über /proc/<pid>/task/*/children; None wenn der Kernel das nicht anbietet"""
+    try:
+        tasks = os.listdir(f"{PROC}/{pid}/task")
+    except OSError:
+        return []
+    result = []
+    for tid in tasks:
+        try:
+            with open(f"{PROC}/{pid}/task/{tid}/children", "r") as f:
+                result.extend(int(child) for child in f.read().split())
+        except FileNotFoundError:
+            return None
+        except OSError:
+            continue
+    return result
+
+
+def find_processes(pattern: str) -> List[int]:
+    """PIDs, deren Kommandozeile pattern enthält - ohne Prozesse, deren Elternprozess auch passt"""
+    matches = {}
+    own_pid = os.getpid()
+    for entry in os.listdir(PROC):
+        if not entry.isdigit() or int(entry) == own_pid:
+            continue
+        try:
+            with open(f"{PROC}/{entry}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode("utf-8", "replace")
+        except OSError:
+            continue
+        if pattern in cmdline:
+            matches[int(entry)] = _read_ppid(entry)
+    return sorted(pid for pid, ppid in matches.items() if ppid not in matches)
+
+
+class ProcessSampler:
+    """Sammelt RSS/CPU/Threads/FDs für benannte Prozessbäume"""
+
+    def __init__(self, tree_refresh: float = 2.0, with_fds: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.tree_refresh = tree_refresh
+        self.with_fds = with_fds
+        self.clock = clock
+        self.roots: Dict[str, Optional[int]] = {}
+        self.patterns: Dict[str, str] = {}
+        self._members: Dict[str, List[int]] = {}
+        self._tree_at = float("-inf")
+        self._children_supported: Optional[bool] = None
+        # pid → (Zeitpunkt, CPU-Sekunden) des letzten Samples
+        self._last_cpu: Dict[int, Tuple[float, float]] = {}
+        self.latest: Dict[str, TreeSample] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def watch(self, name: str, pid: int):
+        """Prozessbaum ab pid unter name beobachten"""
+        self.roots[name] = pid
+        self._tree_at = float("-inf")
+
+    def watch_pattern(self, name: str, pattern: str):
+        """Prozess über die Kommandozeile finden; nach einem Neustart wird neu gesucht"""
+        self.patterns[name] = pattern
+        self.roots[name] = None
+        self._tree_at = float("-inf")
+
+    def unwatch(self, name: str):
+        self.roots.pop(name, None)
+        self.patterns.pop(name, None)
+        self._members.pop(name, None)
+        self.latest.pop(name, None)
+
+    def _descendants(self, root: int, children_of: Callable[[int], List[int]]) -> List[int]:
+        members, stack = [], [root]
+        while stack:
+            pid = stack.pop()
+            members.append(pid)
+            stack.extend(children_of(pid))
+        return members
+
+    def _refresh_tree(self):
+        for name, pattern in self.patterns.items():
+            root = self.roots.get(name)
+            if root is None or not os.path.exists(f"{PROC}/{root}"):
+                found = find_processes(pattern)
+                self.roots[name] = found[0] if found else None
+
+        if self._children_supported is not False:
+            for name, root in self.roots.items():
+                if root is None:
+                    self._members[name] = []
+                    continue
+                if direct_children(root) is None:
+                    self._children_supported = False
+                    break
+                self._members[name] = self._descendants(root, lambda pid: direct_children(pid) or [])
+            else:
+                self._children_supported = True
+                return
+
+        children = parent_map()
+        for name, root in self.roots.items():
+            self._members[name] = self._descendants(root, lambda pid: children.get(pid, [])) if root else []
+
+    def sample(self) -> Dict[str, TreeSample]:
+        """Ein Sample aller beobachteten Bäume"""
+        now = self.clock()
+        if now - self._tree_at >= self.tree_refresh:
+            self._refresh_tree()
+            self._tree_at = now
+
+        samples: Dict[str, TreeSample] = {}
+        seen = set()
+        for name, root in self.roots.items():
+            tree = TreeSample(name=name, root_pid=root, alive=False, timestamp=time.time())
+            for pid in self._members.get(name, []):
+                info = read_process(pid, self.with_fds)
+                if info is None:
+                    continue
+                if pid == root:
+                    tree.alive = True
+                seen.add(pid)
+                tree.members.append(info)
+                tree.processes += 1
+                tree.rss_mb += info.rss_mb
+                tree.threads += info.threads
+                tree.fds += info.fds or 0
+                last = self._last_cpu.get(pid)
+                if last and now > last[0]:
+                    tree.cpu_percent += (info.cpu_seconds - last[1]) / (now - last[0]) * 100
+                self._last_cpu[pid] = (now, info.cpu_seconds)
+            tree.rss_mb = round(tree.rss_mb, 2)
+            tree.cpu_percent = round(max(tree.cpu_percent, 0.0), 1)
+            samples[name] = tree
+
+        for pid in set(self._last_cpu) - seen:
+            del self._last_cpu[pid]
+        self.latest = samples
+        return samples
+
+    def totals(self) -> Tuple[float, float]:
+        """(RSS in MB, CPU in %) über alle beobachteten Bäume aus dem letzten Sample"""
+        return (round(sum(tree.rss_mb for tree in self.latest.values()), 2),
+                round(sum(tree.cpu_percent for tree in self.latest.values()), 1))
+
+    def start(self, callback: Callable[[Dict[str, TreeSample]], None], hz: float = 1.0):
+        """Sampling in einem Hintergrund-Thread (für synchrone Skripte)"""
+        interval = 1.0 / max(min(hz, 10.0), 0.1)
+
+        def loop():
+            next_at = time.monotonic()
+            while not self._stop.is_set():
+                try:
+                    callback(self.sample())
+                except Exception as e:
+                    print(f"⚠️ Process sampler: {e}")
+                # Feste Taktung ohne Drift
+                next_at += interval
+                self._stop.wait(max(0.0, next_at - time.monotonic()))
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name="process-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+
+def format_tree(tree: TreeSample) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Ausgaben"""
+    if not tree.alive:
+        return f"{tree.name}: not running"
+    return (f"{tree.name}: {tree.rss_mb:.1f}MB RSS | CPU {tree.cpu_percent:.0f}% | "
+            f"{tree.threads} threads | {tree.fds} fds | {tree.processes} proc")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sample CPU/RSS/threads/fds of a process tree from /proc')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--pid', type=int, help='Root PID')
+    target.add_argument('--match', help='Substring of the command line (e.g. server.js)')
+    parser.add_argument('--hz', type=float, default=1.0, help='Samples per second, 0.1-10 (default: 1)')
+    parser.add_argument('--duration', type=float, help='Stop after N seconds (default: until Ctrl+C)')
+    parser.add_argument('--members', action='store_true', help='Show every process of the tree')
+    args = parser.parse_args()
+
+    sampler = ProcessSampler()
+    if args.pid:
+        sampler.watch("process", args.pid)
+    else:
+        sampler.watch_pattern(args.match, args.match)
+
+    def show(samples):
+        for tree in samples.values():
+            print(f"[{time.strftime('%H:%M:%S')}] {format_tree(tree)}")
+            if args.members:
+                for info in tree.members:
+                    print(f"    {info.pid:>7} {info.name:<16} {info.rss_mb:>8.1f}MB {info.threads:>3} thr")
+
+    sampler.start(show, args.hz)
+    try:
+        time.sleep(args.duration) if args.duration else threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sampler.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Readiness
+=========
+Ereignisgesteuerte Startup-Erkennung für gestartete Server (Backend, Frontend).
+
+Statt einmal pro Sekunde /health abzufragen, werden drei Signale kombiniert:
+- stdout: die "listening"-Zeile des Kindprozesses (weckt den Wartenden sofort)
+- socket: der LISTEN-Socket auf dem Port erscheint in /proc/net/tcp{,6}
+- probe:  HTTP-Probe (bzw. TCP-Connect) mit exponentiellem Backoff ab ~10ms
+
+Ein Service gilt als bereit, sobald die Probe erfolgreich ist. Sobald stdout-Zeile
+oder Socket gesehen wurden, fällt der Backoff wieder auf den Startwert zurück -
+die Probe kommt dann ohne Wartezeit hinterher. Pro Service wird die Zeit bis zu
+jedem Signal festgehalten (time-to-ready).
+
+Usage:
+    python readiness.py --port 3001 --url http://localhost:3001/health
+    python readiness.py --port 3001 --cwd ../backend --pattern "running on port" -- node server.js
+"""
+
+import argparse
+import http.client
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, TextIO
+from urllib.parse import urlparse
+
+from port_inspect import PORT_INSPECT_AVAILABLE, read_sockets
+
+INITIAL_DELAY = 0.01
+MAX_DELAY = 0.5
+
+
+@dataclass
+class ReadinessResult:
+    """Startup-Zeiten eines Services, in Sekunden ab Prozessstart"""
+    name: str
+    ready: bool
+    time_to_ready: Optional[float] = None
+    signal: Optional[str] = None            # Signal, das die Probe ausgelöst hat
+    stdout_at: Optional[float] = None
+    socket_at: Optional[float] = None
+    probe_at: Optional[float] = None
+    probes: int = 0
+    error: Optional[str] = None
+
+
+def http_probe(url: str, timeout: float = 2.0) -> bool:
+    """True bei HTTP-Status < 500; eigene Verbindung pro Probe, ohne Pooling"""
+    parsed = urlparse(url)
+    conn_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+    conn = conn_class(parsed.hostname, parsed.port, timeout=timeout)
+    try:
+        conn.request("GET", parsed.path or "/")
+        return conn.getresponse().status < 500
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+def tcp_probe(port: int, host: str = "127.0.0.1", timeout: float = 1.0) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def port_listening(port: int) -> bool:
+    """LISTEN-Socket auf port in /proc/net/tcp{,6} (ohne Verbindungsaufbau)"""
+    return bool(read_sockets([port], ("LISTEN",)))
+
+
+class ReadinessWatcher:
+    """Wartet auf einen Service und misst die Zeit bis zur Bereitschaft"""
+
+    def __init__(self, name: str, port: int, url: Optional[str] = None,
+                 process: Optional[subprocess.Popen] = None,
+                 ready_pattern: Optional[str] = None,
+                 started_at: Optional[float] = None):
+        self.name = name
+        self.port = port
+        self.url = url
+        self.process = process
+        self.ready_pattern = re.compile(ready_pattern) if ready_pattern else None
+        self.started_at = started_at if started_at is not None else time.monotonic()
+        self._wake = threading.Event()
+        self._stdout_at: Optional[float] = None
+        self._reader: Optional[threading.Thread] = None
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def feed_line(self, line: str):
+        """Eine Ausgabezeile des Services prüfen (für fremde Log-Reader)"""
+        if self._stdout_at is None and self.ready_pattern and self.ready_pattern.search(line):
+            self._stdout_at = self._elapsed()
+            self._wake.set()
+
+    def watch_stream(self, stream: TextIO, echo: Optional[Callable[[str], None]] = None):
+        """stdout des Kindprozesses in einem Thread lesen (und weiter ausgeben)
+
+        Der Thread liest bis EOF - die Pipe läuft also auch nach dem Start nicht voll.
+        """
+        def pump():
+            for line in iter(stream.readline, ""):
+                self.feed_line(line)
+                if echo:
+                    echo(line.rstrip("\n"))
+            # EOF: Prozess beendet - den Wartenden wecken
+            self._wake.set()
+
+        self._reader = threading.Thread(target=pump, name=f"{self.name}-stdout", daemon=True)
+        self._reader.start()
+
+    def wait_eof(self, timeout: float = 1.0):
+        """Warten bis der stdout-Reader die restliche Ausgabe gelesen hat (nach Prozessende)"""
+        if self._reader:
+            self._reader.join(timeout)
+
+    def _probe(self) -> bool:
+        if self.url:
+            return http_probe(self.url)
+        return tcp_probe(self.port)
+
+    def wait(self, timeout: float) -> ReadinessResult:
+        """Blockiert bis der Service bereit ist, der Prozess endet oder timeout abläuft"""
+        result = ReadinessResult(name=self.name, ready=False)
+        deadline = self.started_at + timeout
+        delay = INITIAL_DELAY
+        trigger = "probe"
+
+        while True:
+            if self.process is not None and self.process.poll() is not None:
+                result.error = f"process exited with code {self.process.returncode}"
+                break
+
+            if result.stdout_at is None and self._stdout_at is not None:
+                result.stdout_at = self._stdout_at
+                trigger, delay = "stdout", INITIAL_DELAY
+            if result.socket_at is None and PORT_INSPECT_AVAILABLE and port_listening(self.port):
+                result.socket_at = self._elapsed()
+                if trigger == "probe":
+                    trigger = "socket"
+                delay = INITIAL_DELAY
+
+            result.probes += 1
+            if self._probe():
+                result.ready = True
+                result.probe_at = self._elapsed()
+                result.time_to_ready = result.probe_at
+                result.signal = trigger
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                result.error = f"not ready after {timeout:g}s"
+                break
+            # stdout-Treffer weckt sofort, sonst exponentieller Backoff
+            self._wake.wait(min(delay, remaining))
+            self._wake.clear()
+            delay = min(delay * 2, MAX_DELAY)
+
+        result.stdout_at = result.stdout_at if result.stdout_at is not None else self._stdout_at
+        return result
+
+
+def format_result(result: ReadinessResult) -> str:
+    """Einzeilige Zusammenfassung für Konsolen-Ausgaben"""
+    if not result.ready:
+        return f"{result.name}: NOT READY ({result.error}, {result.probes} probes)"
+    marks = []
+    for label, value in (("stdout", result.stdout_at), ("socket", result.socket_at)):
+        if value is not None:
+            marks.append(f"{label} {value * 1000:.0f}ms")
+    details = f" ({', '.join(marks)})" if marks else ""
+    return (f"{result.name}: ready in {result.time_to_ready * 1000:.0f}ms via {result.signal}"
+            f"{details}, {result.probes} probes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Wait until a server is ready and report time-to-ready')
+    parser.add_argument('--port', type=int, required=True, help='Port the server listens on')
+    parser.add_argument('--url', help='HTTP URL to probe (default: TCP connect to the port)')
+    parser.add_argument('--pattern', help='Regex of the stdout line that announces readiness')
+    parser.add_argument('--cwd', help='Working directory for the command')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Seconds to wait (default: 30)')
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='Command to start (after --)')
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    process = None
+    started_at = time.monotonic()
+    if command:
+        process = subprocess.Popen(command, cwd=args.cwd, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+
+    watcher = ReadinessWatcher(command[0] if command else f"port {args.port}", args.port,
+                               url=args.url, process=process, ready_pattern=args.pattern,
+                               started_at=started_at)
+    if process:
+        watcher.watch_stream(process.stdout, echo=lambda line: print(f"   | {line}"))
+
+    result = watcher.wait(args.timeout)
+    print(("✅ " if result.ready else "❌ ") + format_result(result))
+
+    if process:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return 0 if result.ready else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
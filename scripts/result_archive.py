@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Result Archive
+==============
+Kompaktes Spalten-Archiv für die Ergebnisse der Test-Platform.
+
+Jeder Lauf wird zusätzlich zur JSON-Datei als Zeilen (ein Check = eine Zeile)
+an eine Monatsdatei docs/testing/archive/results_YYYYMM.rra angehängt:
+
+    run, category, check, status, status_code, response_time_ms
+
+Strings sind dictionary-kodiert, jede Spalte liegt als zusammenhängender
+Little-Endian-Block vor (array-Typecodes I/I/I/B/h/f, 19 Bytes pro Zeile).
+Ein Monat wird mit einem einzigen read() geladen; Response-Bodies ("data")
+landen nicht im Archiv.
+
+Auswertungen über die gesamte Historie laufen mit NumPy vektorisiert
+(np.frombuffer + bincount), ohne NumPy über die array-Spalten.
+
+Dateiformat:
+    b"RRA1" | uint32 Header-Länge | Header (JSON) | Spaltenblöcke in Header-Reihenfolge
+
+Usage:
+    python result_archive.py import      # vorhandene test_results_*.json übernehmen
+    python result_archive.py stats       # Aggregat je Check über alle Läufe
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MAGIC = b"RRA1"
+FORMAT_VERSION = 1
+ARCHIVE_DIR = "archive"
+RESULT_GLOB = "test_results_*.json"
+
+# (Spalte, array-Typecode, NumPy-dtype)
+COLUMNS = (
+    ("run", "I", "<u4"),
+    ("category", "I", "<u4"),
+    ("check", "I", "<u4"),
+    ("status", "B", "u1"),
+    ("status_code", "h", "<i2"),
+    ("response_time_ms", "f", "<f4"),
+)
+STRING_COLUMNS = ("category", "check", "status")
+NO_STATUS_CODE = -1
+
+# Kategorien ohne einzelne Checks (Metadaten, eigene Auswertungen)
+SKIP_KEYS = ("timestamp", "summary", "data", "execution", "load_curve", "regressions")
+
+
+def iter_rows(results: Dict[str, Any]) -> Iterator[Tuple[str, str, str, int, float]]:
+    """(category, check, status, status_code, response_time_ms) je Check im Ergebnis-Dict"""
+
+    def walk(node, path):
+        if not isinstance(node, dict):
+            return
+        if isinstance(node.get("status"), str) and len(path) > 1:
+            status_code = node.get("status_code")
+            response_time = node.get("response_time")
+            yield (path[0], ".".join(path[1:]), node["status"],
+                   status_code if isinstance(status_code, int) else NO_STATUS_CODE,
+                   float(response_time) * 1000 if isinstance(response_time, (int, float)) else math.nan)
+        for key, child in node.items():
+            if key not in SKIP_KEYS:
+                yield from walk(child, path + [str(key)])
+
+    yield from walk(results, [])
+
+
+def run_month(run_id: str, results: Dict[str, Any]) -> str:
+    """YYYYMM des Laufs - aus dem Zeitstempel, sonst aus dem Dateinamen"""
+    try:
+        return datetime.fromisoformat(results["timestamp"]).strftime("%Y%m")
+    except (KeyError, TypeError, ValueError):
+        match = re.search(r"(\d{6})\d{2}_\d{4}", run_id)
+        return match.group(1) if match else datetime.now().strftime("%Y%m")
+
+
+def _column_from_bytes(blob: bytes, typecode: str, dtype: str):
+    if NUMPY_AVAILABLE:
+        return np.frombuffer(blob, dtype=dtype)
+    column = array(typecode)
+    column.frombytes(blob)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+def _column_to_bytes(column, typecode: str) -> bytes:
+    column = array(typecode, column)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+class MonthFile:
+    """Eine Monatsdatei des Archivs"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.runs: List[Dict[str, Any]] = []
+        self.strings: Dict[str, List[str]] = {name: [] for name in STRING_COLUMNS}
+        self.columns: Dict[str, Any] = {name: array(typecode) for name, typecode, _ in COLUMNS}
+        if self.path.exists():
+            self._read()
+
+    def __len__(self):
+        return len(self.columns["run"])
+
+    def _read(self):
+        with open(self.path, "rb") as f:
+            blob = f.read()
+        if blob[:4] != MAGIC:
+            raise ValueError(f"{self.path}: not a result archive")
+        (header_len,) = struct.unpack_from("<I", blob, 4)
+        header = json.loads(blob[8:8 + header_len].decode("utf-8"))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported archive version {header.get('version')}")
+        self.runs = header["runs"]
+        self.strings = header["strings"]
+        offset = 8 + header_len
+        rows = header["rows"]
+        for name, typecode, dtype in COLUMNS:
+            size = rows * array(typecode).itemsize
+            self.columns[name] = _column_from_bytes(blob[offset:offset + size], typecode, dtype)
+            offset += size
+
+    def has_run(self, run_id: str) -> bool:
+        return any(run["run_id"] == run_id for run in self.runs)
+
+    def append(self, run_id: str, results: Dict[str, Any]) -> int:
+        """Lauf anhängen; liefert die Anzahl Zeilen"""
+        # Beim Anhängen immer mit array-Spalten arbeiten (NumPy-Sichten sind read-only)
+        columns = {name: array(typecode, self.columns[name]) for name, typecode, _ in COLUMNS}
+        lookup = {name: {value: i for i, value in enumerate(self.strings[name])} for name in STRING_COLUMNS}
+
+        def code(column, value):
+            if value not in lookup[column]:
+                lookup[column][value] = len(self.strings[column])
+                self.strings[column].append(value)
+            return lookup[column][value]
+
+        run_index = len(self.runs)
+        self.runs.append({"run_id": run_id, "timestamp": results.get("timestamp")})
+        rows = 0
+        for category, check, status, status_code, response_time in iter_rows(results):
+            columns["run"].append(run_index)
+            columns["category"].append(code("category", category))
+            columns["check"].append(code("check", check))
+            columns["status"].append(code("status", status))
+            columns["status_code"].append(max(-32768, min(32767, status_code)))
+            columns["response_time_ms"].append(response_time)
+            rows += 1
+        self.columns = columns
+        return rows
+
+    def save(self):
+        header = json.dumps({
+            "version": FORMAT_VERSION,
+            "rows": len(self),
+            "columns": [name for name, _, _ in COLUMNS],
+            "runs": self.runs,
+            "strings": self.strings,
+        }, ensure_ascii=False).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for name, typecode, _ in COLUMNS:
+                f.write(_column_to_bytes(self.columns[name], typecode))
+        os.replace(tmp_path, self.path)
+
+
+class ResultTable:
+    """Alle geladenen Zeilen als Spalten, Codes über Monatsgrenzen vereinheitlicht"""
+
+    def __init__(self):
+        self.runs: List[Dict[str, Any]] = []
+        self.strings: Dict[str, List[str]] = {name: [] for name in STRING_COLUMNS}
+        self.columns: Dict[str, Any] = {name: [] for name, _, _ in COLUMNS}
+
+    def __len__(self):
+        return len(self.columns["run"])
+
+    @classmethod
+    def from_months(cls, months: Sequence[MonthFile]) -> "ResultTable":
+        table = cls()
+        lookup = {name: {} for name in STRING_COLUMNS}
+        parts = {name: [] for name, _, _ in COLUMNS}
+        for month in months:
+            offset = len(table.runs)
+            table.runs.extend(month.runs)
+            mappings = {}
+            for name in STRING_COLUMNS:
+                mapping = []
+                for value in month.strings[name]:
+                    if value not in lookup[name]:
+                        lookup[name][value] = len(table.strings[name])
+                        table.strings[name].append(value)
+                    mapping.append(lookup[name][value])
+                mappings[name] = mapping
+            for name, _, _ in COLUMNS:
+                column = month.columns[name]
+                if name == "run":
+                    column = column + offset if NUMPY_AVAILABLE else [value + offset for value in column]
+                elif name in mappings:
+                    if NUMPY_AVAILABLE:
+                        column = np.asarray(mappings[name], dtype=np.uint32)[column] if len(column) else column
+                    else:
+                        mapping = mappings[name]
+                        column = [mapping[value] for value in column]
+                parts[name].append(column)
+        for name, typecode, dtype in COLUMNS:
+            if NUMPY_AVAILABLE:
+                table.columns[name] = (np.concatenate(parts[name]).astype(dtype, copy=False)
+                                       if parts[name] else np.empty(0, dtype=dtype))
+            else:
+                column = array(typecode)
+                for part in parts[name]:
+                    column.extend(part)
+                table.columns[name] = column
+        return table
+
+    def _groups(self):
+        """Gruppen-Schlüssel je Zeile: category * n_checks + check"""
+        n_checks = max(len(self.strings["check"]), 1)
+        categories, checks = self.columns["category"], self.columns["check"]
+        if NUMPY_AVAILABLE:
+            keys = categories.astype(np.int64) * n_checks + checks
+            unique, inverse = np.unique(keys, return_inverse=True)
+        else:
+            keys = [category * n_checks + check for category, check in zip(categories, checks)]
+            unique = sorted(set(keys))
+            position = {key: i for i, key in enumerate(unique)}
+            inverse = [position[key] for key in keys]
+        names = [(f"{self.strings['category'][int(key) // n_checks]}.{self.strings['check'][int(key) % n_checks]}",
+                  int(key)) for key in unique]
+        return names, inverse
+
+    def aggregate(self) -> Dict[str, Dict[str, Any]]:
+        """Je Check: Anzahl, Pass-Rate, Median/p95/Mittel der Response-Time über alle Läufe"""
+        if not len(self):
+            return {}
+        names, inverse = self._groups()
+        pass_code = self.strings["status"].index("PASS") if "PASS" in self.strings["status"] else -1
+        if NUMPY_AVAILABLE:
+            return self._aggregate_numpy(names, inverse, pass_code)
+        return self._aggregate_python(names, inverse, pass_code)
+
+    def _aggregate_numpy(self, names, inverse, pass_code) -> Dict[str, Dict[str, Any]]:
+        groups = len(names)
+        counts = np.bincount(inverse, minlength=groups)
+        passes = np.bincount(inverse, weights=(self.columns["status"] == pass_code), minlength=groups)
+        times = self.columns["response_time_ms"].astype(np.float64)
+        timed = ~np.isnan(times)
+        # Nach Gruppe, dann Zeit sortieren - Perzentile je Gruppe aus zusammenhängenden Blöcken
+        order = np.lexsort((times[timed], inverse[timed]))
+        sorted_times = times[timed][order]
+        bounds = np.searchsorted(inverse[timed][order], np.arange(groups + 1))
+        stats = {}
+        for i, (name, _) in enumerate(names):
+            block = sorted_times[bounds[i]:bounds[i + 1]]
+            stats[name] = _stats(int(counts[i]), int(passes[i]), block)
+        return stats
+
+    def _aggregate_python(self, names, inverse, pass_code) -> Dict[str, Dict[str, Any]]:
+        counts = [0] * len(names)
+        passes = [0] * len(names)
+        times: List[List[float]] = [[] for _ in names]
+        for group, status, value in zip(inverse, self.columns["status"], self.columns["response_time_ms"]):
+            counts[group] += 1
+            passes[group] += status == pass_code
+            if not math.isnan(value):
+                times[group].append(value)
+        return {name: _stats(counts[i], passes[i], sorted(times[i])) for i, (name, _) in enumerate(names)}
+
+
+def _percentile(ordered, p: float) -> float:
+    """Perzentil mit linearer Interpolation über bereits sortierte Werte"""
+    if not len(ordered):
+        return 0.0
+    position = (len(ordered) - 1) * p / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower))
+
+
+def _stats(count: int, passes: int, ordered_times) -> Dict[str, Any]:
+    return {
+        "count": count,
+        "pass_rate": round(passes / count * 100, 1) if count else 0.0,
+        "timed": len(ordered_times),
+        "median_ms": round(_percentile(ordered_times, 50), 3),
+        "p95_ms": round(_percentile(ordered_times, 95), 3),
+        "mean_ms": round(float(sum(ordered_times)) / len(ordered_times), 3) if len(ordered_times) else 0.0,
+    }
+
+
+class ResultArchive:
+    """Monatsdateien unter <results_dir>/archive"""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+        self.archive_dir = self.results_dir / ARCHIVE_DIR
+
+    def month_path(self, month: str) -> Path:
+        return self.archive_dir / f"results_{month}.rra"
+
+    def months(self) -> List[Path]:
+        return sorted(self.archive_dir.glob("results_*.rra"))
+
+    def append(self, run_id: str, results: Dict[str, Any]) -> int:
+        """Lauf ins Monatsarchiv schreiben (idempotent je run_id); liefert die Anzahl Zeilen"""
+        month = MonthFile(self.month_path(run_month(run_id, results)))
+        if month.has_run(run_id):
+            return 0
+        rows = month.append(run_id, results)
+        month.save()
+        return rows
+
+    def import_directory(self, pattern: str = RESULT_GLOB) -> Tuple[int, int]:
+        """Vorhandene JSON-Ergebnisse übernehmen; (Läufe, Zeilen)"""
+        months: Dict[str, MonthFile] = {}
+        runs = rows = 0
+        for path in sorted(self.results_dir.glob(pattern)):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    results = json.load(f)
+            except (OSError, ValueError):
+                continue
+            month_key = run_month(path.stem, results)
+            if month_key not in months:
+                months[month_key] = MonthFile(self.month_path(month_key))
+            month = months[month_key]
+            if month.has_run(path.stem):
+                continue
+            rows += month.append(path.stem, results)
+            runs += 1
+        for month in months.values():
+            month.save()
+        return runs, rows
+
+    def load(self, since: Optional[str] = None, until: Optional[str] = None) -> ResultTable:
+        """Monate [since, until] (YYYYMM) als eine Tabelle laden"""
+        months = []
+        for path in self.months():
+            month = path.stem.split("_", 1)[1]
+            if (since and month < since) or (until and month > until):
+                continue
+            months.append(MonthFile(path))
+        return ResultTable.from_months(months)
+
+
+def print_stats(stats: Dict[str, Dict[str, Any]]):
+    print(f"  {'Check':<40} {'Runs':>5} {'Pass':>7} {'median':>9} {'p95':>9}")
+    for name, entry in sorted(stats.items()):
+        if entry["timed"]:
+            times = f"{entry['median_ms']:>7.2f}ms {entry['p95_ms']:>7.2f}ms"
+        else:
+            times = f"{'-':>9} {'-':>9}"
+        print(f"  {name:<40} {entry['count']:>5} {entry['pass_rate']:>6.1f}% {times}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar archive for test_platform results')
+    parser.add_argument('command', choices=['import', 'stats'], help='import JSON results or show aggregate')
+    parser.add_argument('--results-dir', default=str(Path(__file__).parent.parent / "docs" / "testing"),
+                        help='Directory with test_results_*.json (default: docs/testing)')
+    parser.add_argument('--since', help='First month to include (YYYYMM)')
+    parser.add_argument('--until', help='Last month to include (YYYYMM)')
+    args = parser.parse_args()
+
+    archive = ResultArchive(Path(args.results_dir))
+    if args.command == 'import':
+        runs, rows = archive.import_directory()
+        print(f"📦 Archived {runs} runs ({rows} rows) into {archive.archive_dir}")
+        return 0
+
+    started = time.perf_counter()
+    table = archive.load(args.since, args.until)
+    stats = table.aggregate()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"📊 {len(table.runs)} runs, {len(table)} rows "
+          f"({'numpy' if NUMPY_AVAILABLE else 'array'}, {elapsed:.1f}ms)")
+    print_stats(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
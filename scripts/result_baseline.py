@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Result Baseline
+===============
+Baseline und Regressions-Erkennung für die Ergebnisse der Test-Platform.
+
+test_platform.py speichert jeden Lauf als docs/testing/test_results_*.json.
+Dieses Modul indexiert diese Dateien (Index-Cache nach Dateigröße/mtime,
+damit alte Läufe nicht bei jedem Aufruf neu geparst werden), sammelt pro
+Endpunkt die response_time-Werte erfolgreicher Checks und vergleicht den
+aktuellen Lauf dagegen:
+
+- Pro Endpunkt: Bootstrap-Konfidenzintervall (obere Grenze) für das p95 der
+  Baseline; eine Regression liegt vor, wenn der aktuelle Wert darüber liegt
+  UND sowohl relativ (min_slowdown) als auch absolut (min_delta_ms) spürbar
+  langsamer ist als der Baseline-Median. Gibt es mehrere aktuelle Samples,
+  wird stattdessen ein einseitiger Mann-Whitney-U-Test verwendet.
+- Suite-weit: Mann-Whitney-U-Test der Verhältnisse (Wert / Median) des
+  aktuellen Laufs gegen die Leave-one-out-Verhältnisse der Baseline-Läufe -
+  erkennt eine allgemeine Verlangsamung, auch wenn kein Einzelwert auffällt.
+
+Usage:
+    python result_baseline.py                      # neuester Lauf gegen die vorherigen
+    python result_baseline.py current.json --fail  # Exit-Code 1 bei Regression
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+RESULT_GLOB = "test_results_*.json"
+INDEX_FILE = "baseline_index.json"
+INDEX_VERSION = 1
+
+
+def extract_samples(results: Dict[str, Any]) -> Dict[str, List[float]]:
+    """Alle response_time-Werte (in ms) erfolgreicher Checks, Schlüssel = Pfad im JSON"""
+    samples: Dict[str, List[float]] = {}
+
+    def walk(node, path):
+        if not isinstance(node, dict):
+            return
+        value = node.get("response_time")
+        if isinstance(value, (int, float)) and node.get("status", "PASS") == "PASS":
+            samples.setdefault(".".join(path), []).append(float(value) * 1000)
+        for key, child in node.items():
+            if key not in ("data", "summary", "regressions"):
+                walk(child, path + [str(key)])
+
+    walk(results, [])
+    return samples
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """Perzentil mit linearer Interpolation"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * p / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def bootstrap_upper(values: Sequence[float], p: float = 95.0, confidence: float = 0.95,
+                    iterations: int = 2000, rng: Optional[random.Random] = None) -> float:
+    """Obere Grenze des Bootstrap-Konfidenzintervalls für das p-Perzentil"""
+    rng = rng or random.Random(0)
+    n = len(values)
+    estimates = sorted(percentile([values[rng.randrange(n)] for _ in range(n)], p)
+                       for _ in range(iterations))
+    return estimates[min(int(confidence * iterations), iterations - 1)]
+
+
+def mann_whitney_greater(x: Sequence[float], y: Sequence[float]) -> Tuple[float, float]:
+    """Einseitiger Mann-Whitney-U-Test (H1: x tendenziell größer als y); (U, p)
+
+    Normalapproximation mit Bindungs- und Stetigkeitskorrektur.
+    """
+    n1, n2 = len(x), len(y)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    combined = sorted([(value, 0) for value in x] + [(value, 1) for value in y])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2.0 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class EndpointComparison:
+    """Vergleich eines Endpunkts mit der Baseline"""
+    name: str
+    method: str
+    baseline_runs: int
+    baseline_median_ms: float
+    baseline_p95_ms: float
+    threshold_ms: float
+    current_ms: float
+    slowdown_pct: float
+    p_value: float
+    regression: bool
+
+
+class BaselineIndex:
+    """Index über gespeicherte Test-Läufe mit gecachten Samples"""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+        self.index_path = self.results_dir / INDEX_FILE
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        if not self._dirty:
+            return
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": INDEX_VERSION, "files": self.entries}, f)
+        self._dirty = False
+
+    def refresh(self) -> List[str]:
+        """Neue/geänderte Ergebnisdateien einlesen, gelöschte entfernen; Dateinamen chronologisch"""
+        files = sorted(self.results_dir.glob(RESULT_GLOB))
+        names = {path.name for path in files}
+        for stale in set(self.entries) - names:
+            del self.entries[stale]
+            self._dirty = True
+        for path in files:
+            stat = path.stat()
+            entry = self.entries.get(path.name)
+            if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    results = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.entries[path.name] = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                "timestamp": results.get("timestamp"),
+                "samples": extract_samples(results),
+            }
+            self._dirty = True
+        self.save()
+        return [path.name for path in files if path.name in self.entries]
+
+    def runs(self, exclude: Sequence[str] = (), window: Optional[int] = None) -> List[Dict[str, List[float]]]:
+        """Samples der letzten window Läufe (ohne exclude)"""
+        names = [name for name in self.refresh() if name not in exclude]
+        if window:
+            names = names[-window:]
+        return [self.entries[name]["samples"] for name in names]
+
+
+def compare(current: Dict[str, List[float]], baseline_runs: List[Dict[str, List[float]]],
+            min_runs: int = 5, alpha: float = 0.01, min_slowdown: float = 0.25,
+            min_delta_ms: float = 2.0, seed: int = 0, iterations: int = 2000) -> Dict[str, Any]:
+    """Aktuelle Samples gegen die Baseline-Läufe prüfen"""
+    rng = random.Random(seed)
+    endpoints: List[EndpointComparison] = []
+    skipped: Dict[str, int] = {}
+
+    # Pro Lauf ein Wert je Endpunkt (Median, falls ein Lauf mehrere Samples hat)
+    history: Dict[str, List[float]] = {}
+    for run in baseline_runs:
+        for name, values in run.items():
+            history.setdefault(name, []).append(statistics.median(values))
+
+    for name, values in sorted(current.items()):
+        baseline = history.get(name, [])
+        if len(baseline) < min_runs:
+            skipped[name] = len(baseline)
+            continue
+        median = statistics.median(baseline)
+        current_value = statistics.median(values)
+        slowdown = (current_value - median) / median if median > 0 else 0.0
+        noticeable = slowdown >= min_slowdown and current_value - median >= min_delta_ms
+
+        if len(values) >= 3:
+            _, p_value = mann_whitney_greater(values, baseline)
+            threshold = percentile(baseline, 95.0)
+            method = "mann-whitney"
+            significant = p_value < alpha
+        else:
+            threshold = bootstrap_upper(baseline, 95.0, 1 - alpha, iterations, rng)
+            # Empirischer p-Wert: Anteil der Baseline-Läufe, die mindestens so langsam waren
+            p_value = (sum(1 for value in baseline if value >= current_value) + 1) / (len(baseline) + 1)
+            method = "bootstrap-p95"
+            significant = current_value > threshold
+
+        endpoints.append(EndpointComparison(
+            name=name,
+            method=method,
+            baseline_runs=len(baseline),
+            baseline_median_ms=round(median, 3),
+            baseline_p95_ms=round(percentile(baseline, 95.0), 3),
+            threshold_ms=round(threshold, 3),
+            current_ms=round(current_value, 3),
+            slowdown_pct=round(slowdown * 100, 1),
+            p_value=round(p_value, 4),
+            regression=significant and noticeable,
+        ))
+
+    suite = suite_shift(current, baseline_runs, min_runs)
+    regressions = [e.name for e in endpoints if e.regression]
+    suite_regression = suite["p_value"] < alpha and suite["median_ratio"] >= 1 + min_slowdown
+    return {
+        "baseline_runs": len(baseline_runs),
+        "alpha": alpha,
+        "endpoints": [asdict(e) for e in endpoints],
+        "insufficient_baseline": skipped,
+        "suite": suite,
+        "regressions": regressions,
+        "suite_regression": suite_regression,
+        "status": "FAIL" if regressions or suite_regression else "PASS",
+    }
+
+
+def suite_shift(current: Dict[str, List[float]], baseline_runs: List[Dict[str, List[float]]],
+                min_runs: int = 5) -> Dict[str, Any]:
+    """Allgemeine Verlangsamung: Verhältnisse des aktuellen Laufs vs. Leave-one-out der Baseline"""
+    per_endpoint: Dict[str, List[float]] = {}
+    for run in baseline_runs:
+        for name, values in run.items():
+            per_endpoint.setdefault(name, []).append(statistics.median(values))
+
+    current_ratios, baseline_ratios = [], []
+    for name, values in current.items():
+        history = per_endpoint.get(name, [])
+        if len(history) < min_runs:
+            continue
+        median = statistics.median(history)
+        if median <= 0:
+            continue
+        current_ratios.append(statistics.median(values) / median)
+        for i, value in enumerate(history):
+            others = history[:i] + history[i + 1:]
+            other_median = statistics.median(others)
+            if other_median > 0:
+                baseline_ratios.append(value / other_median)
+
+    u, p_value = mann_whitney_greater(current_ratios, baseline_ratios)
+    return {
+        "endpoints": len(current_ratios),
+        "median_ratio": round(statistics.median(current_ratios), 3) if current_ratios else 1.0,
+        "u": u,
+        "p_value": round(p_value, 4),
+    }
+
+
+def check_results(results: Dict[str, Any], results_dir: Path, exclude: Sequence[str] = (),
+                  window: Optional[int] = 30, **options) -> Dict[str, Any]:
+    """Einstiegspunkt für test_platform.py: aktuellen Lauf gegen gespeicherte Läufe prüfen"""
+    index = BaselineIndex(results_dir)
+    return compare(extract_samples(results), index.runs(exclude, window), **options)
+
+
+def print_report(report: Dict[str, Any]):
+    print("\n📉 BASELINE COMPARISON")
+    print("-" * 40)
+    print(f"  Baseline runs: {report['baseline_runs']} | alpha {report['alpha']}")
+    for endpoint in report["endpoints"]:
+        icon = "❌" if endpoint["regression"] else "✅"
+        print(f"  {icon} {endpoint['name']:<40} {endpoint['current_ms']:>8.2f}ms "
+              f"(median {endpoint['baseline_median_ms']:.2f}ms, limit {endpoint['threshold_ms']:.2f}ms, "
+              f"{endpoint['slowdown_pct']:+.0f}%)")
+    if report["insufficient_baseline"]:
+        print(f"  ⚠️ Not enough history for: {', '.join(sorted(report['insufficient_baseline']))}")
+    suite = report["suite"]
+    icon = "❌" if report["suite_regression"] else "✅"
+    print(f"  {icon} Suite-wide: median ratio {suite['median_ratio']:.2f}x over {suite['endpoints']} endpoints "
+          f"(p={suite['p_value']})")
+    if report["status"] == "FAIL":
+        print(f"  🚨 Regressions: {', '.join(report['regressions']) or 'suite-wide slowdown'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare a test_platform run against stored baselines')
+    parser.add_argument('current', nargs='?', help='Result file to check (default: newest in results dir)')
+    parser.add_argument('--results-dir', default=None, help='Directory with test_results_*.json')
+    parser.add_argument('--window', type=int, default=30, help='Use the last N runs as baseline (default: 30)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Significance level (default: 0.01)')
+    parser.add_argument('--min-slowdown', type=float, default=0.25,
+                        help='Minimum relative slowdown to report (default: 0.25 = 25%%)')
+    parser.add_argument('--min-runs', type=int, default=5,
+                        help='Minimum runs with data before an endpoint is checked (default: 5)')
+    parser.add_argument('--fail', action='store_true', help='Exit with code 1 on regression')
+    args = parser.parse_args()
+
+    results_dir = Path(args.results_dir) if args.results_dir else (
+        Path("../docs/testing") if Path.cwd().name == "scripts" else Path("docs/testing"))
+    index = BaselineIndex(results_dir)
+    names = index.refresh()
+    current_path = Path(args.current) if args.current else (results_dir / names[-1] if names else None)
+    if current_path is None or not current_path.exists():
+        print(f"❌ No result file to check in {results_dir}")
+        return 1
+
+    with open(current_path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+    report = compare(extract_samples(results), index.runs([current_path.name], args.window),
+                     min_runs=args.min_runs, alpha=args.alpha, min_slowdown=args.min_slowdown)
+    print(f"🔍 Checking {current_path.name}")
+    print_report(report)
+    return 1 if args.fail and report["status"] == "FAIL" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
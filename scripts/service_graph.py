@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Service Graph
+=============
+Startet Services (Backend, Frontend, Redis, Postgres, ...) entlang eines kleinen
+Abhängigkeitsgraphen (DAG) parallel.
+
+- requires: harte Abhängigkeit - der Service startet erst, wenn diese bereit ist,
+            und wird übersprungen, wenn sie fehlschlägt
+- wants:    weiche Abhängigkeit - blockiert nicht, wird nur in der Timeline
+            vermerkt (z.B. Backend läuft auch ohne Redis im Basic-Mode)
+
+Jeder Service läuft in einem eigenen Thread; start() blockiert bis der Service
+bereit ist (oder aufgegeben wurde) und gibt True/False zurück. Für jeden Service
+werden Warte-, Start- und Bereitschaftszeitpunkt festgehalten und als Timeline
+ausgegeben - so sieht man, wo die Cold-Start-Zeit bleibt.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class Service:
+    """Ein Knoten im Startgraphen"""
+    name: str
+    start: Callable[[], bool]
+    requires: List[str] = field(default_factory=list)
+    wants: List[str] = field(default_factory=list)
+    optional: bool = False      # Fehlschlag bricht den Start nicht ab
+
+
+@dataclass
+class ServiceTiming:
+    """Zeitpunkte in Sekunden ab Start des Graphen"""
+    name: str
+    status: str = "pending"     # pending | ready | failed | skipped
+    gated_at: float = 0.0       # Thread gestartet, wartet auf requires
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    blocked_by: Optional[str] = None
+    wants_missing: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ready"
+
+
+class ServiceGraph:
+    """DAG von Services, parallel gestartet"""
+
+    def __init__(self):
+        self.services: Dict[str, Service] = {}
+
+    def add(self, service: Service) -> Service:
+        if service.name in self.services:
+            raise ValueError(f"Service '{service.name}' already defined")
+        self.services[service.name] = service
+        return service
+
+    def order(self) -> List[str]:
+        """Topologische Reihenfolge; ValueError bei unbekannten Abhängigkeiten oder Zyklen"""
+        for service in self.services.values():
+            for dep in service.requires + service.wants:
+                if dep not in self.services:
+                    raise ValueError(f"Service '{service.name}' depends on unknown service '{dep}'")
+
+        ordered, state = [], {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            service = self.services[name]
+            for dep in service.requires + service.wants:
+                visit(dep, path + [name])
+            state[name] = "done"
+            ordered.append(name)
+
+        for name in self.services:
+            visit(name, [])
+        return ordered
+
+    def run(self, timeout: Optional[float] = None) -> Dict[str, ServiceTiming]:
+        """Alle Services starten; blockiert bis alle fertig (oder übersprungen) sind"""
+        order = self.order()
+        t0 = time.monotonic()
+        timings = {name: ServiceTiming(name=name) for name in order}
+        done = {name: threading.Event() for name in order}
+
+        def elapsed() -> float:
+            return time.monotonic() - t0
+
+        def worker(service: Service):
+            timing = timings[service.name]
+            timing.gated_at = elapsed()
+            try:
+                for dep in service.requires:
+                    done[dep].wait()
+                    if not timings[dep].ok:
+                        timing.status = "skipped"
+                        timing.blocked_by = dep
+                        timing.finished_at = elapsed()
+                        return
+                timing.started_at = elapsed()
+                try:
+                    ready = service.start()
+                except Exception as e:
+                    ready = False
+                    timing.error = str(e)
+                timing.finished_at = elapsed()
+                timing.status = "ready" if ready else "failed"
+            finally:
+                done[service.name].set()
+
+        threads = []
+        for name in order:
+            thread = threading.Thread(target=worker, args=(self.services[name],),
+                                      name=f"start-{name}", daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        deadline = None if timeout is None else t0 + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+        # Erst jetzt auswerten: direkt nach start() laufen weiche Abhängigkeiten evtl. noch.
+        # Nur gescheiterte/übersprungene zählen als fehlend, noch laufende (Timeout) nicht
+        for name in order:
+            timings[name].wants_missing = [dep for dep in self.services[name].wants
+                                           if timings[dep].status in ("failed", "skipped")]
+        return timings
+
+    def succeeded(self, timings: Dict[str, ServiceTiming]) -> bool:
+        """True wenn alle nicht-optionalen Services bereit sind"""
+        return all(timings[name].ok for name, service in self.services.items() if not service.optional)
+
+
+def format_timeline(timings: Dict[str, ServiceTiming], width: int = 40) -> str:
+    """Gantt-artige Timeline: '·' wartet auf requires, '█' startet bis bereit"""
+    end = max([t.finished_at or t.gated_at for t in timings.values()] + [0.001])
+    scale = width / end
+    name_width = max(len(name) for name in timings)
+    lines = []
+    for timing in sorted(timings.values(), key=lambda t: (t.started_at is None, t.started_at or 0.0)):
+        bar = [" "] * width
+        started = timing.started_at if timing.started_at is not None else timing.finished_at or end
+        for i in range(int(timing.gated_at * scale), min(int(started * scale), width)):
+            bar[i] = "·"
+        if timing.started_at is not None:
+            finish = timing.finished_at if timing.finished_at is not None else end
+            first = min(int(timing.started_at * scale), width - 1)
+            for i in range(first, max(first + 1, min(int(round(finish * scale)), width))):
+                bar[i] = "█"
+
+        if timing.status == "skipped":
+            detail = f"skipped ({timing.blocked_by} not ready)"
+        elif timing.started_at is None or timing.finished_at is None:
+            detail = timing.status
+        else:
+            detail = (f"{timing.started_at:5.2f}s → {timing.finished_at:5.2f}s  "
+                      f"{timing.status} in {timing.finished_at - timing.started_at:.2f}s")
+            if timing.wants_missing:
+                detail += f" (without {', '.join(timing.wants_missing)})"
+            if timing.error:
+                detail += f" - {timing.error}"
+        icon = {"ready": "✅", "failed": "❌", "skipped": "⏭️"}.get(timing.status, "⏳")
+        lines.append(f"  {icon} {timing.name:<{name_width}} |{''.join(bar)}| {detail}")
+    lines.append(f"  {'':<{name_width + 3}} 0s{'':<{width - 4}}{end:.1f}s")
+    return "\n".join(lines)
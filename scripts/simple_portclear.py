@@ -4,11 +4,18 @@
 Einfaches Tool um Ports 3000 und 3001 freizumachen
 """
 
+import os
+import signal
 import subprocess
 import sys
 import time
 import requests
 
+from port_inspect import PORT_INSPECT_AVAILABLE, PortInspector
+
+# Ein Inspector für alle Aufrufe - der Inode-Index bleibt gecacht
+_inspector = PortInspector() if PORT_INSPECT_AVAILABLE else None
+
 def print_banner():
     print("=" * 50)
     print("🎮 SIMPLE PORT CLEAR - RETRO GAMING")
@@ -32,6 +39,9 @@ def check_port(port):
 
 def find_port_process(port):
     """Findet Prozess auf Port"""
+    if _inspector:
+        return [str(pid) for pid in _inspector.pids_on_port(port)]
+    
     stdout, stderr = run_command(f'netstat -ano | findstr :{port}')
     
     listening_processes = []
@@ -46,6 +56,15 @@ def find_port_process(port):
 
 def kill_process(pid):
     """Beendet Prozess"""
+    if _inspector:
+        try:
+            os.kill(int(pid), signal.SIGKILL)
+            return True
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+    
     stdout, stderr = run_command(f'taskkill /PID {pid} /F')
     return "SUCCESS" in stdout.upper() or "ERFOLG" in stdout.upper()
 
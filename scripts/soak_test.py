@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Socket.IO Soak Test
+===================
+Langzeit-Test: eine konstante Population von N Socket.IO-Clients wird über
+Stunden gehalten, mit langsamer zufälliger Fluktuation (Poisson-Churn).
+
+Pro Sample-Intervall wird festgehalten:
+- RSS und CPU des Backend-Prozesses (/proc/<pid> des gestarteten node server.js)
+- Ping-RTT einiger Probe-Clients ('ping' → 'pong'); der Server antwortet per
+  setImmediate, ein Anstieg über das RTT-Minimum zeigt Event-Loop-Lag
+- /api/server-stats (totalSockets, connectedUsers, activeRooms)
+- vom Server getrennte Clients (werden nachverbunden)
+
+Am Ende werden Leak-Steigungen per linearer Regression berechnet (MB/h,
+Sockets/h, p99-Drift ms/h), die Warmup-Phase bleibt dabei außen vor.
+
+Usage:
+    python soak_test.py --spawn --clients 500 --hours 4
+    python soak_test.py --pid 12345 --clients 200 --hours 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+import requests
+import socketio
+
+from latency_histogram import LatencyHistogram
+from load_engine import LoadConfig, SocketLoadEngine, raise_fd_limit
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class SoakConfig(LoadConfig):
+    """Parameter eines Soak-Tests (hold_seconds = Soak-Dauer)"""
+    clients: int = 500
+    arrival_rate: float = 50.0
+    hold_seconds: float = 3600.0
+    churn_per_minute: float = 6.0        # Ersetzungen pro Minute (Poisson)
+    sample_interval: float = 10.0
+    ping_interval: float = 2.0
+    ping_clients: int = 10               # Probe-Clients für die RTT-Messung
+    warmup_seconds: float = 60.0         # bleibt bei den Steigungen unberücksichtigt
+    observe_player_count: bool = False
+
+
+def read_proc_stats(pid: int) -> Optional[Tuple[float, float]]:
+    """(RSS in MB, CPU-Zeit in Sekunden) aus /proc/<pid>; None wenn der Prozess weg ist"""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            stat = f.read()
+        with open(f"/proc/{pid}/statm", "r") as f:
+            statm = f.read().split()
+    except OSError:
+        return None
+    # comm kann Leerzeichen enthalten - Felder nach der letzten Klammer zählen
+    fields = stat[stat.rindex(")") + 2:].split()
+    if fields[0] == "Z":
+        return None
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    return int(statm[1]) * PAGE_SIZE / 1024 / 1024, cpu_seconds
+
+
+def linear_slope(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float]:
+    """Steigung (kleinste Quadrate) und Bestimmtheitsmaß r²"""
+    n = len(xs)
+    if n < 2:
+        return 0.0, 0.0
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    if sxx == 0:
+        return 0.0, 0.0
+    slope = sxy / sxx
+    r2 = sxy * sxy / (sxx * syy) if syy else 0.0
+    return slope, r2
+
+
+class SoakTest(SocketLoadEngine):
+    """Ramp-up, dann Soak mit Churn und Sampling statt festem Hold"""
+
+    def __init__(self, config: SoakConfig, backend_pid: Optional[int] = None, progress=None):
+        super().__init__(config, progress=progress, progress_interval=config.sample_interval)
+        self.config: SoakConfig = config
+        self.backend_pid = backend_pid
+        self.samples: List[Dict[str, Any]] = []
+        self.rtt = LatencyHistogram()           # aktuelles Sample-Fenster
+        self.rtt_total = LatencyHistogram()
+        self.min_rtt_ms = float("inf")
+        self.pending_pings: Dict[float, float] = {}
+        self.probes: Dict[int, socketio.AsyncClient] = {}
+        self.churned = 0
+        self.dropped = 0
+        self.lost_pings = 0
+        self.backend_died: Optional[float] = None
+        self.started = 0.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending_connects = 0
+        self._last_cpu: Optional[Tuple[float, float]] = None
+
+    # --- Population ---------------------------------------------------------
+
+    async def _top_up_one(self):
+        self._pending_connects += 1
+        try:
+            await self._connect_one(self._semaphore)
+        finally:
+            self._pending_connects -= 1
+
+    async def _replace(self, client: socketio.AsyncClient):
+        self.probes.pop(id(client), None)
+        self._pending_connects += 1   # Platz reservieren, damit _top_up nicht doppelt nachverbindet
+        try:
+            await self._disconnect_one(client, self._semaphore)
+        finally:
+            self._pending_connects -= 1
+        await self._top_up_one()
+
+    async def _churn_loop(self):
+        """Zufällige Clients trennen und durch neue ersetzen"""
+        if self.config.churn_per_minute <= 0:
+            return
+        while True:
+            await asyncio.sleep(random.expovariate(self.config.churn_per_minute / 60.0))
+            if not self.clients:
+                continue
+            client = self.clients.pop(random.randrange(len(self.clients)))
+            self.churned += 1
+            asyncio.create_task(self._replace(client))
+
+    def _top_up(self) -> int:
+        """Vom Server getrennte Clients entfernen, Population wieder auffüllen; liefert die Getrennten"""
+        alive = [client for client in self.clients if client.connected]
+        dropped = len(self.clients) - len(alive)
+        if dropped:
+            for client in self.clients:
+                if not client.connected:
+                    self.probes.pop(id(client), None)
+            self.clients = alive
+            self.dropped += dropped
+        # Auch fehlgeschlagene Connects aus Ramp-up/Churn werden ersetzt
+        for _ in range(self.config.clients - len(self.clients) - self._pending_connects):
+            asyncio.create_task(self._top_up_one())
+        return dropped
+
+    # --- Ping-RTT -----------------------------------------------------------
+
+    def _ensure_probes(self):
+        while len(self.probes) < min(self.config.ping_clients, len(self.clients)):
+            candidates = [client for client in self.clients if id(client) not in self.probes]
+            if not candidates:
+                return
+            client = random.choice(candidates)
+            client.on("pong", self._on_pong)
+            self.probes[id(client)] = client
+
+    async def _on_pong(self, data):
+        token = data.get("timestamp") if isinstance(data, dict) else None
+        sent = self.pending_pings.pop(token, None)
+        if sent is None:
+            return
+        rtt_ms = (time.perf_counter() - sent) * 1000
+        self.rtt.record(rtt_ms)
+        self.rtt_total.record(rtt_ms)
+        self.min_rtt_ms = min(self.min_rtt_ms, rtt_ms)
+
+    async def _ping_loop(self):
+        while True:
+            self._ensure_probes()
+            # Unbeantwortete Pings aus der letzten Runde zählen als verloren
+            self.lost_pings += len(self.pending_pings)
+            self.pending_pings.clear()
+            for client in list(self.probes.values()):
+                token = time.time() * 1000 + random.random()
+                self.pending_pings[token] = time.perf_counter()
+                try:
+                    await client.emit("ping", token)
+                except Exception:
+                    self.pending_pings.pop(token, None)
+                    self.lost_pings += 1
+            await asyncio.sleep(self.config.ping_interval)
+
+    # --- Sampling -----------------------------------------------------------
+
+    async def _server_stats(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        try:
+            async with session.get(f"{self.config.url}/api/server-stats") as response:
+                if response.status != 200:
+                    return {"server_stats_error": f"HTTP {response.status}"}
+                data = await response.json()
+        except Exception as e:
+            return {"server_stats_error": type(e).__name__}
+        return {
+            "server_sockets": data.get("totalSockets"),
+            "server_users": data.get("connectedUsers"),
+            "server_rooms": len(data.get("activeRooms") or []),
+        }
+
+    def _process_stats(self) -> Dict[str, Any]:
+        if not self.backend_pid:
+            return {}
+        stats = read_proc_stats(self.backend_pid)
+        now = time.monotonic()
+        if stats is None:
+            if self.backend_died is None:
+                self.backend_died = now - self.started
+            return {"backend_alive": False}
+        rss_mb, cpu_seconds = stats
+        cpu_pct = None
+        if self._last_cpu:
+            last_at, last_cpu = self._last_cpu
+            cpu_pct = round((cpu_seconds - last_cpu) / (now - last_at) * 100, 1) if now > last_at else None
+        self._last_cpu = (now, cpu_seconds)
+        return {"backend_alive": True, "rss_mb": round(rss_mb, 2), "cpu_pct": cpu_pct}
+
+    async def take_sample(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        dropped = self._top_up()
+        rtt = self.rtt.summary((50.0, 99.0))
+        floor = self.min_rtt_ms if self.rtt_total.total_count else 0.0
+        sample = {
+            "t": round(time.monotonic() - self.started, 1),
+            "connected": len(self.clients),
+            "dropped": dropped,
+            "churned": self.churned,
+            "failed": self.result.failed,
+            "ping_p50_ms": rtt["p50"],
+            "ping_p99_ms": rtt["p99"],
+            "ping_count": rtt["count"],
+            "loop_lag_p99_ms": round(max(rtt["p99"] - floor, 0.0), 2) if rtt["count"] else None,
+            "lost_pings": self.lost_pings,
+        }
+        sample.update(self._process_stats())
+        sample.update(await self._server_stats(session))
+        self.rtt.reset()
+        self.samples.append(sample)
+        return sample
+
+    async def _sample_loop(self, session: aiohttp.ClientSession):
+        while True:
+            await asyncio.sleep(self.config.sample_interval)
+            sample = await self.take_sample(session)
+            if self.progress:
+                await self.progress(sample)
+            if self.backend_died is not None:
+                return
+
+    async def soak(self):
+        """Population halten, Churn, Pings und Sampling bis Ablauf oder Backend-Tod"""
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrent_connects)
+        timeout = aiohttp.ClientTimeout(total=max(self.config.sample_interval / 2, 1.0))
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            await self.take_sample(session)   # Ausgangswert nach dem Ramp-up
+            sampler = asyncio.create_task(self._sample_loop(session))
+            helpers = [asyncio.create_task(self._churn_loop()), asyncio.create_task(self._ping_loop())]
+            try:
+                await asyncio.wait([sampler], timeout=self.config.hold_seconds)
+            finally:
+                for task in [sampler] + helpers:
+                    task.cancel()
+                await asyncio.gather(sampler, *helpers, return_exceptions=True)
+
+    async def run(self):
+        """Ramp-up → Soak → Teardown"""
+        self.started = time.monotonic()
+        try:
+            for phase, action in (("ramp_up", self.ramp_up), ("soak", self.soak), ("teardown", self.teardown)):
+                self.phase = phase
+                started = time.perf_counter()
+                await action()
+                self.result.phase_durations[phase] = time.perf_counter() - started
+        finally:
+            if self.clients:
+                await self.teardown()
+            self.phase = "done"
+        return self.analyse()
+
+    # --- Auswertung ---------------------------------------------------------
+
+    def analyse(self) -> Dict[str, Any]:
+        """Leak-Steigungen pro Stunde über die Samples nach dem Warmup"""
+        steady = [s for s in self.samples if s["t"] >= self.config.warmup_seconds] or self.samples
+        slopes = {}
+        for key, label in (("rss_mb", "rss_mb_per_hour"),
+                           ("cpu_pct", "cpu_pct_per_hour"),
+                           ("ping_p99_ms", "ping_p99_ms_per_hour"),
+                           ("socket_excess", "server_sockets_per_hour")):
+            points = []
+            for sample in steady:
+                value = sample.get(key)
+                if key == "socket_excess" and sample.get("server_sockets") is not None:
+                    # Server-Sockets über der eigenen Population (+ Probe-Overhead) = mögliches Leck
+                    value = sample["server_sockets"] - sample["connected"]
+                if isinstance(value, (int, float)):
+                    points.append((sample["t"] / 3600.0, value))
+            if len(points) >= 3:
+                slope, r2 = linear_slope([x for x, _ in points], [y for _, y in points])
+                slopes[label] = {"slope": round(slope, 3), "r2": round(r2, 3), "samples": len(points)}
+
+        rss = [s["rss_mb"] for s in steady if isinstance(s.get("rss_mb"), (int, float))]
+        return {
+            "config": asdict(self.config),
+            "duration_s": round(time.monotonic() - self.started, 1),
+            "backend_died_after_s": round(self.backend_died, 1) if self.backend_died is not None else None,
+            "population": self.config.clients,
+            "churned": self.churned,
+            "dropped_by_server": self.dropped,
+            "lost_pings": self.lost_pings,
+            "load": self.result.summary(),
+            "ping_rtt_ms": self.rtt_total.summary(),
+            "min_rtt_ms": round(self.min_rtt_ms, 2) if self.rtt_total.total_count else None,
+            "rss_mb": {"first": rss[0], "last": rss[-1], "max": max(rss)} if rss else None,
+            "slopes": slopes,
+            "samples": self.samples,
+        }
+
+
+def spawn_backend(port: int, log_path: Path, timeout: float = 30.0) -> subprocess.Popen:
+    """node server.js direkt starten (ohne Shell - die PID ist dann die des node-Prozesses)"""
+    backend_dir = Path(__file__).parent.parent / "backend"
+    env = os.environ.copy()
+    env["PORT"] = str(port)
+    log = open(log_path, "w", encoding="utf-8")
+    process = subprocess.Popen(["node", "server.js"], cwd=backend_dir, stdout=log,
+                               stderr=subprocess.STDOUT, env=env)
+    log.close()
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Backend exited with code {process.returncode} (see {log_path})")
+        try:
+            if requests.get(f"http://localhost:{port}/health", timeout=2).status_code == 200:
+                return process
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"Backend not healthy after {timeout:g}s (see {log_path})")
+
+
+def print_sample(sample: Dict[str, Any]):
+    rss = f"{sample['rss_mb']:.1f}MB" if sample.get("rss_mb") is not None else "-"
+    cpu = f"{sample['cpu_pct']:.0f}%" if sample.get("cpu_pct") is not None else "-"
+    sockets = sample.get("server_sockets", sample.get("server_stats_error", "-"))
+    print(f"  [{sample['t'] / 60:6.1f}m] clients {sample['connected']:>5} | server sockets {sockets} | "
+          f"RSS {rss} | CPU {cpu} | ping p99 {sample['ping_p99_ms']:.1f}ms | dropped {sample['dropped']}")
+
+
+def print_report(report: Dict[str, Any]):
+    print("\n" + "=" * 60)
+    print("🧪 SOAK TEST RESULT")
+    print("=" * 60)
+    print(f"Duration: {report['duration_s'] / 3600:.2f}h | Population {report['population']} | "
+          f"churned {report['churned']} | dropped by server {report['dropped_by_server']}")
+    if report["backend_died_after_s"] is not None:
+        print(f"💀 Backend died after {report['backend_died_after_s'] / 60:.1f} minutes")
+    ping = report["ping_rtt_ms"]
+    if ping["count"]:
+        print(f"Ping RTT: p50 {ping['p50']:.1f}ms | p99 {ping['p99']:.1f}ms | max {ping['max']:.1f}ms "
+              f"| floor {report['min_rtt_ms']}ms | lost {report['lost_pings']}")
+    if report["rss_mb"]:
+        print(f"RSS: {report['rss_mb']['first']:.1f}MB → {report['rss_mb']['last']:.1f}MB "
+              f"(max {report['rss_mb']['max']:.1f}MB)")
+    for name, slope in report["slopes"].items():
+        print(f"  📈 {name:<26} {slope['slope']:>+10.3f} (r²={slope['r2']:.2f}, n={slope['samples']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Socket.IO soak test with leak tracking')
+    parser.add_argument('--backend', default=None, help='Backend URL (default: http://localhost:<port>)')
+    parser.add_argument('--port', type=int, default=3001, help='Backend port (default: 3001)')
+    parser.add_argument('--spawn', action='store_true', help='Start node server.js for the test')
+    parser.add_argument('--pid', type=int, help='PID of an already running backend (for RSS/CPU)')
+    parser.add_argument('--clients', type=int, default=500, help='Steady client population (default: 500)')
+    parser.add_argument('--rate', type=float, default=50.0, help='Ramp-up connections per second (default: 50)')
+    parser.add_argument('--hours', type=float, default=1.0, help='Soak duration in hours (default: 1)')
+    parser.add_argument('--churn', type=float, default=6.0, help='Client replacements per minute (default: 6)')
+    parser.add_argument('--sample-interval', type=float, default=10.0, help='Seconds between samples (default: 10)')
+    parser.add_argument('--ping-interval', type=float, default=2.0, help='Seconds between pings (default: 2)')
+    parser.add_argument('--ping-clients', type=int, default=10, help='Clients used for RTT probes (default: 10)')
+    parser.add_argument('--warmup', type=float, default=60.0, help='Seconds excluded from slopes (default: 60)')
+    parser.add_argument('--output', help='JSON report (default: docs/testing/soak_<timestamp>.json)')
+    args = parser.parse_args()
+    raise_fd_limit()
+
+    config = SoakConfig(
+        url=args.backend or f"http://localhost:{args.port}",
+        clients=args.clients,
+        arrival_rate=args.rate,
+        hold_seconds=args.hours * 3600,
+        churn_per_minute=args.churn,
+        sample_interval=args.sample_interval,
+        ping_interval=args.ping_interval,
+        ping_clients=args.ping_clients,
+        warmup_seconds=args.warmup,
+    )
+
+    process = None
+    pid = args.pid
+    if args.spawn:
+        log_path = Path(__file__).parent / "soak_backend.log"
+        print(f"🚀 Starting backend on port {args.port} (log: {log_path})")
+        try:
+            process = spawn_backend(args.port, log_path)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+        pid = process.pid
+    if not pid:
+        print("⚠️ No backend PID (--spawn or --pid) - RSS/CPU will not be sampled")
+
+    print(f"🧪 Soak test: {config.clients} clients for {args.hours:g}h against {config.url}")
+
+    async def progress(sample):
+        print_sample(sample)
+
+    test = SoakTest(config, backend_pid=pid, progress=progress)
+    try:
+        report = asyncio.run(test.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Soak test aborted - reporting collected samples")
+        report = test.analyse()
+    finally:
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    print_report(report)
+    output = Path(args.output) if args.output else (
+        Path(__file__).parent.parent / "docs" / "testing" / f"soak_{datetime.now().strftime('%Y%m%d_%H%M')}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Soak report saved: {output}")
+    return 1 if report["backend_died_after_s"] is not None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler
+================
+Cold-Start-Benchmark für das Node-Backend: startet jeden Entry-Point N-mal
+(node server.js, node minimal_server.js, src/app.js über einen kleinen
+Bootstrap) und misst pro Lauf, in ms ab Prozessstart:
+
+- socket:    erster LISTEN-Socket auf dem Port (/proc/net/tcp{,6}, sonst TCP-Connect)
+- health:    erste erfolgreiche Antwort von /health
+- health_db: /health-db meldet alle Datenbanken als 'connected'
+             (None, wenn das nicht innerhalb von --db-timeout passiert)
+
+Die Läufe werden reihum über die Entry-Points verteilt (server, minimal, app,
+server, ...), damit Drift (Page-Cache, CPU-Takt, andere Last) alle Kandidaten
+gleich trifft. Pro Entry-Point und Metrik: Median mit 95%-Bootstrap-
+Konfidenzintervall, p95, und gegen die Baseline (erster Entry-Point) ein
+zweiseitiger Mann-Whitney-U-Test - so sieht man, ob eine Änderung an
+server.js die Boot-Zeit wirklich verändert hat oder nur Rauschen ist.
+
+Usage:
+    python startup_profiler.py                               # 10 Läufe je Entry-Point
+    python startup_profiler.py --runs 20 --entry server.js server.js.bak
+    python startup_profiler.py --skip-db --save              # JSON nach docs/testing/
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from log_pump import LogPump
+from port_inspect import PORT_INSPECT_AVAILABLE
+from readiness import http_probe, port_listening, tcp_probe
+from result_baseline import bootstrap_upper, mann_whitney_greater, percentile
+
+METRICS = ("socket", "health", "health_db")
+DEFAULT_ENTRIES = ["server.js", "minimal_server.js", "src/app.js"]
+
+# src/app.js exportiert nur die Klasse RetroRetroApp und ruft nie listen() auf
+APP_BOOTSTRAP = (
+    "const App = require('./src/app');"
+    "const app = new App().getApp();"
+    "const port = process.env.PORT;"
+    "require('http').createServer(app).listen(port, () => console.log('RetroRetroApp running on port ' + port));"
+)
+
+POLL_INTERVAL = 0.005     # Socket/Health: feste kurze Abfrage, kein Backoff (verfälscht sonst die Zeiten)
+DB_POLL_INTERVAL = 0.1    # /health-db testet bei jedem Aufruf die Verbindungen - seltener abfragen
+
+
+@dataclass
+class StartupRun:
+    """Ein Kaltstart eines Entry-Points; Zeiten in ms ab Popen"""
+    entry: str
+    run: int
+    socket: Optional[float] = None
+    health: Optional[float] = None
+    health_db: Optional[float] = None
+    db_status: Optional[Dict[str, str]] = None
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.health is not None
+
+
+@dataclass
+class MetricSummary:
+    """Verteilung einer Metrik über alle Läufe eines Entry-Points"""
+    entry: str
+    metric: str
+    n: int
+    missing: int
+    median_ms: Optional[float] = None
+    ci_low_ms: Optional[float] = None
+    ci_high_ms: Optional[float] = None
+    mean_ms: Optional[float] = None
+    stdev_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    # Vergleich mit der Baseline (erster Entry-Point)
+    delta_pct: Optional[float] = None
+    p_value: Optional[float] = None
+    significant: bool = False
+
+
+def entry_command(entry: str, node: str = "node") -> List[str]:
+    """Startkommando für einen Entry-Point (Pfad relativ zu backend/)"""
+    if Path(entry).as_posix() == "src/app.js":
+        return [node, "-e", APP_BOOTSTRAP]
+    return [node, entry]
+
+
+def fetch_db_status(url: str, timeout: float = 2.0) -> Optional[Dict[str, str]]:
+    """databases-Abschnitt von /health-db, None wenn nicht erreichbar oder kein JSON"""
+    parsed = urlparse(url)
+    conn = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=timeout)
+    try:
+        conn.request("GET", parsed.path or "/")
+        response = conn.getresponse()
+        body = response.read()
+        if response.status == 404:
+            return {"endpoint": "missing"}
+        if response.status >= 500:
+            return None
+        databases = json.loads(body.decode("utf-8", "replace")).get("databases")
+        return databases if isinstance(databases, dict) else None
+    except (OSError, http.client.HTTPException, ValueError, AttributeError):
+        return None
+    finally:
+        conn.close()
+
+
+def median_ci(values: Sequence[float], confidence: float = 0.95) -> tuple:
+    """Bootstrap-Konfidenzintervall für den Median (zweiseitig)"""
+    if len(values) < 2:
+        value = values[0] if values else None
+        return value, value
+    tail = (1.0 - confidence) / 2.0
+    return bootstrap_upper(values, 50.0, tail), bootstrap_upper(values, 50.0, 1.0 - tail)
+
+
+def two_sided_p(x: Sequence[float], y: Sequence[float]) -> float:
+    """Zweiseitiger Mann-Whitney-U-Test aus den beiden einseitigen"""
+    _, p_greater = mann_whitney_greater(x, y)
+    _, p_less = mann_whitney_greater(y, x)
+    return min(1.0, 2.0 * min(p_greater, p_less))
+
+
+class StartupProfiler:
+    """Startet Backend-Entry-Points wiederholt und misst die Boot-Zeit"""
+
+    def __init__(self, backend_dir: Path, port: int = 3201, timeout: float = 30.0,
+                 db_timeout: float = 10.0, skip_db: bool = False, node: str = "node",
+                 log_dir: Optional[Path] = None):
+        self.backend_dir = Path(backend_dir)
+        self.port = port
+        self.timeout = timeout
+        self.db_timeout = db_timeout
+        self.skip_db = skip_db
+        self.node = node
+        self.log_dir = log_dir
+        self.runs: List[StartupRun] = []
+
+    def _listening(self) -> bool:
+        if PORT_INSPECT_AVAILABLE:
+            return port_listening(self.port)
+        return tcp_probe(self.port, timeout=0.2)
+
+    def _wait_port_free(self, timeout: float = 5.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while self._listening():
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def run_once(self, entry: str, run: int) -> StartupRun:
+        """Ein Kaltstart: Prozess starten, Meilensteine messen, Prozess beenden"""
+        result = StartupRun(entry=entry, run=run)
+        if not self._wait_port_free():
+            result.error = f"port {self.port} still in use"
+            return result
+
+        env = {**os.environ, "PORT": str(self.port), "NODE_ENV": "development"}
+        log_path = None
+        if self.log_dir:
+            log_path = self.log_dir / f"startup_{Path(entry).name}.log"
+        pump = LogPump(f"startup-{Path(entry).name}", ring_size=200, log_path=log_path)
+        base_url = f"http://localhost:{self.port}"
+
+        t0 = time.monotonic()
+        process = subprocess.Popen(entry_command(entry, self.node), cwd=self.backend_dir, env=env,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                   bufsize=1, shell=platform.system() == "Windows")
+        pump.attach_process(process)
+
+        def elapsed_ms() -> float:
+            return (time.monotonic() - t0) * 1000
+
+        try:
+            deadline = t0 + self.timeout
+            while result.health is None:
+                if process.poll() is not None:
+                    result.exit_code = process.returncode
+                    result.error = f"exited with code {process.returncode}"
+                    break
+                if time.monotonic() > deadline:
+                    result.error = f"/health not ready after {self.timeout:g}s"
+                    break
+                if result.socket is None and self._listening():
+                    result.socket = elapsed_ms()
+                if result.socket is not None and http_probe(f"{base_url}/health", timeout=1.0):
+                    result.health = elapsed_ms()
+                    break
+                time.sleep(POLL_INTERVAL)
+
+            if result.ok and not self.skip_db:
+                db_deadline = time.monotonic() + self.db_timeout
+                while time.monotonic() < db_deadline and process.poll() is None:
+                    status = fetch_db_status(f"{base_url}/health-db")
+                    if status is not None:
+                        result.db_status = status
+                        if status and all(value == "connected" for value in status.values()):
+                            result.health_db = elapsed_ms()
+                            break
+                        if "endpoint" in status or "not-configured" in status.values():
+                            break
+                    time.sleep(DB_POLL_INTERVAL)
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            pump.close()
+
+        if result.error and result.exit_code is not None:
+            errors = pump.matching("error", 3) or pump.tail(3)
+            if errors:
+                result.error += f": {errors[-1].strip()}"
+        return result
+
+    def profile(self, entries: Sequence[str], runs: int = 10, warmup: int = 1,
+                echo: bool = True) -> List[StartupRun]:
+        """Alle Entry-Points reihum starten; Warmup-Läufe werden verworfen"""
+        for round_index in range(-warmup, runs):
+            for entry in entries:
+                result = self.run_once(entry, round_index)
+                if round_index < 0:
+                    if echo:
+                        print(f"   🔥 warmup {entry}: "
+                              f"{'ok' if result.ok else result.error}")
+                    continue
+                self.runs.append(result)
+                if echo:
+                    print(f"   {'✅' if result.ok else '❌'} {format_run(result)}")
+        return self.runs
+
+    def summarize(self, entries: Sequence[str], alpha: float = 0.05) -> List[MetricSummary]:
+        """Median/CI/p95 pro Entry-Point und Metrik, Vergleich gegen entries[0]"""
+        samples = {(entry, metric): [] for entry in entries for metric in METRICS}
+        counts = {entry: 0 for entry in entries}
+        for run in self.runs:
+            counts[run.entry] = counts.get(run.entry, 0) + 1
+            for metric in METRICS:
+                value = getattr(run, metric)
+                if value is not None:
+                    samples.setdefault((run.entry, metric), []).append(value)
+
+        summaries = []
+        for metric in METRICS:
+            baseline = samples[(entries[0], metric)]
+            for entry in entries:
+                values = samples[(entry, metric)]
+                summary = MetricSummary(entry=entry, metric=metric, n=len(values),
+                                        missing=counts[entry] - len(values))
+                if values:
+                    summary.median_ms = statistics.median(values)
+                    summary.ci_low_ms, summary.ci_high_ms = median_ci(values)
+                    summary.mean_ms = statistics.fmean(values)
+                    summary.stdev_ms = statistics.stdev(values) if len(values) > 1 else 0.0
+                    summary.p95_ms = percentile(values, 95)
+                if entry != entries[0] and values and baseline:
+                    base_median = statistics.median(baseline)
+                    if base_median > 0:
+                        summary.delta_pct = (summary.median_ms / base_median - 1) * 100
+                    summary.p_value = two_sided_p(values, baseline)
+                    summary.significant = summary.p_value < alpha
+                summaries.append(summary)
+        return summaries
+
+
+def format_run(run: StartupRun) -> str:
+    marks = []
+    for metric in METRICS:
+        value = getattr(run, metric)
+        marks.append(f"{metric} {value:.0f}ms" if value is not None else f"{metric} -")
+    line = f"{run.entry} #{run.run + 1}: " + ", ".join(marks)
+    if run.error:
+        line += f" ({run.error})"
+    elif run.health_db is None and run.db_status:
+        line += " (" + ", ".join(f"{k}={v}" for k, v in run.db_status.items()) + ")"
+    return line
+
+
+def format_summary(summaries: Sequence[MetricSummary], baseline: str) -> str:
+    """Tabelle: Median [95% CI], p95 und Abweichung zur Baseline"""
+    def ms(value: Optional[float]) -> str:
+        return f"{value:.0f}" if value is not None else "-"
+
+    entry_width = max([len(s.entry) for s in summaries] + [5])
+    lines = [f"  {'metric':<10} {'entry':<{entry_width}} {'n':>3} {'median':>8} "
+             f"{'95% CI':>15} {'p95':>8}  vs. baseline"]
+    for summary in summaries:
+        ci = f"[{ms(summary.ci_low_ms)}, {ms(summary.ci_high_ms)}]" if summary.n else "-"
+        if summary.entry == baseline:
+            compare = "baseline"
+        elif summary.p_value is None:
+            compare = "-"
+        else:
+            marker = "⚠️" if summary.significant and (summary.delta_pct or 0) > 0 else (
+                "🚀" if summary.significant else "≈")
+            compare = f"{marker} {summary.delta_pct:+.1f}% (p={summary.p_value:.3f})" \
+                if summary.delta_pct is not None else f"p={summary.p_value:.3f}"
+        missing = f" ({summary.missing} missing)" if summary.missing else ""
+        lines.append(f"  {summary.metric:<10} {summary.entry:<{entry_width}} {summary.n:>3} "
+                     f"{ms(summary.median_ms):>8} {ci:>15} {ms(summary.p95_ms):>8}  {compare}{missing}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start benchmark for backend entry points')
+    parser.add_argument('--entry', nargs='+', default=DEFAULT_ENTRIES,
+                        help='Entry points relative to backend/; the first one is the baseline '
+                             f'(default: {" ".join(DEFAULT_ENTRIES)})')
+    parser.add_argument('--runs', type=int, default=10, help='Measured runs per entry point (default: 10)')
+    parser.add_argument('--warmup', type=int, default=1, help='Discarded runs per entry point (default: 1)')
+    parser.add_argument('--port', type=int, default=3201, help='Port used for every run (default: 3201)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Seconds until /health must answer (default: 30)')
+    parser.add_argument('--db-timeout', type=float, default=10.0,
+                        help='Seconds to wait for /health-db to report connected (default: 10)')
+    parser.add_argument('--skip-db', action='store_true', help='Do not measure /health-db')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Significance level (default: 0.05)')
+    parser.add_argument('--node', default='node', help='Node executable (default: node)')
+    parser.add_argument('--json', help='Write runs and summary to this JSON file')
+    parser.add_argument('--save', action='store_true', help='Write JSON to docs/testing/startup_profile_*.json')
+    args = parser.parse_args()
+
+    scripts_root = Path(__file__).parent
+    project_root = scripts_root.parent
+    backend_dir = project_root / "backend"
+    missing = [entry for entry in args.entry if not (backend_dir / entry).exists()]
+    if missing:
+        print(f"❌ Entry point(s) not found in {backend_dir}: {', '.join(missing)}")
+        return 1
+
+    print(f"⏱️ Startup profile: {', '.join(args.entry)} - {args.runs} runs each "
+          f"(+{args.warmup} warmup) on port {args.port}")
+    profiler = StartupProfiler(backend_dir, port=args.port, timeout=args.timeout,
+                               db_timeout=args.db_timeout, skip_db=args.skip_db,
+                               node=args.node, log_dir=scripts_root / "logs")
+    try:
+        profiler.profile(args.entry, runs=args.runs, warmup=args.warmup)
+    except KeyboardInterrupt:
+        print("\n⏹️ Interrupted - summarizing completed runs")
+
+    summaries = profiler.summarize(args.entry, alpha=args.alpha)
+    print(f"\n📊 Time to milestone in ms (median, bootstrap 95% CI, baseline {args.entry[0]}):")
+    print(format_summary(summaries, args.entry[0]))
+
+    output = args.json
+    if args.save and not output:
+        output = project_root / "docs" / "testing" / f"startup_profile_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
+    if output:
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "port": args.port,
+            "runs_per_entry": args.runs,
+            "warmup": args.warmup,
+            "baseline": args.entry[0],
+            "runs": [asdict(run) for run in profiler.runs],
+            "summary": [asdict(summary) for summary in summaries],
+        }
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Saved: {output}")
+
+    return 0 if any(run.ok for run in profiler.runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
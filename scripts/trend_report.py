@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Trend Report
+============
+Trend-Report (Markdown oder HTML) über alle gespeicherten Test-Läufe.
+
+Quelle ist das Spalten-Archiv (result_archive.py). Der Report wird aus einem
+Aggregat-Cache (docs/testing/trend_cache.json) erzeugt, der pro Monatsdatei
+festhält, wie viele Zeilen bereits verarbeitet sind. Bei jedem Aufruf werden
+nur die neuen Zeilen gelesen und das Aggregat fortgeschrieben - ein neuer
+Lauf kostet damit einen Lauf, nicht die ganze Historie.
+
+Pro Endpunkt enthält der Cache:
+- ein LatencyHistogram über alle Läufe (p50/p95/max ohne Rohwerte)
+- die letzten SERIES_POINTS Werte für die Sparkline
+- Pass-Zähler
+- ggf. eine offene Regression
+
+Regressionen werden beim Fortschreiben mit result_baseline.compare() gegen die
+letzten BASELINE_WINDOW Läufe erkannt; festgehalten wird der Lauf, in dem sie
+zuerst auftrat, und der Lauf, in dem sie wieder verschwand.
+
+Usage:
+    python trend_report.py                    # docs/testing/trend_report.md
+    python trend_report.py --format html      # docs/testing/trend_report.html
+"""
+
+import argparse
+import html
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from latency_histogram import LatencyHistogram
+from result_archive import MonthFile, ResultArchive
+from result_baseline import compare
+
+CACHE_FILE = "trend_cache.json"
+CACHE_VERSION = 1
+SERIES_POINTS = 60
+BASELINE_WINDOW = 30
+BOOTSTRAP_ITERATIONS = 200
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values: List[float], low: Optional[float] = None, high: Optional[float] = None) -> str:
+    """Unicode-Sparkline (Markdown); ohne low/high auf den Wertebereich skaliert"""
+    if not values:
+        return ""
+    low = min(values) if low is None else low
+    high = max(values) if high is None else high
+    span = high - low
+    if span <= 0:
+        return SPARK_CHARS[0] * len(values)
+    return "".join(SPARK_CHARS[min(int((value - low) / span * len(SPARK_CHARS)), len(SPARK_CHARS) - 1)]
+                   for value in values)
+
+
+def svg_sparkline(values: List[float], width: int = 160, height: int = 24,
+                  low: Optional[float] = None, high: Optional[float] = None) -> str:
+    """Inline-SVG-Sparkline (HTML)"""
+    if len(values) < 2:
+        return ""
+    low = min(values) if low is None else low
+    high = max(values) if high is None else high
+    span = (high - low) or 1.0
+    step = width / (len(values) - 1)
+    points = " ".join(f"{i * step:.1f},{height - 2 - (value - low) / span * (height - 4):.1f}"
+                      for i, value in enumerate(values))
+    return (f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'<polyline fill="none" stroke="#3b82f6" stroke-width="1.5" points="{points}"/></svg>')
+
+
+def _run_order(run_id: str, timestamp: Optional[str]) -> Tuple[str, str]:
+    """Sortierschlüssel für Läufe: Zeitstempel, bei Gleichstand die run_id"""
+    return timestamp or "", run_id
+
+
+class TrendAggregate:
+    """Inkrementell fortgeschriebenes Aggregat über alle archivierten Läufe"""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+        self.cache_path = self.results_dir / CACHE_FILE
+        self.archive = ResultArchive(self.results_dir)
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.months: Dict[str, int] = {}           # Monatsdatei → verarbeitete Zeilen
+        self.runs: List[Dict[str, Any]] = []       # run_id, timestamp, passed, total
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.window: List[Dict[str, List[float]]] = []   # Samples der letzten Läufe (Baseline)
+        self.regressions: List[Dict[str, Any]] = []
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        self.months = data["months"]
+        self.runs = data["runs"]
+        self.endpoints = data["endpoints"]
+        self.window = data["window"]
+        self.regressions = data["regressions"]
+        self.histograms = {name: LatencyHistogram.from_dict(entry["histogram"])
+                           for name, entry in self.endpoints.items() if "histogram" in entry}
+
+    def save(self):
+        for name, histogram in self.histograms.items():
+            self.endpoints[name]["histogram"] = histogram.to_dict()
+        data = {
+            "version": CACHE_VERSION,
+            "months": self.months,
+            "runs": self.runs,
+            "endpoints": self.endpoints,
+            "window": self.window,
+            "regressions": self.regressions,
+        }
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
+    def update(self) -> int:
+        """Neue Zeilen aus dem Archiv übernehmen; liefert die Anzahl neuer Läufe"""
+        paths = self.archive.months()
+        names = [path.name for path in paths]
+        # Archiv verändert statt nur angehängt (Monat gelöscht/verkürzt) → neu aufbauen
+        if any(name not in names for name in self.months):
+            self._reset()
+
+        new_runs = []
+        for path in paths:
+            month = MonthFile(path)
+            seen = self.months.get(path.name, 0)
+            if len(month) < seen:
+                self._reset()
+                return self.update()
+            if len(month) == seen:
+                continue
+            new_runs.extend(self._iter_new_runs(month, seen))
+            self.months[path.name] = len(month)
+        if not new_runs:
+            return 0
+
+        new_runs.sort(key=lambda run: _run_order(run[0], run[1]))
+        last = self.runs[-1] if self.runs else None
+        if last and _run_order(new_runs[0][0], new_runs[0][1]) < _run_order(last["run_id"], last["timestamp"]):
+            # Nachträglich importierte ältere Läufe (z.B. JSON-Backlog): Serien, Baseline und
+            # Regressionen hängen von der Reihenfolge ab → in zeitlicher Reihenfolge neu aufbauen
+            self._reset()
+            return self.update()
+        for run_id, timestamp, rows in new_runs:
+            self._add_run(run_id, timestamp, rows)
+        self.save()
+        return len(new_runs)
+
+    @staticmethod
+    def _iter_new_runs(month: MonthFile, start: int):
+        """Zeilen ab start, gruppiert nach Lauf (Läufe liegen im Archiv zusammenhängend)"""
+        columns = {name: list(values[start:]) for name, values in month.columns.items()}
+        strings = month.strings
+        current, rows = None, []
+        for i, run in enumerate(columns["run"]):
+            if run != current and rows:
+                yield month.runs[current]["run_id"], month.runs[current]["timestamp"], rows
+                rows = []
+            current = run
+            rows.append((strings["category"][columns["category"][i]],
+                         strings["check"][columns["check"][i]],
+                         strings["status"][columns["status"][i]],
+                         float(columns["response_time_ms"][i])))
+        if rows:
+            yield month.runs[current]["run_id"], month.runs[current]["timestamp"], rows
+
+    def _add_run(self, run_id: str, timestamp: Optional[str], rows: List[Tuple[str, str, str, float]]):
+        run_index = len(self.runs)
+        passed = sum(1 for _, _, status, _ in rows if status == "PASS")
+        self.runs.append({"run_id": run_id, "timestamp": timestamp, "passed": passed, "total": len(rows)})
+
+        samples: Dict[str, List[float]] = {}
+        for category, check, status, response_time in rows:
+            name = f"{category}.{check}"
+            entry = self.endpoints.setdefault(name, {"runs": 0, "passes": 0, "series": [], "open_regression": None})
+            entry["runs"] += 1
+            entry["passes"] += status == "PASS"
+            if status == "PASS" and response_time == response_time:   # NaN = keine Zeitmessung
+                samples.setdefault(name, []).append(response_time)
+                self.histograms.setdefault(name, LatencyHistogram()).record(response_time)
+                entry["series"] = (entry["series"] + [[run_index, round(response_time, 3)]])[-SERIES_POINTS:]
+
+        if self.window and samples:
+            self._track_regressions(run_id, timestamp, samples)
+        # Werte offener Regressionen nicht in die Baseline übernehmen, sonst "heilt" sie sich selbst
+        baseline = {name: values for name, values in samples.items()
+                    if self.endpoints[name]["open_regression"] is None}
+        if baseline:
+            self.window = (self.window + [baseline])[-BASELINE_WINDOW:]
+
+    def _track_regressions(self, run_id: str, timestamp: Optional[str], samples: Dict[str, List[float]]):
+        report = compare(samples, self.window, iterations=BOOTSTRAP_ITERATIONS)
+        for endpoint in report["endpoints"]:
+            entry = self.endpoints[endpoint["name"]]
+            open_regression = entry["open_regression"]
+            if endpoint["regression"] and open_regression is None:
+                entry["open_regression"] = len(self.regressions)
+                self.regressions.append({
+                    "endpoint": endpoint["name"],
+                    "run_id": run_id,
+                    "timestamp": timestamp,
+                    "current_ms": endpoint["current_ms"],
+                    "baseline_median_ms": endpoint["baseline_median_ms"],
+                    "slowdown_pct": endpoint["slowdown_pct"],
+                    "resolved_run_id": None,
+                })
+            elif open_regression is not None and endpoint["current_ms"] <= endpoint["threshold_ms"]:
+                self.regressions[open_regression]["resolved_run_id"] = run_id
+                entry["open_regression"] = None
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        return self.histograms.get(name, LatencyHistogram())
+
+    def slowest(self, limit: int = 10) -> List[Tuple[str, Dict[str, float]]]:
+        """Endpunkte nach p95 über die gesamte Historie"""
+        ranked = [(name, histogram.summary((50.0, 95.0))) for name, histogram in self.histograms.items()
+                  if histogram.total_count]
+        ranked.sort(key=lambda item: item[1]["p95"], reverse=True)
+        return ranked[:limit]
+
+
+def _run_label(run: Dict[str, Any]) -> str:
+    return run.get("timestamp", "")[:16].replace("T", " ") if run.get("timestamp") else run["run_id"]
+
+
+def build_sections(aggregate: TrendAggregate) -> Dict[str, Any]:
+    """Report-Inhalte unabhängig vom Ausgabeformat"""
+    runs = aggregate.runs
+    pass_rates = [run["passed"] / run["total"] * 100 if run["total"] else 0.0 for run in runs]
+    runs_by_id = {run["run_id"]: run for run in runs}
+    return {
+        "runs": runs,
+        "pass_rates": pass_rates,
+        "recent_runs": [(run, rate) for run, rate in zip(runs[-10:], pass_rates[-10:])],
+        "slowest": aggregate.slowest(),
+        "endpoints": [
+            (name, entry, [value for _, value in entry["series"]])
+            for name, entry in sorted(aggregate.endpoints.items()) if entry["series"]
+        ],
+        "regressions": [
+            dict(regression, label=_run_label(runs_by_id.get(regression["run_id"], regression)))
+            for regression in aggregate.regressions
+        ],
+    }
+
+
+def render_markdown(aggregate: TrendAggregate) -> str:
+    sections = build_sections(aggregate)
+    runs, pass_rates = sections["runs"], sections["pass_rates"]
+    lines = [
+        "# 📈 RetroRetro Gaming Platform - Trend Report",
+        "",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}  ",
+        f"**Runs:** {len(runs)}"
+        + (f" ({_run_label(runs[0])} → {_run_label(runs[-1])})" if runs else ""),
+        "",
+        "## ✅ Pass Rate",
+        "",
+        f"`{sparkline(pass_rates[-SERIES_POINTS:], 0.0, 100.0)}` "
+        f"average {statistics.mean(pass_rates) if pass_rates else 0:.1f}%, "
+        f"latest {pass_rates[-1] if pass_rates else 0:.1f}%",
+        "",
+        "| Run | Passed | Pass Rate |",
+        "|-----|--------|-----------|",
+    ]
+    for run, rate in sections["recent_runs"]:
+        lines.append(f"| {_run_label(run)} | {run['passed']}/{run['total']} | {rate:.1f}% |")
+
+    lines += ["", "## 🐢 Slowest Endpoints (p95, all runs)", "",
+              "| Endpoint | p50 | p95 | max | Samples |", "|----------|-----|-----|-----|---------|"]
+    for name, summary in sections["slowest"]:
+        lines.append(f"| {name} | {summary['p50']:.2f}ms | {summary['p95']:.2f}ms | "
+                     f"{summary['max']:.2f}ms | {summary['count']} |")
+
+    lines += ["", "## 📉 Latency per Endpoint", "",
+              "| Endpoint | Trend | Latest | Pass Rate |", "|----------|-------|--------|-----------|"]
+    for name, entry, values in sections["endpoints"]:
+        lines.append(f"| {name} | `{sparkline(values)}` | {values[-1]:.2f}ms | "
+                     f"{entry['passes'] / entry['runs'] * 100:.0f}% |")
+
+    lines += ["", "## 🚨 Regressions", ""]
+    if sections["regressions"]:
+        lines += ["| Endpoint | First Seen | Latency | Baseline | Status |",
+                  "|----------|------------|---------|----------|--------|"]
+        for regression in sections["regressions"]:
+            status = (f"resolved in {regression['resolved_run_id']}" if regression["resolved_run_id"]
+                      else "🔴 open")
+            lines.append(f"| {regression['endpoint']} | {regression['label']} ({regression['run_id']}) | "
+                         f"{regression['current_ms']:.2f}ms ({regression['slowdown_pct']:+.0f}%) | "
+                         f"{regression['baseline_median_ms']:.2f}ms | {status} |")
+    else:
+        lines.append("No latency regressions detected.")
+    lines += ["", "---", "*Generated by trend_report.py from the result archive*", ""]
+    return "\n".join(lines)
+
+
+def render_html(aggregate: TrendAggregate) -> str:
+    sections = build_sections(aggregate)
+    runs, pass_rates = sections["runs"], sections["pass_rates"]
+    esc = html.escape
+
+    def table(headers, rows):
+        head = "".join(f"<th>{esc(h)}</th>" for h in headers)
+        body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+        return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>RetroRetro Trend Report</title>",
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin-bottom:1.5em}"
+        "td,th{border:1px solid #ddd;padding:4px 8px;text-align:left}th{background:#f3f4f6}</style></head><body>",
+        "<h1>📈 RetroRetro Gaming Platform - Trend Report</h1>",
+        f"<p>Generated {datetime.now().strftime('%Y-%m-%d %H:%M')} - {len(runs)} runs</p>",
+        "<h2>✅ Pass Rate</h2>",
+        f"<p>{svg_sparkline(pass_rates[-SERIES_POINTS:], 320, 40, 0.0, 100.0)}</p>",
+        table(["Run", "Passed", "Pass Rate"],
+              [(esc(_run_label(run)), f"{run['passed']}/{run['total']}", f"{rate:.1f}%")
+               for run, rate in sections["recent_runs"]]),
+        "<h2>🐢 Slowest Endpoints (p95, all runs)</h2>",
+        table(["Endpoint", "p50", "p95", "max", "Samples"],
+              [(esc(name), f"{s['p50']:.2f}ms", f"{s['p95']:.2f}ms", f"{s['max']:.2f}ms", s["count"])
+               for name, s in sections["slowest"]]),
+        "<h2>📉 Latency per Endpoint</h2>",
+        table(["Endpoint", "Trend", "Latest", "Pass Rate"],
+              [(esc(name), svg_sparkline(values), f"{values[-1]:.2f}ms",
+                f"{entry['passes'] / entry['runs'] * 100:.0f}%")
+               for name, entry, values in sections["endpoints"]]),
+        "<h2>🚨 Regressions</h2>",
+    ]
+    if sections["regressions"]:
+        parts.append(table(
+            ["Endpoint", "First Seen", "Latency", "Baseline", "Status"],
+            [(esc(r["endpoint"]), f"{esc(r['label'])} ({esc(r['run_id'])})",
+              f"{r['current_ms']:.2f}ms ({r['slowdown_pct']:+.0f}%)", f"{r['baseline_median_ms']:.2f}ms",
+              f"resolved in {esc(r['resolved_run_id'])}" if r["resolved_run_id"] else "🔴 open")
+             for r in sections["regressions"]]))
+    else:
+        parts.append("<p>No latency regressions detected.</p>")
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def generate_trend_report(results_dir: Path, output_format: str = "md",
+                          output: Optional[Path] = None) -> Path:
+    """Aggregat fortschreiben und Report schreiben; liefert den Pfad"""
+    results_dir = Path(results_dir)
+    archive = ResultArchive(results_dir)
+    # Immer importieren (idempotent je run_id): save_test_results archiviert neue Läufe
+    # ohnehin, ältere JSON-Ergebnisse kämen sonst nach dem ersten Lauf nie mehr dazu
+    runs, rows = archive.import_directory()
+    if runs:
+        print(f"📦 Imported {runs} JSON results into the archive ({rows} rows)")
+
+    aggregate = TrendAggregate(results_dir)
+    new_runs = aggregate.update()
+    print(f"📈 Trend aggregate: {len(aggregate.runs)} runs ({new_runs} new)")
+
+    content = render_html(aggregate) if output_format == "html" else render_markdown(aggregate)
+    output = Path(output) if output else results_dir / f"trend_report.{output_format}"
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(content)
+    print(f"📄 Trend report saved: {output}")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Trend report over all archived test runs')
+    parser.add_argument('--results-dir', default=str(Path(__file__).parent.parent / "docs" / "testing"),
+                        help='Directory with test results and archive (default: docs/testing)')
+    parser.add_argument('--format', choices=['md', 'html'], default='md', help='Report format (default: md)')
+    parser.add_argument('--output', help='Output file (default: <results-dir>/trend_report.<format>)')
+    args = parser.parse_args()
+
+    generate_trend_report(Path(args.results_dir), args.format, Path(args.output) if args.output else None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())